@@ -7,14 +7,20 @@
 # pyright: reportOptionalMemberAccess=false
 
 import abc
+import asyncio
+import contextlib
 import logging
 import math
 import operator
+import os
+import re
 from datetime import datetime
+from io import StringIO
 from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -24,11 +30,19 @@ from typing import (
 
 import comm
 
+from ._vendor.pydantic import ValidationError
 from .access_keys import decode_access_key
 from .data_explorer_comm import (
+    AggregationFunction,
     BackendState,
+    BatchItem,
+    BatchItemError,
+    BatchItemResponse,
+    BatchRequest,
+    ColumnAggregation,
     ColumnDisplayType,
     ColumnFrequencyTable,
+    ColumnFrequencyTableItem,
     ColumnHistogram,
     ColumnProfileResult,
     ColumnProfileType,
@@ -39,6 +53,7 @@ from .data_explorer_comm import (
     ColumnValue,
     CompareFilterParamsOp,
     DataExplorerBackendMessageContent,
+    DataExplorerBackendRequest,
     DataExplorerFrontendEvent,
     DataSelection,
     DataSelectionCellRange,
@@ -48,25 +63,44 @@ from .data_explorer_comm import (
     DataSelectionSingleCell,
     ExportDataSelectionFeatures,
     ExportDataSelectionRequest,
+    ExportDataSelectionToFileRequest,
     ExportedData,
+    ExportedFile,
     ExportFormat,
+    ExportProgressParams,
     FilterResult,
+    FindDirection,
+    FindFeatures,
+    FindParams,
+    FindRequest,
+    FindResult,
+    FindType,
     FormatOptions,
     GetColumnProfilesFeatures,
     GetColumnProfilesRequest,
     GetDataValuesRequest,
     GetSchemaRequest,
     GetStateRequest,
+    GroupByResult,
+    GroupBySpec,
     RowFilter,
     RowFilterCondition,
     RowFilterType,
     RowFilterTypeSupportStatus,
+    SamplingMethod,
+    SamplingParams,
+    SamplingResult,
+    SamplingState,
     SearchFilterType,
     SearchSchemaFeatures,
     SearchSchemaRequest,
     SearchSchemaResult,
+    SetGroupByFeatures,
+    SetGroupByRequest,
     SetRowFiltersFeatures,
     SetRowFiltersRequest,
+    SetSamplingFeatures,
+    SetSamplingRequest,
     SetSortColumnsFeatures,
     SetSortColumnsRequest,
     SummaryStatsBoolean,
@@ -79,21 +113,134 @@ from .data_explorer_comm import (
     TableSchema,
     TableShape,
 )
-from .positron_comm import CommMessage, PositronComm
-from .third_party import np_, pd_, pl_
-from .utils import guid
+from .positron_comm import CommMessage, JsonRpcErrorCode, PositronComm
+from .third_party import np_, pa_, pd_, pl_
+from .utils import create_task, guid
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
     import polars as pl
-
-    # import pyarrow as pa
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
 
 PathKey = Tuple[str, ...]
 StateUpdate = Tuple[bool, List[RowFilter], List[ColumnSortKey]]
+ExportProgressCallback = Callable[[str, int, int], None]
+
+# Exports are rendered in row chunks of roughly this many cells, so
+# that large selections are never copied and rendered all at once.
+# File exports write each chunk as it is rendered
+EXPORT_CHUNK_NUM_CELLS = 1_000_000
+
+# Exports returned to the frontend for the clipboard are accumulated
+# in memory, since they are sent in a single response, so they are
+# capped at this many characters; larger selections must be exported
+# to a file
+MAX_CLIPBOARD_EXPORT_SIZE = 64 * 1024 * 1024
+
+# Object columns longer than this have their type inferred from an
+# evenly spaced sample when the schema is first requested; the full
+# column is scanned later in the background
+INFER_DTYPE_SAMPLE_SIZE = 10_000
+
+# The background scan of an object column infers the types of chunks
+# of this many rows at a time, yielding to the event loop in between
+INFER_DTYPE_CHUNK_SIZE = 200_000
+
+# Find requests scan the view in row chunks, starting with roughly
+# FIND_INITIAL_CHUNK_NUM_CELLS cells so that nearby matches are found
+# quickly, and doubling up to FIND_CHUNK_NUM_CELLS cells
+FIND_INITIAL_CHUNK_NUM_CELLS = 10_000
+FIND_CHUNK_NUM_CELLS = 1_000_000
+
+# Number of rows in a sample when the sampling request does not say
+SAMPLE_NUM_ROWS = 100_000
+
+# Total number of cells of the grouped tables kept per data explorer,
+# so that switching back and forth between groupings or filters does
+# not recompute them
+GROUP_BY_CACHE_NUM_CELLS = 10_000_000
+
+# Number of filter and sort results kept per dataset, so that other
+# explorers on the same variable can reuse them
+SHARED_RESULTS_CACHE_SIZE = 8
+
+# Number of most frequent values reported individually in a frequency
+# table profile; the rest are accounted for in other_count
+FREQUENCY_TABLE_NUM_VALUES = 10
+
+# Formats that are written directly to a file without an intermediate
+# text representation
+_BINARY_EXPORT_FORMATS = {ExportFormat.Parquet, ExportFormat.ArrowIpc}
+
+
+class _RequestError(Exception):
+    """
+    Raised for requests that cannot be fulfilled. The message is
+    forwarded to the frontend as a JSON-RPC error.
+    """
+
+
+class _SharedTableState:
+    """
+    Derived state of a table that is shared by all of the explorers
+    open on the same variable path, so that e.g. a filter or sort
+    applied in one explorer is not recomputed by another applying the
+    same criteria. A new state is created whenever the variable is
+    updated, since its data may have changed in place.
+    """
+
+    def __init__(self, source):
+        # The object registered with the service, before any wrapping
+        self.source = source
+
+        # Column index to types inferred from a full scan of the column
+        self.inferred_dtypes: Dict[int, str] = {}
+
+        # Filters key to (filtered_indices, had_errors, [(is_valid,
+        # error_message) for each filter])
+        self.filter_results: Dict[Tuple[str, ...], Tuple] = {}
+
+        # (filters key, sort keys key) to view_indices
+        self.sort_results: Dict[Tuple, object] = {}
+
+    def get_filtered_indices(self, filters: List[RowFilter], evaluate: Callable):
+        key = _filters_key(filters)
+        cached = self.filter_results.get(key)
+        if cached is None:
+            filtered_indices, had_errors = evaluate(filters)
+            validity = [(filt.is_valid, filt.error_message) for filt in filters]
+            _remember(self.filter_results, key, (filtered_indices, had_errors, validity))
+            return filtered_indices, had_errors
+
+        filtered_indices, had_errors, validity = cached
+        for filt, (is_valid, error_message) in zip(filters, validity):
+            filt.is_valid = is_valid
+            filt.error_message = error_message
+        return filtered_indices, had_errors
+
+    def get_view_indices(
+        self, filters: List[RowFilter], sort_keys: List[ColumnSortKey], sort: Callable
+    ):
+        key = (_filters_key(filters), tuple(key.json() for key in sort_keys))
+        if key not in self.sort_results:
+            _remember(self.sort_results, key, sort())
+        return self.sort_results[key]
+
+
+def _filters_key(filters: List[RowFilter]) -> Tuple[str, ...]:
+    # Filter ids are assigned by each frontend, so they are left out
+    return tuple(filt.json(exclude={"filter_id", "error_message"}) for filt in filters)
+
+
+def _remember(cache: dict, key, value):
+    if len(cache) >= SHARED_RESULTS_CACHE_SIZE:
+        # Evict the least recently computed result
+        del cache[next(iter(cache))]
+    cache[key] = value
 
 
 class DataExplorerTableView(abc.ABC):
@@ -110,12 +257,19 @@ class DataExplorerTableView(abc.ABC):
         table,
         filters: Optional[List[RowFilter]],
         sort_keys: Optional[List[ColumnSortKey]],
+        shared: Optional[_SharedTableState] = None,
     ):
         self.display_name = display_name
 
         # Note: we must not ever modify the user's data
         self.table = table
 
+        # State shared with other explorers on the same variable. It
+        # only applies while serving the table it was created for (and
+        # not e.g. a sample of it)
+        self._shared = shared
+        self._shared_table = table
+
         self.filters = filters if filters is not None else []
         self._set_sort_keys(sort_keys)
 
@@ -133,6 +287,58 @@ class DataExplorerTableView(abc.ABC):
         # self.filtered_indices
         self.view_indices = None
 
+        # When a grouping is set, the grouped table of the filtered
+        # rows serves the schema, data values, profiles, sorting and
+        # exports. Grouped tables are cached by grouping and filters
+        self.group_by: Optional[GroupBySpec] = None
+        self.grouped_view: Optional[DataExplorerTableView] = None
+        self._grouped_views: Dict[Tuple[str, Tuple[str, ...]], DataExplorerTableView] = {}
+
+        # When sampling is set, self.table is the sample and the full
+        # table is kept here until sampling is cleared
+        self.sampling: Optional[SamplingParams] = None
+        self._unsampled_table = None
+
+        # Filtered columns by column index, along with the table and
+        # filtered indices they were taken from, while cached_columns
+        # is active
+        self._column_cache: Optional[Dict[int, Tuple]] = None
+
+    @contextlib.contextmanager
+    def cached_columns(self):
+        """
+        Within this context, each filtered column is materialized at
+        most once for as long as the table and filters are unchanged,
+        e.g. for the requests in a batch
+        """
+        self._column_cache = {}
+        try:
+            yield
+        finally:
+            self._column_cache = None
+
+    def _get_shared_state(self) -> Optional[_SharedTableState]:
+        if self.table is self._shared_table:
+            return self._shared
+        return None
+
+    def _get_column(self, column_index: int):
+        """
+        The column with the current filters (but not sorting) applied
+        """
+        if self._column_cache is None:
+            return self._get_filtered_column(column_index)
+
+        cached = self._column_cache.get(column_index)
+        if cached is None or cached[0] is not self.table or cached[1] is not self.filtered_indices:
+            column = self._get_filtered_column(column_index)
+            cached = (self.table, self.filtered_indices, column)
+            self._column_cache[column_index] = cached
+        return cached[2]
+
+    def _get_filtered_column(self, column_index: int):
+        raise NotImplementedError
+
     def _set_sort_keys(self, sort_keys):
         self.sort_keys = sort_keys if sort_keys is not None else []
 
@@ -153,10 +359,20 @@ class DataExplorerTableView(abc.ABC):
     def _update_view_indices(self):
         if len(self.sort_keys) == 0:
             self.view_indices = self.filtered_indices
-        else:
-            # If we have just applied a new filter, we now resort to
-            # reflect the filtered_indices that have just been updated
+            return
+
+        # If we have just applied a new filter, we now resort to
+        # reflect the filtered_indices that have just been updated
+        shared = self._get_shared_state()
+        if shared is None:
             self._sort_data()
+        else:
+
+            def sort():
+                self._sort_data()
+                return self.view_indices
+
+            self.view_indices = shared.get_view_indices(self.filters, self.sort_keys, sort)
 
     def get_schema(self, request: GetSchemaRequest):
         column_schemas = []
@@ -199,7 +415,26 @@ class DataExplorerTableView(abc.ABC):
             request.params.format,
         ).dict()
 
+    def export_data_selection_to_file(
+        self,
+        request: ExportDataSelectionToFileRequest,
+        progress: Optional[ExportProgressCallback] = None,
+    ):
+        self._recompute_if_needed()
+        return self._export_data_selection_to_file(
+            request.params.selection,
+            request.params.format,
+            request.params.path,
+            progress,
+        ).dict()
+
     def set_row_filters(self, request: SetRowFiltersRequest):
+        if self.group_by is not None:
+            # The grid shows the grouped table, but filters refer to
+            # the columns of the rows being grouped
+            raise _RequestError(
+                "Row filters cannot be changed while the table is grouped, clear the grouping first"
+            )
         return self._set_row_filters(request.params.filters).dict()
 
     def _set_row_filters(self, filters: List[RowFilter]) -> FilterResult:
@@ -214,10 +449,32 @@ class DataExplorerTableView(abc.ABC):
             # Simply reset if empty filter set passed
             self.filtered_indices = None
             self._update_view_indices()
+            self._update_grouped_view()
             return FilterResult(selected_num_rows=len(self.table), had_errors=False)
 
-        # Evaluate all the filters and combine them using the
-        # indicated conditions
+        shared = self._get_shared_state()
+        if shared is None:
+            self.filtered_indices, had_errors = self._eval_filters(filters)
+        else:
+            self.filtered_indices, had_errors = shared.get_filtered_indices(
+                filters, self._eval_filters
+            )
+
+        selected_num_rows = (
+            len(self.table) if self.filtered_indices is None else len(self.filtered_indices)
+        )
+
+        # Update the view indices, re-sorting if needed
+        self._update_view_indices()
+        self._update_grouped_view()
+        return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
+
+    def _eval_filters(self, filters: List[RowFilter]):
+        """
+        Evaluate all the filters and combine them using the indicated
+        conditions, returning the filtered indices and whether any
+        filter failed
+        """
         combined_mask = None
         had_errors = False
         for filt in filters:
@@ -247,14 +504,7 @@ class DataExplorerTableView(abc.ABC):
             elif filt.condition == RowFilterCondition.Or:
                 combined_mask |= single_mask
 
-        self.filtered_indices = self._mask_to_indices(combined_mask)
-        selected_num_rows = (
-            len(self.table) if self.filtered_indices is None else len(self.filtered_indices)
-        )
-
-        # Update the view indices, re-sorting if needed
-        self._update_view_indices()
-        return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
+        return self._mask_to_indices(combined_mask), had_errors
 
     def _mask_to_indices(self, mask):
         raise NotImplementedError
@@ -262,28 +512,259 @@ class DataExplorerTableView(abc.ABC):
     def _eval_filter(self, filt: RowFilter):
         raise NotImplementedError
 
+    def find(self, request: FindRequest):
+        self._recompute_if_needed()
+        return self._find(request.params).dict()
+
+    def _find(self, params: FindParams) -> FindResult:
+        num_rows, num_columns = self._get_view_shape()
+
+        if params.find_type == FindType.Contains:
+            # Contains terms are regular expressions, so check them up
+            # front rather than failing in the middle of the search
+            try:
+                re.compile(params.term)
+            except re.error as e:
+                raise _RequestError(f"Invalid regular expression {params.term!r}: {e}") from e
+
+        column_indices = params.column_indices or range(num_columns)
+        matchers = []
+        for column_index in column_indices:
+            if not 0 <= column_index < num_columns:
+                raise _RequestError(f"Invalid column index: {column_index}")
+            matcher = self._get_find_matcher(column_index, params)
+            if matcher is not None:
+                matchers.append((column_index, matcher))
+
+        if num_rows == 0 or not matchers:
+            return FindResult(found=False)
+
+        # Search from the start row to the end of the view in the
+        # search direction, then the rest of the view when wrapping
+        start = min(max(params.start_index, 0), num_rows - 1)
+        forward = params.direction == FindDirection.Next
+        if forward:
+            segments = [(start, num_rows), (0, start)]
+        else:
+            segments = [(0, start + 1), (start + 1, num_rows)]
+        if not params.wrap:
+            segments = segments[:1]
+
+        for lower, upper in segments:
+            for chunk_start, chunk_end in _find_chunks(lower, upper, forward, len(matchers)):
+                if self.view_indices is not None:
+                    rows = self.view_indices[chunk_start:chunk_end]
+                else:
+                    rows = slice(chunk_start, chunk_end)
+
+                # The nearest match in the chunk, with ties in the same
+                # row going to the column requested first
+                match = None
+                for column_index, matcher in matchers:
+                    positions = np_.flatnonzero(matcher(rows))
+                    if len(positions) == 0:
+                        continue
+                    position = positions[0] if forward else positions[-1]
+                    if match is None or (position < match[0] if forward else position > match[0]):
+                        match = (position, column_index)
+
+                if match is not None:
+                    return FindResult(
+                        found=True,
+                        row_index=chunk_start + int(match[0]),
+                        column_index=match[1],
+                    )
+
+        return FindResult(found=False)
+
+    def _get_find_matcher(
+        self, column_index: int, params: FindParams
+    ) -> Optional[Callable[..., "np.ndarray"]]:
+        """
+        Return a function evaluating a find request on a column for the
+        given rows (a slice or array of table positions) as a boolean
+        numpy array, or None if the column cannot contain a match.
+        Work that does not depend on the rows, like coercing the term,
+        is done once here rather than for every chunk.
+        """
+        raise NotImplementedError
+
     def set_sort_columns(self, request: SetSortColumnsRequest):
         self._set_sort_keys(request.params.sort_keys)
 
         if not self._recompute_if_needed():
             # If a re-filter is pending, then it will automatically
             # trigger a sort
-            self._sort_data()
+            self._update_view_indices()
 
     def _sort_data(self):
         raise NotImplementedError
 
+    def set_group_by(self, request: SetGroupByRequest):
+        spec = GroupBySpec(
+            group_by=request.params.group_by,
+            aggregations=request.params.aggregations,
+        )
+        return self._set_group_by(spec).dict()
+
+    def _set_group_by(self, spec: GroupBySpec) -> GroupByResult:
+        if len(spec.group_by) == 0:
+            self.group_by = None
+            self.grouped_view = None
+            return GroupByResult(num_groups=0)
+
+        num_columns = self.table.shape[1]
+        for column_index in [*spec.group_by, *(agg.column_index for agg in spec.aggregations)]:
+            if not 0 <= column_index < num_columns:
+                raise _RequestError(f"Column index out of range: {column_index}")
+
+        self._recompute_if_needed()
+
+        # Only keep the grouping once the grouped table was computed, so
+        # that a rejected grouping leaves the current one in place
+        grouped_view = self._get_grouped_view(spec)
+        self.group_by = spec
+        self.grouped_view = grouped_view
+        return GroupByResult(num_groups=grouped_view.table.shape[0])
+
+    def _update_grouped_view(self):
+        """
+        Regroup the filtered rows, keeping the grouped table's sort keys
+        """
+        if self.group_by is None:
+            return
+
+        sort_keys = [] if self.grouped_view is None else self.grouped_view.sort_keys
+        grouped_view = self._get_grouped_view(self.group_by)
+        if grouped_view.sort_keys != sort_keys:
+            grouped_view._set_sort_keys(sort_keys)
+            if not grouped_view._recompute_if_needed():
+                grouped_view._update_view_indices()
+
+        self.grouped_view = grouped_view
+
+    def _get_grouped_view(self, spec: GroupBySpec) -> "DataExplorerTableView":
+        key = (spec.json(), tuple(filt.json() for filt in self.filters))
+        grouped_view = self._grouped_views.get(key)
+        if grouped_view is None:
+            grouped = self._group_by(spec.group_by, spec.aggregations)
+            grouped_view = _get_table_view(grouped, name=self.display_name)
+            self._grouped_views[key] = grouped_view
+
+            # Evict the least recently computed grouped tables until
+            # the cache fits, always keeping the new one
+            num_cells = sum(math.prod(view.table.shape) for view in self._grouped_views.values())
+            while num_cells > GROUP_BY_CACHE_NUM_CELLS and len(self._grouped_views) > 1:
+                evicted = self._grouped_views.pop(next(iter(self._grouped_views)))
+                num_cells -= math.prod(evicted.table.shape)
+
+        return grouped_view
+
+    def set_sampling(self, request: SetSamplingRequest):
+        return self._set_sampling(request.params.sampling).dict()
+
+    def _set_sampling(self, params: SamplingParams) -> SamplingResult:
+        table = self._unsampled_table if self._unsampled_table is not None else self.table
+
+        if params.method == SamplingMethod.Full:
+            self.sampling = None
+            self._unsampled_table = None
+        else:
+            positions = self._get_sample_positions(table, params)
+            self.sampling = params
+            self._unsampled_table = table
+            table = self._take_rows(table, positions)
+
+        self._set_table(table)
+
+        # Filters and sorts are re-evaluated right away: this is
+        # cheap on a sample, and expected when promoting to the full
+        # table
+        self._recompute_if_needed()
+        return SamplingResult(num_rows=self.table.shape[0])
+
+    def _get_sample_positions(self, table, params: SamplingParams):
+        num_rows = table.shape[0]
+        sample_size = SAMPLE_NUM_ROWS if params.num_rows is None else params.num_rows
+        if sample_size < 0:
+            raise _RequestError(f"Invalid sample size: {sample_size}")
+        sample_size = min(sample_size, num_rows)
+
+        rng = np_.random.default_rng(params.seed)
+        if params.method == SamplingMethod.Head:
+            return np_.arange(sample_size)
+        elif params.method == SamplingMethod.Uniform:
+            return np_.sort(rng.choice(num_rows, size=sample_size, replace=False))
+        else:
+            column_index = params.column_index
+            if column_index is None or not 0 <= column_index < table.shape[1]:
+                raise _RequestError("Stratified sampling requires a valid column_index")
+            codes = self._factorize(table, column_index)
+            return _stratified_sample_positions(codes, sample_size, rng)
+
+    def _get_sampling_state(self) -> Optional[SamplingState]:
+        if self.sampling is None:
+            return None
+
+        return SamplingState(
+            method=self.sampling.method,
+            num_rows=self.table.shape[0],
+            unsampled_num_rows=self._unsampled_table.shape[0],
+            column_index=self.sampling.column_index,
+        )
+
+    def _set_table(self, table):
+        """
+        Replace the table being served, e.g. with a sample, keeping the
+        filters, sort keys and grouping to be re-evaluated on it
+        """
+        self.table = table
+        self.filtered_indices = None
+        self.view_indices = None
+        self.grouped_view = None
+        self._grouped_views.clear()
+        self._need_recompute = True
+
+    def _take_rows(self, table, positions):
+        raise NotImplementedError
+
+    def _factorize(self, table, column_index: int):
+        """
+        Integer codes (0, 1, ...) identifying the distinct values of a
+        column, with nulls as their own value
+        """
+        raise NotImplementedError
+
+    def _group_by(self, group_by: List[int], aggregations: List[ColumnAggregation]):
+        """
+        Group the filtered rows by the group_by columns, returning a
+        table with the group keys, the number of rows in each group
+        ("count") and a column for each aggregation, sorted by the
+        group keys
+        """
+        raise NotImplementedError
+
     def get_column_profiles(self, request: GetColumnProfilesRequest):
         self._recompute_if_needed()
         results = []
 
+        # Summary statistics for all of the requested columns are
+        # computed together, which some backends can do in one pass
+        summary_stats = self._prof_summary_stats_many(
+            [
+                req.column_index
+                for req in request.params.profiles
+                if req.profile_type == ColumnProfileType.SummaryStats
+            ],
+            request.params.format_options,
+        )
+
         for req in request.params.profiles:
             if req.profile_type == ColumnProfileType.NullCount:
                 count = self._prof_null_count(req.column_index)
                 result = ColumnProfileResult(null_count=int(count))
             elif req.profile_type == ColumnProfileType.SummaryStats:
-                stats = self._prof_summary_stats(req.column_index, request.params.format_options)
-                result = ColumnProfileResult(summary_stats=stats)
+                result = ColumnProfileResult(summary_stats=summary_stats[req.column_index])
             elif req.profile_type == ColumnProfileType.FrequencyTable:
                 freq_table = self._prof_freq_table(req.column_index)
                 result = ColumnProfileResult(frequency_table=freq_table)
@@ -308,6 +789,28 @@ class DataExplorerTableView(abc.ABC):
     def get_updated_state(self, new_table) -> StateUpdate:
         raise NotImplementedError
 
+    def has_provisional_schema(self) -> bool:
+        """
+        Whether some column types were inferred from a sample and are
+        waiting to be confirmed by refine_schema
+        """
+        return False
+
+    def refine_schema(self) -> Iterator[bool]:
+        """
+        Confirm provisional column types with full scans, in steps of
+        at most one column, yielding whether the type of a column
+        changed after each step
+        """
+        return iter(())
+
+    def is_same_table_type(self, new_table) -> bool:
+        """
+        Whether new_table can be handled by get_updated_state, or
+        whether a new view needs to be created from scratch.
+        """
+        return isinstance(new_table, type(self.table))
+
     def _get_adjusted_filters(
         self,
         new_columns,
@@ -418,6 +921,165 @@ class DataExplorerTableView(abc.ABC):
         raise NotImplementedError
 
     def _export_data_selection(self, selection: DataSelection, fmt: ExportFormat) -> ExportedData:
+        if fmt in _BINARY_EXPORT_FORMATS:
+            raise _RequestError(f"Export format {fmt.value} can only be exported to a file")
+
+        sel = selection.selection
+        if selection.kind == DataSelectionKind.SingleCell:
+            assert isinstance(sel, DataSelectionSingleCell)
+            return ExportedData(
+                data=self._export_cell(sel.row_index, sel.column_index),
+                format=fmt,
+            )
+
+        buf = StringIO()
+        size = 0
+        for chunk, _, _ in self._export_tabular(selection, fmt):
+            size += len(chunk)
+            if size > MAX_CLIPBOARD_EXPORT_SIZE:
+                raise _RequestError(
+                    "Selection is too large to copy to the clipboard, export it to a file instead"
+                )
+            buf.write(chunk)
+
+        return ExportedData(data=buf.getvalue(), format=fmt)
+
+    def _export_data_selection_to_file(
+        self,
+        selection: DataSelection,
+        fmt: ExportFormat,
+        path: str,
+        progress: Optional[ExportProgressCallback] = None,
+    ) -> ExportedFile:
+        path = os.path.abspath(os.path.expanduser(path))
+
+        # The selection is written to a temporary file next to the
+        # destination, which replaces the destination only once the
+        # export succeeds, so that a failed export neither leaves a
+        # partial file behind nor clobbers an existing one
+        directory, name = os.path.split(path)
+        temp_path = os.path.join(directory, f".{name}.{guid()}.tmp")
+
+        if fmt in _BINARY_EXPORT_FORMATS:
+            row_selector, column_selector = self._get_selectors(selection)
+            writer = self._export_binary(row_selector, column_selector, fmt, temp_path)
+        else:
+            writer = self._export_text_file(selection, fmt, temp_path)
+
+        num_rows = 0
+        try:
+            for num_rows, total_rows in writer:
+                if progress is not None:
+                    progress(path, num_rows, total_rows)
+            os.replace(temp_path, path)
+        except BaseException as e:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            if isinstance(e, OSError):
+                raise _RequestError(f"Could not write to {path}: {e}") from e
+            raise
+
+        return ExportedFile(path=path, num_rows=num_rows, num_bytes=os.path.getsize(path))
+
+    def _export_text_file(
+        self, selection: DataSelection, fmt: ExportFormat, path: str
+    ) -> Iterator[Tuple[int, int]]:
+        # The chunks already contain the line terminators that we
+        # want, so we disable newline translation
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            for chunk, num_rows, total_rows in self._export_tabular(selection, fmt):
+                f.write(chunk)
+                yield num_rows, total_rows
+
+    def _export_tabular(
+        self, selection: DataSelection, fmt: ExportFormat
+    ) -> Iterator[Tuple[str, int, int]]:
+        """
+        Render a selection in row chunks, yielding tuples of
+        (chunk, rows_written, total_rows). The header, if any, is
+        part of the first chunk.
+        """
+        row_selector, column_selector = self._get_selectors(selection)
+
+        total_rows = len(row_selector)
+        num_columns = len(column_selector)
+
+        if fmt == ExportFormat.Html:
+            # HTML output formats each column as a whole, so it
+            # cannot be rendered in chunks
+            chunk_size = max(total_rows, 1)
+        else:
+            chunk_size = _get_export_chunk_size(num_columns)
+
+        # Always render at least one chunk so that empty selections
+        # still get a header
+        for start in range(0, max(total_rows, 1), chunk_size):
+            end = min(start + chunk_size, total_rows)
+            chunk = self._export_chunk(row_selector[start:end], column_selector, fmt, start == 0)
+            yield chunk, end, total_rows
+
+    def _get_selectors(self, selection: DataSelection):
+        """
+        Returns a pair of (rows, columns) for a selection, where rows
+        are positions in the underlying table (accounting for any
+        filtering and sorting) and columns are column positions. Both
+        are either ranges or sequences of positions.
+        """
+        num_rows, num_columns = self._get_view_shape()
+
+        sel = selection.selection
+        row_selector = range(num_rows)
+        column_selector = range(num_columns)
+        if selection.kind == DataSelectionKind.SingleCell:
+            assert isinstance(sel, DataSelectionSingleCell)
+            row_selector = row_selector[sel.row_index : sel.row_index + 1]
+            column_selector = column_selector[sel.column_index : sel.column_index + 1]
+        elif selection.kind == DataSelectionKind.CellRange:
+            assert isinstance(sel, DataSelectionCellRange)
+            row_selector = row_selector[sel.first_row_index : sel.last_row_index + 1]
+            column_selector = column_selector[sel.first_column_index : sel.last_column_index + 1]
+        elif selection.kind == DataSelectionKind.RowRange:
+            assert isinstance(sel, DataSelectionRange)
+            row_selector = row_selector[sel.first_index : sel.last_index + 1]
+        elif selection.kind == DataSelectionKind.ColumnRange:
+            assert isinstance(sel, DataSelectionRange)
+            column_selector = column_selector[sel.first_index : sel.last_index + 1]
+        elif selection.kind == DataSelectionKind.RowIndices:
+            assert isinstance(sel, DataSelectionIndices)
+            row_selector = sel.indices
+        elif selection.kind == DataSelectionKind.ColumnIndices:
+            assert isinstance(sel, DataSelectionIndices)
+            column_selector = sel.indices
+        else:
+            raise NotImplementedError(f"Unknown data export: {selection.kind}")
+
+        if self.view_indices is not None:
+            if isinstance(row_selector, range):
+                row_selector = self.view_indices[row_selector.start : row_selector.stop]
+            else:
+                row_selector = self.view_indices[row_selector]
+
+        return row_selector, column_selector
+
+    def _get_view_shape(self) -> Tuple[int, int]:
+        num_rows, num_columns = self.table.shape
+        if self.view_indices is not None:
+            num_rows = len(self.view_indices)
+        return num_rows, num_columns
+
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        raise NotImplementedError
+
+    def _export_chunk(self, row_selector, column_selector, fmt: ExportFormat, header: bool) -> str:
+        raise NotImplementedError
+
+    def _export_binary(
+        self, row_selector, column_selector, fmt: ExportFormat, path: str
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Write the selected rows and columns to a file in a binary
+        format, yielding tuples of (rows_written, total_rows).
+        """
         raise NotImplementedError
 
     SUPPORTED_FILTERS = set()
@@ -469,6 +1131,14 @@ class DataExplorerTableView(abc.ABC):
     def _prof_summary_stats(self, column_index: int, options: FormatOptions) -> ColumnSummaryStats:
         raise NotImplementedError
 
+    def _prof_summary_stats_many(
+        self, column_indices: List[int], options: FormatOptions
+    ) -> Dict[int, ColumnSummaryStats]:
+        return {
+            column_index: self._prof_summary_stats(column_index, options)
+            for column_index in column_indices
+        }
+
     def _prof_freq_table(self, column_index: int) -> ColumnFrequencyTable:
         raise NotImplementedError
 
@@ -491,13 +1161,24 @@ class DataExplorerTableView(abc.ABC):
         else:
             table_shape = table_unfiltered_shape
 
+        sort_keys = self.sort_keys
+        if self.grouped_view is not None:
+            # The grid shows the grouped table
+            grouped_table = self.grouped_view.table
+            table_shape = TableShape(
+                num_rows=grouped_table.shape[0], num_columns=grouped_table.shape[1]
+            )
+            sort_keys = self.grouped_view.sort_keys
+
         return BackendState(
             display_name=self.display_name,
             table_shape=table_shape,
             table_unfiltered_shape=table_unfiltered_shape,
             row_filters=self.filters,
-            sort_keys=self.sort_keys,
+            sort_keys=sort_keys,
             supported_features=self.FEATURES,
+            group_by=self.group_by,
+            sampling=self._get_sampling_state(),
         )
 
 
@@ -600,6 +1281,27 @@ def _pandas_datetimetz_mapper(type_name):
         return "datetime"
 
 
+def _pandas_arrow_mapper(type_name):
+    # pd.ArrowDtype names are the pyarrow type name followed by
+    # "[pyarrow]", e.g. "int64[pyarrow]" or "timestamp[us, tz=UTC][pyarrow]"
+    if not type_name.endswith("[pyarrow]"):
+        return None
+
+    arrow_name = type_name[: -len("[pyarrow]")]
+    if arrow_name in ("string", "large_string"):
+        return "string"
+    elif arrow_name == "bool":
+        return "boolean"
+    elif arrow_name.startswith(("int", "uint", "halffloat", "float", "double", "decimal")):
+        return "number"
+    elif arrow_name.startswith("timestamp"):
+        return "datetime"
+    elif arrow_name.startswith("date"):
+        return "date"
+    elif arrow_name.startswith("time"):
+        return "time"
+
+
 class PandasView(DataExplorerTableView):
     TYPE_NAME_MAPPING = {"boolean": "bool"}
 
@@ -609,16 +1311,21 @@ class PandasView(DataExplorerTableView):
         table,
         filters: Optional[List[RowFilter]],
         sort_keys: Optional[List[ColumnSortKey]],
+        shared: Optional[_SharedTableState] = None,
     ):
         table = self._maybe_wrap(table)
 
-        super().__init__(display_name, table, filters, sort_keys)
+        super().__init__(display_name, table, filters, sort_keys, shared)
 
         # Maintain a mapping of column index to inferred dtype for any
         # object columns, to avoid recomputing. If the underlying
         # object is changed, this needs to be reset
         self._inferred_dtypes = {}
 
+        # Columns whose inferred type came from a sample and has not
+        # yet been confirmed by a full scan
+        self._provisional_dtypes: Set[int] = set()
+
         # We store a tuple of (last_search_term, matches)
         # here so that we can support scrolling through the search
         # results without having to recompute the search. If the
@@ -627,6 +1334,20 @@ class PandasView(DataExplorerTableView):
         # performance.
         self._search_schema_last_result: Optional[Tuple[str, List[ColumnSchema]]] = None
 
+        # The types of object columns that filters were carried over
+        # with by get_updated_state come from a sample, so they are
+        # confirmed by refine_schema like those of the schema. Types
+        # already confirmed by another explorer are used right away
+        for filt in self.filters:
+            column_index = filt.column_schema.column_index
+            if column_index >= self.table.shape[1]:
+                continue
+            is_object = self.table.dtypes.iloc[column_index] == object  # noqa: E721
+            if is_object:
+                self._get_inferred_dtype(column_index)
+                if column_index not in self._provisional_dtypes:
+                    self._update_filter_schemas(column_index)
+
         # Putting this here rather than in the class body before
         # Python < 3.10 has fussier rules about staticmethods
         self._SUMMARIZERS = {
@@ -637,6 +1358,15 @@ class PandasView(DataExplorerTableView):
             ColumnDisplayType.Datetime: self._summarize_datetime,
         }
 
+        # Arrow-backed columns are summarized with pyarrow.compute
+        # kernels, which pandas does not implement all of these stats
+        # with for every Arrow type
+        self._ARROW_SUMMARIZERS = {
+            ColumnDisplayType.Number: self._summarize_arrow_number,
+            ColumnDisplayType.Date: self._summarize_arrow_date,
+            ColumnDisplayType.Datetime: self._summarize_arrow_datetime,
+        }
+
     def _maybe_wrap(self, value):
         if isinstance(value, pd_.Series):
             if value.name is None:
@@ -647,8 +1377,6 @@ class PandasView(DataExplorerTableView):
             return value
 
     def get_updated_state(self, new_table) -> StateUpdate:
-        from pandas.api.types import infer_dtype
-
         filtered_columns = {
             filt.column_schema.column_index: filt.column_schema for filt in self.filters
         }
@@ -664,27 +1392,58 @@ class PandasView(DataExplorerTableView):
             # suspected schema changes
             schema_updated = False
 
-        # We go through the columns in the new table and see whether
-        # there is a type change or whether a column name moved.
-        #
-        # TODO: duplicate column names are a can of worms here, and we
-        # will need to return to make this logic robust to that
+        # We compare the old and new columns and dtypes in vectorized
+        # form and only materialize columns involved in a filter, so
+        # that very wide tables do not do O(columns) Python work on
+        # every cell execution. Sort keys carry no column schema, so
+        # we do not need to look at the data for them.
         old_columns = self.table.columns
+        new_columns = new_table.columns
         shifted_columns: Dict[int, int] = {}
         schema_changes: Dict[int, ColumnSchema] = {}
-
-        # First, we look for detectable deleted columns
         deleted_columns: Set[int] = set()
-        if not self.table.columns.equals(new_table.columns):
-            for old_index, column in enumerate(self.table.columns):
-                if column not in new_table.columns:
-                    deleted_columns.add(old_index)
-                    schema_updated = True
+
+        num_new = len(new_columns)
+        if old_columns.equals(new_columns):
+            old_positions = np_.arange(num_new)
+        else:
+            # First, we look for detectable deleted columns
+            is_deleted = ~old_columns.isin(new_columns)
+            if is_deleted.any():
+                deleted_columns.update(np_.flatnonzero(is_deleted).tolist())
+                schema_updated = True
+
+            # Map each new column to its position in the old table,
+            # using a hash lookup on the column names. With duplicate
+            # column names, an unchanged position takes precedence and
+            # otherwise the first occurrence wins
+            is_first = ~old_columns.duplicated(keep="first")
+            first_positions = np_.flatnonzero(is_first)
+            lookup = old_columns[is_first].get_indexer(new_columns)
+            old_positions = np_.where(lookup >= 0, first_positions[lookup], -1)
+
+            num_common = min(num_new, len(old_columns))
+            same_position = np_.zeros(num_new, dtype=bool)
+            same_position[:num_common] = np_.asarray(
+                old_columns[:num_common] == new_columns[:num_common], dtype=bool
+            )
+            old_positions[same_position] = np_.flatnonzero(same_position)
+
+            if (old_positions < 0).any():
+                # New columns
+                schema_updated = True
+
+            is_shifted = ~same_position & (old_positions >= 0)
+            shifted_columns.update(
+                zip(old_positions[is_shifted].tolist(), np_.flatnonzero(is_shifted).tolist())
+            )
 
         def _get_column_schema(column, column_name, column_index):
             # We only use infer_dtype for columns that are involved in
             # a filter
-            type_name, type_display = self._get_type(column.dtype, lambda: infer_dtype(column))
+            type_name, type_display = self._get_type(
+                column.dtype, lambda: _infer_dtype_sampled(column)[0]
+            )
 
             return ColumnSchema(
                 column_name=column_name,
@@ -693,60 +1452,49 @@ class PandasView(DataExplorerTableView):
                 type_display=type_display,
             )
 
-        # When computing the new display type of a column requires
-        # calling infer_dtype, we are careful to only do it for
-        # columns that are involved in a filter
-        for new_index, column_name in enumerate(new_table.columns):
-            # New table has more columns than the old table
-            out_of_bounds = new_index >= len(old_columns)
+        existing = old_positions >= 0
+        new_dtypes = new_table.dtypes.to_numpy()
+
+        # For object dtype columns, we refuse to make any assumptions
+        # about whether the data type has changed and will let
+        # re-filtering fail later if there is a problem
+        maybe_changed = new_dtypes == np_.dtype(object)
+        if new_table is not self.table:
+            # While we must proceed under the conservative possibility
+            # that the table was modified in place, if the tables are
+            # indeed different we can check for schema changes more
+            # confidently
+            old_dtypes = self.table.dtypes.to_numpy()
+            maybe_changed[existing] |= new_dtypes[existing] != old_dtypes[old_positions[existing]]
+        else:
+            maybe_changed[:] = True
 
-            if out_of_bounds or old_columns[new_index] != column_name:
-                if column_name not in old_columns:
-                    # New column
-                    schema_updated = True
-                    continue
-                # Column was shifted
-                old_index = old_columns.get_loc(column_name)
-                shifted_columns[old_index] = new_index
-            else:
-                old_index = new_index
+        if (maybe_changed & existing).any():
+            schema_updated = True
 
-            new_column = new_table.iloc[:, new_index]
+        for old_index, filter_schema in filtered_columns.items():
+            new_indices = np_.flatnonzero(old_positions == old_index)
+            if len(new_indices) == 0:
+                continue
 
-            # For object dtype columns, we refuse to make any
-            # assumptions about whether the data type has changed
-            # and will let re-filtering fail later if there is a
-            # problem
-            if new_column.dtype == object:
-                # The inferred type could be different
-                schema_updated = True
-            elif new_table is not self.table:
-                # While we must proceed under the conservative
-                # possibility that the table was modified in place, if
-                # the tables are indeed different we can check for
-                # schema changes more confidently
-                old_dtype = self.table.iloc[:, old_index].dtype
-                if new_column.dtype == old_dtype:
-                    # Type is the same and not object dtype
-                    continue
-            elif old_index in filtered_columns:
+            new_index = int(new_indices[-1])
+            if not maybe_changed[new_index]:
+                continue
+
+            new_dtype = new_dtypes[new_index]
+            if (
+                new_table is self.table
+                and new_dtype != object  # noqa: E721
+                and filter_schema.type_name == str(new_dtype)
+            ):
                 # If it was an in place modification, as a last ditch
                 # effort we check if we remember the data type because
                 # of a prior filter
-                if filtered_columns[old_index].type_name == str(new_column.dtype):
-                    # Type is the same and not object dtype
-                    continue
-
-            # The type maybe changed
-            schema_updated = True
-
-            if old_index not in filtered_columns:
-                # This column index did not have a row filter
-                # attached to it, so doing further analysis is
-                # unnecessary
                 continue
 
-            schema_changes[old_index] = _get_column_schema(new_column, str(column_name), new_index)
+            schema_changes[old_index] = _get_column_schema(
+                new_table.iloc[:, new_index], str(new_columns[new_index]), new_index
+            )
 
         def schema_getter(column_name, column_index):
             return _get_column_schema(new_table.iloc[:, column_index], column_name, column_index)
@@ -802,12 +1550,83 @@ class PandasView(DataExplorerTableView):
         return matches
 
     def _get_inferred_dtype(self, column_index: int):
-        from pandas.api.types import infer_dtype
-
         if column_index not in self._inferred_dtypes:
-            self._inferred_dtypes[column_index] = infer_dtype(self.table.iloc[:, column_index])
+            shared = self._get_shared_state()
+            if shared is not None and column_index in shared.inferred_dtypes:
+                inferred_type, is_provisional = shared.inferred_dtypes[column_index], False
+            else:
+                inferred_type, is_provisional = _infer_dtype_sampled(
+                    self.table.iloc[:, column_index]
+                )
+                if shared is not None and not is_provisional:
+                    shared.inferred_dtypes[column_index] = inferred_type
+            self._inferred_dtypes[column_index] = inferred_type
+            if is_provisional:
+                self._provisional_dtypes.add(column_index)
         return self._inferred_dtypes[column_index]
 
+    def has_provisional_schema(self) -> bool:
+        return len(self._provisional_dtypes) > 0
+
+    def refine_schema(self) -> Iterator[bool]:
+        table = self.table
+        shared = self._get_shared_state()
+        while self._provisional_dtypes:
+            column_index = self._provisional_dtypes.pop()
+            if shared is not None and column_index in shared.inferred_dtypes:
+                # Already scanned for another explorer
+                inferred_type = shared.inferred_dtypes[column_index]
+            else:
+                for inferred_type in _infer_dtype_chunked(table.iloc[:, column_index]):
+                    if inferred_type is None:
+                        yield False
+                        if self.table is not table:
+                            # The types were reset, e.g. by sampling
+                            return
+                assert inferred_type is not None
+                if shared is not None:
+                    shared.inferred_dtypes[column_index] = inferred_type
+            is_changed = inferred_type != self._inferred_dtypes[column_index]
+            self._inferred_dtypes[column_index] = inferred_type
+            if is_changed:
+                self._search_schema_last_result = None
+                if self._update_filter_schemas(column_index) and not self._need_recompute:
+                    # Filters on the column may have become (in)valid
+                    self._set_row_filters(self.filters)
+            yield is_changed
+
+    def _update_filter_schemas(self, column_index: int) -> bool:
+        """
+        Update the column type of the filters on a column whose type
+        was inferred anew, returning whether any filter changed
+        """
+        column_name = str(self.table.columns[column_index])
+        schema = None
+        is_changed = False
+        for filt in self.filters:
+            if (
+                filt.column_schema.column_index != column_index
+                # e.g. filters on a deleted column
+                or filt.column_schema.column_name != column_name
+            ):
+                continue
+
+            if schema is None:
+                schema = self._get_single_column_schema(column_index)
+            if (filt.column_schema.type_name, filt.column_schema.type_display) == (
+                schema.type_name,
+                schema.type_display,
+            ):
+                continue
+
+            filt.column_schema.type_name = schema.type_name
+            filt.column_schema.type_display = schema.type_display
+            filt.is_valid = self._is_supported_filter(filt)
+            filt.error_message = None if filt.is_valid else "Unsupported column type for filter"
+            is_changed = True
+
+        return is_changed
+
     @classmethod
     def _get_type(cls, dtype, get_inferred_dtype):
         # A helper function for returning the backend type_name and
@@ -823,6 +1642,11 @@ class PandasView(DataExplorerTableView):
             # TODO: more sophisticated type mapping
             type_name = str(dtype)
 
+        if isinstance(dtype, pd_.CategoricalDtype) and _is_string_categories(dtype):
+            # Categoricals of strings can be filtered, searched and
+            # summarized like strings, using the categorical fast paths
+            return type_name, ColumnDisplayType.String
+
         type_display = cls._get_type_display(type_name)
         return type_name, type_display
 
@@ -860,7 +1684,7 @@ class PandasView(DataExplorerTableView):
         "string": "string",
     }
 
-    TYPE_MAPPERS = [_pandas_datetimetz_mapper]
+    TYPE_MAPPERS = [_pandas_datetimetz_mapper, _pandas_arrow_mapper]
 
     @classmethod
     def _get_type_display(cls, type_name):
@@ -943,6 +1767,12 @@ class PandasView(DataExplorerTableView):
         NA = pd_.NA
         float_format = _get_float_formatter(options)
 
+        arrow_values = _get_arrow_array(values)
+        if arrow_values is not None and _is_arrow_scalar_type(arrow_values.type):
+            # Converting the whole chunked array at once is much faster
+            # than iterating over the pandas extension array
+            values = [NA if x is None else x for x in arrow_values.to_pylist()]
+
         def _format_value(x):
             if _is_float_scalar(x):
                 if _isnan(x):
@@ -962,70 +1792,73 @@ class PandasView(DataExplorerTableView):
 
         return [_format_value(x) for x in values]
 
-    def _export_data_selection(self, selection: DataSelection, fmt: ExportFormat) -> ExportedData:
-        sel = selection.selection
-        if selection.kind == DataSelectionKind.SingleCell:
-            assert isinstance(sel, DataSelectionSingleCell)
-            row_index = sel.row_index
-            if self.view_indices is not None:
-                row_index = self.view_indices[row_index]
-            cell = str(self.table.iat[row_index, sel.column_index])
-            return ExportedData(data=cell, format=fmt)
-        elif selection.kind == DataSelectionKind.CellRange:
-            assert isinstance(sel, DataSelectionCellRange)
-            return self._export_tabular(
-                slice(sel.first_row_index, sel.last_row_index + 1),
-                slice(sel.first_column_index, sel.last_column_index + 1),
-                fmt,
-            )
-        elif selection.kind == DataSelectionKind.RowRange:
-            assert isinstance(sel, DataSelectionRange)
-            return self._export_tabular(
-                slice(sel.first_index, sel.last_index + 1),
-                None,
-                fmt,
-            )
-        elif selection.kind == DataSelectionKind.ColumnRange:
-            assert isinstance(sel, DataSelectionRange)
-            return self._export_tabular(
-                None,
-                slice(sel.first_index, sel.last_index + 1),
-                fmt,
-            )
-        elif selection.kind == DataSelectionKind.RowIndices:
-            assert isinstance(sel, DataSelectionIndices)
-            return self._export_tabular(sel.indices, None, fmt)
-        elif selection.kind == DataSelectionKind.ColumnIndices:
-            assert isinstance(sel, DataSelectionIndices)
-            return self._export_tabular(None, sel.indices, fmt)
-        else:
-            raise NotImplementedError(f"Unknown data export: {selection.kind}")
-
-    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat) -> ExportedData:
-        from io import StringIO
-
-        if row_selector is None:
-            row_selector = slice(None)
-
-        if column_selector is None:
-            column_selector = slice(None)
-
+    def _export_cell(self, row_index: int, column_index: int) -> str:
         if self.view_indices is not None:
-            row_selector = self.view_indices[row_selector]
+            row_index = self.view_indices[row_index]
+        return str(self.table.iat[row_index, column_index])
 
-        to_export = self.table.iloc[row_selector, column_selector]
-        buf = StringIO()
+    def _export_chunk(self, row_selector, column_selector, fmt: ExportFormat, header: bool) -> str:
+        to_export = self.table.iloc[_range_to_slice(row_selector), _range_to_slice(column_selector)]
 
         if fmt == ExportFormat.Csv:
-            to_export.to_csv(buf, index=False)
+            return to_export.to_csv(index=False, header=header)
         elif fmt == ExportFormat.Tsv:
-            to_export.to_csv(buf, sep="\t", index=False)
+            return to_export.to_csv(sep="\t", index=False, header=header)
         elif fmt == ExportFormat.Html:
-            to_export.to_html(buf, index=False)
+            return to_export.to_html(index=False, header=header)
         else:
             raise NotImplementedError(f"Unsupported export format {fmt}")
 
-        return ExportedData(data=buf.getvalue(), format=fmt)
+    def _export_binary(
+        self, row_selector, column_selector, fmt: ExportFormat, path: str
+    ) -> Iterator[Tuple[int, int]]:
+        if pa_ is None:
+            raise _RequestError(f"pyarrow must be installed to export to {fmt.value}")
+
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        total_rows = len(row_selector)
+        chunk_size = _get_export_chunk_size(len(column_selector))
+
+        schema = None
+        writer = None
+        try:
+            for start in range(0, max(total_rows, 1), chunk_size):
+                end = min(start + chunk_size, total_rows)
+                chunk = self.table.iloc[
+                    _range_to_slice(row_selector[start:end]), _range_to_slice(column_selector)
+                ]
+
+                if writer is None:
+                    schema = self._get_export_schema(chunk, row_selector, column_selector)
+                    if fmt == ExportFormat.Parquet:
+                        writer = pyarrow.parquet.ParquetWriter(path, schema)
+                    else:
+                        writer = pyarrow.ipc.new_file(path, schema)
+
+                writer.write_table(
+                    pa_.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                )
+                yield end, total_rows
+        except pa_.ArrowException as e:
+            raise _RequestError(f"Could not export selection to {fmt.value}: {e}") from e
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _get_export_schema(self, first_chunk, row_selector, column_selector):
+        schema = pa_.Schema.from_pandas(first_chunk, preserve_index=False)
+
+        # Object columns that are all null in the first chunk need to
+        # have their type inferred from the whole selection, so that
+        # later chunks can be converted to the same schema
+        for i, field in enumerate(schema):
+            if pa_.types.is_null(field.type):
+                values = self.table.iloc[_range_to_slice(row_selector), column_selector[i]]
+                schema = schema.set(i, field.with_type(pa_.infer_type(values, from_pandas=True)))
+
+        return schema
 
     def _mask_to_indices(self, mask):
         if mask is not None:
@@ -1036,6 +1869,20 @@ class PandasView(DataExplorerTableView):
         col = self.table.iloc[:, column_index]
 
         dtype = col.dtype
+        if isinstance(dtype, pd_.CategoricalDtype):
+            # Evaluate against the (usually few) categories and expand
+            # the result through the codes rather than touching every
+            # value
+            mask = self._eval_categorical_filter(col, filt)
+            if mask is not None:
+                return mask
+
+        arrow_values = _get_arrow_array(col)
+        if arrow_values is not None:
+            mask = self._eval_arrow_filter(arrow_values, filt)
+            if mask is not None:
+                return mask
+
         inferred_type = self._get_inferred_dtype(column_index)
 
         mask = None
@@ -1091,20 +1938,7 @@ class PandasView(DataExplorerTableView):
             if inferred_type != "string":
                 col = col.astype(str)
 
-            term = params.term
-
-            if params.search_type == SearchFilterType.RegexMatch:
-                mask = col.str.match(term, case=params.case_sensitive)
-            else:
-                if not params.case_sensitive:
-                    col = col.str.lower()
-                    term = term.lower()
-                if params.search_type == SearchFilterType.Contains:
-                    mask = col.str.contains(term)
-                elif params.search_type == SearchFilterType.StartsWith:
-                    mask = col.str.startswith(term)
-                elif params.search_type == SearchFilterType.EndsWith:
-                    mask = col.str.endswith(term)
+            mask = _pandas_search_mask(col, params.search_type, params.term, params.case_sensitive)
 
         assert mask is not None
 
@@ -1115,6 +1949,168 @@ class PandasView(DataExplorerTableView):
 
         return mask.to_numpy()
 
+    def _eval_categorical_filter(self, col: "pd.Series", filt: RowFilter):
+        """
+        Evaluate a filter on a categorical column using its codes.
+
+        Returns None for filters without a fast path (e.g. range
+        comparisons, which pandas already evaluates on the codes for
+        ordered categoricals) so the caller can fall back on the
+        generic implementation.
+        """
+        from pandas.api.types import infer_dtype
+
+        categories = col.cat.categories
+        codes = col.cat.codes.to_numpy()
+
+        def _category_codes(values):
+            inferred_type = infer_dtype(categories)
+            result = []
+            for value in values:
+                try:
+                    value = self._coerce_value(value, categories.dtype, inferred_type)
+                except (TypeError, ValueError):
+                    # Values that cannot be coerced cannot match any category
+                    continue
+                code = categories.get_indexer([value])[0]
+                if code != -1:
+                    result.append(code)
+            return result
+
+        if filt.filter_type == RowFilterType.IsNull:
+            return codes == -1
+        elif filt.filter_type == RowFilterType.NotNull:
+            return codes != -1
+        elif filt.filter_type in (RowFilterType.IsEmpty, RowFilterType.NotEmpty):
+            category_mask = pd_.Series(categories).astype(str).str.len().to_numpy() == 0
+            if filt.filter_type == RowFilterType.IsEmpty:
+                return _expand_category_mask(category_mask, codes, null_value=False)
+            # Consistent with the generic path, nulls are not empty
+            return _expand_category_mask(~category_mask, codes, null_value=True)
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.set_membership_params
+            assert params is not None
+            category_mask = np_.zeros(len(categories), dtype=bool)
+            category_mask[_category_codes(params.values)] = True
+            if not params.inclusive:
+                return _expand_category_mask(~category_mask, codes, null_value=True)
+            return _expand_category_mask(category_mask, codes, null_value=False)
+        elif filt.filter_type == RowFilterType.Compare:
+            params = filt.compare_params
+            assert params is not None
+            if params.op not in (CompareFilterParamsOp.Eq, CompareFilterParamsOp.NotEq):
+                return None
+            matched = _category_codes([params.value])
+            # -2 never occurs in the codes, so it matches nothing
+            code = matched[0] if matched else -2
+            if params.op == CompareFilterParamsOp.Eq:
+                return codes == code
+            # As with pandas, nulls are != to any value
+            return codes != code
+        elif filt.filter_type == RowFilterType.Search:
+            params = filt.search_params
+            assert params is not None
+            category_mask = _pandas_search_mask(
+                pd_.Series(categories).astype(str),
+                params.search_type,
+                params.term,
+                params.case_sensitive,
+            )
+            return _expand_category_mask(category_mask.to_numpy(dtype=bool), codes)
+
+        return None
+
+    @staticmethod
+    def _eval_arrow_filter(values: "pa.ChunkedArray", filt: RowFilter):
+        """
+        Evaluate a filter on the chunked array backing an Arrow-backed
+        column with pyarrow.compute kernels.
+
+        Returns None for filters that pandas already evaluates with
+        pyarrow.compute (comparisons and set membership) so the caller
+        can fall back on the generic implementation.
+        """
+        import pyarrow.compute as pc
+
+        is_string = pa_.types.is_string(values.type) or pa_.types.is_large_string(values.type)
+
+        if filt.filter_type == RowFilterType.IsNull:
+            mask = pc.is_null(values)
+        elif filt.filter_type == RowFilterType.NotNull:
+            mask = pc.is_valid(values)
+        elif filt.filter_type in (RowFilterType.IsEmpty, RowFilterType.NotEmpty) and is_string:
+            lengths = pc.utf8_length(values)
+            if filt.filter_type == RowFilterType.IsEmpty:
+                mask = pc.equal(lengths, 0)
+            else:
+                mask = pc.not_equal(lengths, 0)
+        elif filt.filter_type == RowFilterType.Search and is_string:
+            params = filt.search_params
+            assert params is not None
+            mask = _arrow_search_mask(
+                values, params.search_type, params.term, params.case_sensitive
+            )
+        else:
+            return None
+
+        return pc.fill_null(mask, False).to_numpy()
+
+    def _get_find_matcher(self, column_index: int, params: FindParams):
+        col = self.table.iloc[:, column_index]
+        dtype = col.dtype
+        term = params.term
+
+        if isinstance(dtype, pd_.CategoricalDtype):
+            # Match the categories once, then look up each chunk's codes
+            categories = pd_.Series(col.cat.categories).astype(str)
+            category_mask = _pandas_find_mask(categories, params).to_numpy(dtype=bool)
+            codes = col.cat.codes.to_numpy()
+            return lambda rows: _expand_category_mask(category_mask, codes[rows])
+
+        arrow_values = _get_arrow_array(col)
+        if arrow_values is not None and (
+            pa_.types.is_string(arrow_values.type) or pa_.types.is_large_string(arrow_values.type)
+        ):
+            import pyarrow.compute as pc
+
+            def arrow_matcher(rows):
+                if isinstance(rows, slice):
+                    values = arrow_values[rows]
+                else:
+                    values = arrow_values.take(rows)
+                try:
+                    mask = _arrow_find_mask(values, params)
+                except pa_.ArrowInvalid as e:
+                    # Arrow's regular expression syntax is more limited
+                    # than Python's
+                    raise _RequestError(f"Invalid regular expression {term!r}: {e}") from e
+                return pc.fill_null(mask, False).to_numpy()
+
+            return arrow_matcher
+
+        inferred_type = self._get_inferred_dtype(column_index)
+        is_object = dtype == object  # noqa: E721
+        if params.find_type == FindType.Equals and inferred_type != "string" and not is_object:
+            # Compare values rather than their formatted text, so that
+            # e.g. "5" finds 5.0
+            try:
+                value = self._coerce_value(term, dtype, inferred_type)
+            except (TypeError, ValueError):
+                # A term that cannot be coerced cannot match
+                return None
+            if isinstance(dtype, np_.dtype):
+                values = col.to_numpy()
+                return lambda rows: values[rows] == value
+            return lambda rows: (col.iloc[rows] == value).to_numpy(dtype=bool, na_value=False)
+
+        def string_matcher(rows):
+            values = col.iloc[rows]
+            if inferred_type != "string":
+                values = values.astype(str)
+            return _pandas_find_mask(values, params).to_numpy(dtype=bool, na_value=False)
+
+        return string_matcher
+
     @staticmethod
     def _coerce_value(value, dtype, inferred_type):
         import pandas.api.types as pat
@@ -1138,7 +2134,7 @@ class PandasView(DataExplorerTableView):
             else:
                 raise ValueError(f"Unable to convert {value} to boolean")
         elif "datetime" in inferred_type:
-            return _parse_iso8601_like(value, tz=getattr(dtype, "tz", None))
+            return _parse_iso8601_like(value, tz=_get_dtype_tz(dtype))
         else:
             # As a fallback, let Series.astype do the coercion
             dummy = pd_.Series([value])
@@ -1188,14 +2184,78 @@ class PandasView(DataExplorerTableView):
             # This will be None if the data is unfiltered
             self.view_indices = self.filtered_indices
 
-    def _get_column(self, column_index: int) -> "pd.Series":
+    def _get_filtered_column(self, column_index: int) -> "pd.Series":
         column = self.table.iloc[:, column_index]
         if self.filtered_indices is not None:
             column = column.take(self.filtered_indices)
         return column
 
+    def _set_table(self, table):
+        super()._set_table(table)
+        self._inferred_dtypes = {}
+        self._provisional_dtypes.clear()
+        self._search_schema_last_result = None
+
+    def _take_rows(self, table, positions):
+        return table.take(positions)
+
+    def _factorize(self, table, column_index: int):
+        codes, _ = pd_.factorize(table.iloc[:, column_index], use_na_sentinel=False)
+        return codes
+
+    _AGGREGATIONS = {
+        AggregationFunction.Count: "count",
+        AggregationFunction.Sum: "sum",
+        AggregationFunction.Mean: "mean",
+        AggregationFunction.Median: "median",
+        AggregationFunction.Min: "min",
+        AggregationFunction.Max: "max",
+        AggregationFunction.Stdev: "std",
+        AggregationFunction.NumUnique: "nunique",
+    }
+
+    def _group_by(self, group_by: List[int], aggregations: List[ColumnAggregation]):
+        # Only the columns involved are selected (and filtered), and
+        # they are relabeled by position so that duplicate or
+        # non-string column names cannot get in the way
+        column_indices = list(dict.fromkeys([*group_by, *(x.column_index for x in aggregations)]))
+        positions = {column_index: i for i, column_index in enumerate(column_indices)}
+        subset = self.table.iloc[:, column_indices]
+        if self.filtered_indices is not None:
+            subset = subset.take(self.filtered_indices)
+        subset = subset.set_axis(range(len(column_indices)), axis=1)
+
+        grouped = subset.groupby(
+            [positions[i] for i in group_by], sort=True, dropna=False, observed=True
+        )
+
+        names = ["count"]
+        results = [grouped.size()]
+        for agg in aggregations:
+            column_name = self.table.columns[agg.column_index]
+            try:
+                result = grouped[positions[agg.column_index]].agg(self._AGGREGATIONS[agg.function])
+            except TypeError as e:
+                raise _RequestError(
+                    f"Cannot compute {agg.function.value} of column {column_name}: {e}"
+                ) from e
+            names.append(f"{column_name}_{agg.function.value}")
+            results.append(result)
+
+        table = pd_.concat(results, axis=1, keys=range(len(results)))
+        table.columns = names
+        table.index = table.index.set_names([self.table.columns[i] for i in group_by])
+        return table.reset_index(allow_duplicates=True)
+
     def _prof_null_count(self, column_index: int):
-        return self._get_column(column_index).isnull().sum()
+        col = self._get_column(column_index)
+        if isinstance(col.dtype, pd_.CategoricalDtype):
+            return (col.cat.codes.to_numpy() == -1).sum()
+
+        arrow_values = _get_arrow_array(col)
+        if arrow_values is not None:
+            return arrow_values.null_count
+        return col.isnull().sum()
 
     def _prof_summary_stats(self, column_index: int, options: FormatOptions):
         col_schema = self._get_single_column_schema(column_index)
@@ -1204,6 +2264,10 @@ class PandasView(DataExplorerTableView):
         ui_type = col_schema.type_display
         handler = self._SUMMARIZERS.get(ui_type)
 
+        arrow_values = _get_arrow_array(col)
+        if arrow_values is not None and ui_type in self._ARROW_SUMMARIZERS:
+            return self._ARROW_SUMMARIZERS[ui_type](arrow_values, options)
+
         if handler is None:
             # Return nothing for types we don't yet know how to summarize
             return ColumnSummaryStats(type_display=ui_type)
@@ -1234,9 +2298,46 @@ class PandasView(DataExplorerTableView):
                 median_val = float_format(col.median())
                 std_val = float_format(col.std())
 
-            # Format the min/max
-            min_val = float_format(min_val)
-            max_val = float_format(max_val)
+            # Format the min/max
+            min_val = float_format(min_val)
+            max_val = float_format(max_val)
+
+        return ColumnSummaryStats(
+            type_display=ColumnDisplayType.Number,
+            number_stats=SummaryStatsNumber(
+                min_value=min_val,
+                max_value=max_val,
+                mean=mean_val,
+                median=median_val,
+                stdev=std_val,
+            ),
+        )
+
+    @staticmethod
+    def _summarize_arrow_number(values: "pa.ChunkedArray", options: FormatOptions):
+        import pyarrow.compute as pc
+
+        float_format = _get_float_formatter(options)
+
+        min_val = max_val = median_val = mean_val = std_val = None
+
+        min_max = pc.min_max(values)
+        if min_max["min"].is_valid:
+            # Decimals are summarized as floats, like pandas does for
+            # object columns of Decimal values
+            min_float = float(min_max["min"].as_py())
+            max_float = float(min_max["max"].as_py())
+            min_val = float_format(min_float)
+            max_val = float_format(max_float)
+
+            if not math.isinf(min_float) and not math.isinf(max_float):
+                # These stats are not defined when there is an
+                # inf/-inf in the data
+                floats = values.cast(pa_.float64())
+                mean_val = float_format(pc.mean(floats).as_py())
+                median_val = float_format(pc.approximate_median(floats).as_py())
+                std = pc.stddev(floats, ddof=1).as_py()
+                std_val = None if std is None else float_format(std)
 
         return ColumnSummaryStats(
             type_display=ColumnDisplayType.Number,
@@ -1249,10 +2350,68 @@ class PandasView(DataExplorerTableView):
             ),
         )
 
+    @staticmethod
+    def _summarize_arrow_date(values: "pa.ChunkedArray", options: FormatOptions):
+        import pyarrow.compute as pc
+
+        stats = _arrow_temporal_stats(values)
+
+        def format_date(x):
+            # Missing for all-null columns, like pandas' NaT
+            return str(pd_.NaT) if x is None else x.strftime("%Y-%m-%d")
+
+        min_date, mean_date, median_date, max_date = (format_date(x) for x in stats.to_pylist())
+        return ColumnSummaryStats(
+            type_display=ColumnDisplayType.Date,
+            date_stats=SummaryStatsDate(
+                num_unique=pc.count_distinct(values).as_py(),
+                min_date=min_date,
+                mean_date=mean_date,
+                median_date=median_date,
+                max_date=max_date,
+            ),
+        )
+
+    @staticmethod
+    def _summarize_arrow_datetime(values: "pa.ChunkedArray", options: FormatOptions):
+        import pyarrow.compute as pc
+
+        # Format the values as the pandas Timestamps that the column
+        # yields, e.g. with nanoseconds
+        stats = pd_.Series(_arrow_temporal_stats(values), dtype=pd_.ArrowDtype(values.type))
+        min_date, mean_date, median_date, max_date = (
+            str(pd_.NaT) if pd_.isna(x) else str(x) for x in stats
+        )
+        return ColumnSummaryStats(
+            type_display=ColumnDisplayType.Datetime,
+            datetime_stats=SummaryStatsDatetime(
+                num_unique=pc.count_distinct(values).as_py(),
+                min_date=min_date,
+                mean_date=mean_date,
+                median_date=median_date,
+                max_date=max_date,
+                timezone=str(values.type.tz),
+            ),
+        )
+
     @staticmethod
     def _summarize_string(col: "pd.Series", options: FormatOptions):
-        num_empty = (col.str.len() == 0).sum()
-        num_unique = col.nunique()
+        arrow_values = _get_arrow_array(col)
+        if isinstance(col.dtype, pd_.CategoricalDtype):
+            categories = col.cat.categories
+            counts = _category_counts(col)
+            is_empty = categories.str.len().to_numpy() == 0
+            num_empty = counts[is_empty].sum()
+            num_unique = np_.count_nonzero(counts)
+        elif arrow_values is not None:
+            import pyarrow.compute as pc
+
+            values = arrow_values
+            num_empty = pc.sum(pc.equal(pc.utf8_length(values), 0)).as_py() or 0
+            num_unique = pc.count_distinct(values, mode="only_valid").as_py()
+        else:
+            num_empty = (col.str.len() == 0).sum()
+            num_unique = col.nunique()
 
         return ColumnSummaryStats(
             type_display=ColumnDisplayType.String,
@@ -1335,7 +2494,29 @@ class PandasView(DataExplorerTableView):
         )
 
     def _prof_freq_table(self, column_index: int):
-        raise NotImplementedError
+        col = self._get_column(column_index)
+
+        if isinstance(col.dtype, pd_.CategoricalDtype):
+            categories = col.cat.categories
+            counts = _category_counts(col)
+            # Stable so that ties are reported in category order
+            order = np_.argsort(-counts, kind="stable")
+            values = categories.take(order)
+            counts = counts.take(order)
+            nonzero = counts > 0
+            values, counts = values[nonzero], counts[nonzero]
+        else:
+            value_counts = col.value_counts(dropna=True)
+            values, counts = value_counts.index, value_counts.to_numpy()
+
+        num_values = FREQUENCY_TABLE_NUM_VALUES
+        return ColumnFrequencyTable(
+            counts=[
+                ColumnFrequencyTableItem(value=str(value), count=int(count))
+                for value, count in zip(values[:num_values], counts[:num_values])
+            ],
+            other_count=int(counts[num_values:].sum()),
+        )
 
     def _prof_histogram(self, column_index: int):
         raise NotImplementedError
@@ -1383,10 +2564,27 @@ class PandasView(DataExplorerTableView):
                     profile_type=ColumnProfileType.SummaryStats,
                     support_status=SupportStatus.Experimental,
                 ),
+                ColumnProfileTypeSupportStatus(
+                    profile_type=ColumnProfileType.FrequencyTable,
+                    support_status=SupportStatus.Experimental,
+                ),
             ],
         ),
         set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
-        export_data_selection=ExportDataSelectionFeatures(support_status=SupportStatus.Supported),
+        set_group_by=SetGroupByFeatures(
+            support_status=SupportStatus.Supported,
+            supported_functions=list(AggregationFunction),
+        ),
+        set_sampling=SetSamplingFeatures(
+            support_status=SupportStatus.Supported,
+            supported_methods=list(SamplingMethod),
+        ),
+        find=FindFeatures(support_status=SupportStatus.Supported),
+        export_data_selection=ExportDataSelectionFeatures(
+            support_status=SupportStatus.Supported,
+            supported_formats=[ExportFormat.Csv, ExportFormat.Tsv, ExportFormat.Html]
+            + ([ExportFormat.Parquet, ExportFormat.ArrowIpc] if pa_ is not None else []),
+        ),
     )
 
 
@@ -1400,6 +2598,218 @@ COMPARE_OPS = {
 }
 
 
+def _get_arrow_array(col: "pd.Series") -> "Optional[pa.ChunkedArray]":
+    """
+    Return the pyarrow chunked array backing an Arrow-backed pandas
+    series (pd.ArrowDtype or string[pyarrow]) without copying, or None
+    for other series
+    """
+    if pa_ is None:
+        return None
+
+    dtype = col.dtype
+    if isinstance(dtype, pd_.StringDtype):
+        if not dtype.storage.startswith("pyarrow"):
+            return None
+    elif not isinstance(dtype, getattr(pd_, "ArrowDtype", ())):
+        return None
+
+    return col.array.__arrow_array__()
+
+
+def _arrow_temporal_stats(values: "pa.ChunkedArray") -> "pa.Array":
+    """
+    The minimum, mean, (approximate) median and maximum of a date or
+    timestamp array, computed on the integer representation of the
+    values and returned as an array of the same type
+    """
+    import pyarrow.compute as pc
+
+    storage_type = pa_.int32() if pa_.types.is_date32(values.type) else pa_.int64()
+    ints = values.cast(storage_type)
+
+    min_max = pc.min_max(ints)
+    mean = pc.mean(ints).as_py()
+    median = pc.approximate_median(ints).as_py()
+    stats = [
+        min_max["min"].as_py(),
+        None if mean is None else round(mean),
+        None if median is None else round(median),
+        min_max["max"].as_py(),
+    ]
+    return pa_.array(stats, type=storage_type).cast(values.type)
+
+
+def _get_dtype_tz(dtype):
+    tz = getattr(dtype, "tz", None)
+    if tz is None and isinstance(dtype, getattr(pd_, "ArrowDtype", ())):
+        # Arrow timestamps keep their time zone in the pyarrow type
+        tz = getattr(dtype.pyarrow_dtype, "tz", None)
+    return tz
+
+
+def _is_arrow_scalar_type(arrow_type) -> bool:
+    # Types whose Python values format the same as the scalars pandas
+    # yields when iterating
+    types = pa_.types
+    return (
+        types.is_string(arrow_type)
+        or types.is_large_string(arrow_type)
+        or types.is_integer(arrow_type)
+        or types.is_floating(arrow_type)
+        or types.is_boolean(arrow_type)
+    )
+
+
+def _infer_dtype_sampled(column: "pd.Series") -> Tuple[str, bool]:
+    """
+    Infer the type of a column from at most INFER_DTYPE_SAMPLE_SIZE
+    evenly spaced values, returning the inferred type and whether it
+    is provisional (i.e. based on a sample)
+    """
+    from pandas.api.types import infer_dtype
+
+    num_rows = len(column)
+    if num_rows <= INFER_DTYPE_SAMPLE_SIZE:
+        return infer_dtype(column), False
+
+    # One value from each of the equally sized strata, always
+    # including the first and last rows
+    positions = np_.linspace(0, num_rows - 1, INFER_DTYPE_SAMPLE_SIZE).astype(np_.intp)
+    return infer_dtype(column.take(positions)), True
+
+
+def _infer_dtype_chunked(column: "pd.Series") -> Iterator[Optional[str]]:
+    """
+    Infer the type of a column from a full scan in chunks of
+    INFER_DTYPE_CHUNK_SIZE rows, yielding None after each chunk but
+    the last, and then the inferred type
+    """
+    from pandas.api.types import infer_dtype
+
+    chunk_types = set()
+    for start in range(0, len(column), INFER_DTYPE_CHUNK_SIZE):
+        if start > 0:
+            yield None
+        chunk_types.add(infer_dtype(column.iloc[start : start + INFER_DTYPE_CHUNK_SIZE]))
+
+    chunk_types.discard("empty")
+    if len(chunk_types) <= 1:
+        yield chunk_types.pop() if chunk_types else "empty"
+    else:
+        # Differently typed chunks don't determine the column's type,
+        # e.g. integers and strings are "mixed-integer"
+        yield infer_dtype(column)
+
+
+def _is_string_categories(dtype: "pd.CategoricalDtype") -> bool:
+    from pandas.api.types import infer_dtype
+
+    return infer_dtype(dtype.categories) == "string"
+
+
+def _category_counts(col: "pd.Series"):
+    """
+    Count the occurrences of each category of a categorical series,
+    excluding nulls
+    """
+    num_categories = len(col.cat.categories)
+    # Shift the codes so that nulls (-1) land in bin 0
+    return np_.bincount(col.cat.codes.to_numpy() + 1, minlength=num_categories + 1)[1:]
+
+
+def _expand_category_mask(category_mask, codes, null_value=False):
+    """
+    Expand a boolean mask computed over a categorical's categories to
+    a row mask, using null_value for missing values (code -1)
+    """
+    # Appending the null value lets code -1 index it directly
+    return np_.append(category_mask, null_value)[codes]
+
+
+def _pandas_search_mask(
+    values: "pd.Series", search_type: SearchFilterType, term: str, case_sensitive: bool
+) -> "pd.Series":
+    if search_type == SearchFilterType.RegexMatch:
+        return values.str.match(term, case=case_sensitive)
+
+    if not case_sensitive:
+        values = values.str.lower()
+        term = term.lower()
+    if search_type == SearchFilterType.Contains:
+        return values.str.contains(term)
+    elif search_type == SearchFilterType.StartsWith:
+        return values.str.startswith(term)
+    else:
+        return values.str.endswith(term)
+
+
+def _pandas_find_mask(values: "pd.Series", params: FindParams) -> "pd.Series":
+    if params.find_type == FindType.Equals:
+        if params.case_sensitive:
+            return values == params.term
+        return values.str.lower() == params.term.lower()
+    search_type = SearchFilterType(params.find_type.value)
+    return _pandas_search_mask(values, search_type, params.term, params.case_sensitive)
+
+
+def _arrow_search_mask(
+    values: "pa.ChunkedArray", search_type: SearchFilterType, term: str, case_sensitive: bool
+):
+    import pyarrow.compute as pc
+
+    ignore_case = not case_sensitive
+    if search_type == SearchFilterType.RegexMatch:
+        # Anchored at the start, like re.match
+        return pc.match_substring_regex(values, f"^(?:{term})", ignore_case=ignore_case)
+    elif search_type == SearchFilterType.Contains:
+        # A regular expression, like Series.str.contains
+        return pc.match_substring_regex(values, term, ignore_case=ignore_case)
+    elif search_type == SearchFilterType.StartsWith:
+        return pc.starts_with(values, term, ignore_case=ignore_case)
+    else:
+        return pc.ends_with(values, term, ignore_case=ignore_case)
+
+
+def _arrow_find_mask(values: "pa.ChunkedArray", params: FindParams):
+    import pyarrow.compute as pc
+
+    if params.find_type == FindType.Equals:
+        if params.case_sensitive:
+            return pc.equal(values, params.term)
+        return pc.equal(pc.utf8_lower(values), params.term.lower())
+    search_type = SearchFilterType(params.find_type.value)
+    return _arrow_search_mask(values, search_type, params.term, params.case_sensitive)
+
+
+def _polars_search_mask(
+    values: "pl.Series", search_type: SearchFilterType, term: str, case_sensitive: bool
+) -> "pl.Series":
+    if search_type == SearchFilterType.RegexMatch:
+        if not case_sensitive:
+            term = "(?i)" + term
+        return values.str.contains(term)
+
+    if not case_sensitive:
+        values = values.str.to_lowercase()
+        term = term.lower()
+    if search_type == SearchFilterType.Contains:
+        return values.str.contains(term)
+    elif search_type == SearchFilterType.StartsWith:
+        return values.str.starts_with(term)
+    else:
+        return values.str.ends_with(term)
+
+
+def _polars_find_mask(values: "pl.Series", params: FindParams) -> "pl.Series":
+    if params.find_type == FindType.Equals:
+        if params.case_sensitive:
+            return values == params.term
+        return values.str.to_lowercase() == params.term.lower()
+    search_type = SearchFilterType(params.find_type.value)
+    return _polars_search_mask(values, search_type, params.term, params.case_sensitive)
+
+
 def _date_median(x):
     """
     Computes the median of a date or datetime series
@@ -1457,8 +2867,13 @@ class PolarsView(DataExplorerTableView):
         table: "pl.DataFrame",
         filters: Optional[List[RowFilter]],
         sort_keys: Optional[List[ColumnSortKey]],
+        shared: Optional[_SharedTableState] = None,
     ):
-        super().__init__(display_name, table, filters, sort_keys)
+        # Filters are compiled into a single query unless one of them
+        # fails when it runs
+        self._compile_filters = True
+
+        super().__init__(display_name, table, filters, sort_keys, shared)
 
     def get_updated_state(self, new_table) -> StateUpdate:
         filtered_columns = {
@@ -1704,8 +3119,39 @@ class PolarsView(DataExplorerTableView):
 
         return _format_series(values)
 
-    def _export_data_selection(self, selection: DataSelection, fmt: ExportFormat) -> ExportedData:
-        raise NotImplementedError
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        if self.view_indices is not None:
+            row_index = self.view_indices[row_index]
+        return str(self.table[row_index, column_index])
+
+    def _export_chunk(self, row_selector, column_selector, fmt: ExportFormat, header: bool) -> str:
+        to_export = self._get_selection(row_selector, column_selector)
+
+        if fmt == ExportFormat.Csv:
+            return to_export.write_csv(include_header=header)
+        elif fmt == ExportFormat.Tsv:
+            return to_export.write_csv(separator="\t", include_header=header)
+        else:
+            raise _RequestError(f"Export format {fmt.value} is not supported for polars")
+
+    def _export_binary(
+        self, row_selector, column_selector, fmt: ExportFormat, path: str
+    ) -> Iterator[Tuple[int, int]]:
+        # polars gathers the selected rows in native code, so we write
+        # them in one go with the native writers
+        to_export = self._get_selection(row_selector, column_selector)
+        if fmt == ExportFormat.Parquet:
+            to_export.write_parquet(path)
+        else:
+            to_export.write_ipc(path)
+        yield len(to_export), len(to_export)
+
+    def _get_selection(self, row_selector, column_selector):
+        selection = self.table[:, _range_to_slice(column_selector)]
+        if isinstance(row_selector, range):
+            return selection.slice(row_selector.start, len(row_selector))
+        else:
+            return selection[row_selector]
 
     SUPPORTED_FILTERS = {
         RowFilterType.Between,
@@ -1721,18 +3167,60 @@ class PolarsView(DataExplorerTableView):
         RowFilterType.SetMembership,
     }
 
+    def _eval_filters(self, filters: List[RowFilter]):
+        # The filters are compiled into a single expression and run as
+        # one query, so that polars can fuse the predicates and
+        # evaluate them in parallel
+        validity = [(filt.is_valid, filt.error_message) for filt in filters]
+        try:
+            return super()._eval_filters(filters)
+        except pl_.exceptions.PolarsError:
+            # Some errors only surface when the query runs. Start over
+            # evaluating the filters one at a time to find out which
+            # ones failed
+            for filt, (is_valid, error_message) in zip(filters, validity):
+                filt.is_valid = is_valid
+                filt.error_message = error_message
+
+            self._compile_filters = False
+            try:
+                return super()._eval_filters(filters)
+            finally:
+                self._compile_filters = True
+
     def _mask_to_indices(self, mask):
+        if mask is None:
+            return None
+
+        if isinstance(mask, pl_.Expr):
+            # Only the columns used by the filters are read, and the
+            # row indices are produced directly
+            index_name = "index"
+            while index_name in self.table.columns:
+                index_name = f"_{index_name}"
+
+            query = self.table.lazy()
+            try:
+                query = query.with_row_index(index_name)
+            except AttributeError:
+                # Older versions of polars only have with_row_count
+                query = query.with_row_count(index_name)
+            return query.filter(mask).select(index_name).collect()[index_name]
+
         # Boolean array -> int32 array of true indices
-        if mask is not None:
-            return mask.arg_true()
+        return mask.arg_true()
 
     def _eval_filter(self, filt: RowFilter):
+        """
+        Return the filter as a boolean expression, with nulls as False.
+        The expression is evaluated right away if filters are not being
+        compiled into a single query.
+        """
         column_index = filt.column_schema.column_index
-        col = self.table[:, column_index]
+        col = pl_.col(self.table.columns[column_index])
 
-        dtype = col.dtype
+        dtype = self.table.dtypes[column_index]
         display_type = self._get_type_display(dtype)
-
         mask = None
         if filt.filter_type in (
             RowFilterType.Between,
@@ -1755,25 +3243,25 @@ class PolarsView(DataExplorerTableView):
             # pandas comparison filters return False for null values
             mask = op(col, self._coerce_value(params.value, dtype, display_type))
         elif filt.filter_type == RowFilterType.IsEmpty:
-            if col.dtype.is_(pl_.String):
+            if dtype.is_(pl_.String):
                 mask = col.str.len_chars() == 0
-            elif col.dtype.is_(pl_.Binary):
+            elif dtype.is_(pl_.Binary):
                 # col == b"" segfaults in polars
                 mask = col.bin.encode("hex").str.len_chars() == 0
             else:
-                raise TypeError(col.dtype)
+                raise TypeError(dtype)
         elif filt.filter_type == RowFilterType.NotEmpty:
-            if col.dtype.is_(pl_.String):
+            if dtype.is_(pl_.String):
                 mask = col.str.len_chars() != 0
-            elif col.dtype.is_(pl_.Binary):
+            elif dtype.is_(pl_.Binary):
                 # col == b"" segfaults in polars
                 mask = col.bin.encode("hex").str.len_chars() != 0
             else:
-                raise TypeError(col.dtype)
+                raise TypeError(dtype)
         elif filt.filter_type == RowFilterType.IsNull:
             mask = col.is_null()
         elif filt.filter_type == RowFilterType.NotNull:
-            mask = ~col.is_null()
+            mask = col.is_not_null()
         elif filt.filter_type == RowFilterType.IsTrue:
             mask = col == True  # noqa: E712
         elif filt.filter_type == RowFilterType.IsFalse:
@@ -1793,34 +3281,47 @@ class PolarsView(DataExplorerTableView):
             params = filt.search_params
             assert params is not None
 
-            if not col.dtype.is_(pl_.String):
-                col = col.cast(str)
-
-            term = params.term
+            if not dtype.is_(pl_.String):
+                col = col.cast(pl_.String)
 
-            if params.search_type == SearchFilterType.RegexMatch:
-                if not params.case_sensitive:
-                    term = "(?i)" + term
-                mask = col.str.contains(term)
-            else:
-                if not params.case_sensitive:
-                    col = col.str.to_lowercase()
-                    term = term.lower()
-                if params.search_type == SearchFilterType.Contains:
-                    mask = col.str.contains(term)
-                elif params.search_type == SearchFilterType.StartsWith:
-                    mask = col.str.starts_with(term)
-                elif params.search_type == SearchFilterType.EndsWith:
-                    mask = col.str.ends_with(term)
+            mask = _polars_search_mask(col, params.search_type, params.term, params.case_sensitive)
 
         assert mask is not None
 
-        # Nulls are possible in the mask, so we just fill them if any
-        if mask.null_count() > 0:
-            mask[mask.is_null()] = False
-
+        # Nulls are possible in the mask, so we just fill them
+        mask = mask.fill_null(False)
+        if not self._compile_filters:
+            return self.table.select(mask).to_series()
         return mask
 
+    def _get_find_matcher(self, column_index: int, params: FindParams):
+        col = self.table[:, column_index]
+        dtype = col.dtype
+
+        if params.find_type == FindType.Equals and not dtype.is_(pl_.String):
+            # Compare values rather than their formatted text, so that
+            # e.g. "5" finds 5.0
+            try:
+                value = self._coerce_value(params.term, dtype, self._get_type_display(dtype))
+            except (TypeError, ValueError, pl_.exceptions.PolarsError):
+                # A term that cannot be coerced cannot match
+                return None
+            return lambda rows: (col[rows] == value).fill_null(False).to_numpy()
+
+        def string_matcher(rows):
+            values = col[rows]
+            if not values.dtype.is_(pl_.String):
+                values = values.cast(str)
+            try:
+                mask = _polars_find_mask(values, params)
+            except pl_.exceptions.ComputeError as e:
+                # polars' regular expression syntax is more limited
+                # than Python's
+                raise _RequestError(f"Invalid regular expression {params.term!r}: {e}") from e
+            return mask.fill_null(False).to_numpy()
+
+        return string_matcher
+
     @staticmethod
     def _coerce_value(value, dtype, display_type):
         if dtype.is_integer():
@@ -1889,14 +3390,234 @@ class PolarsView(DataExplorerTableView):
     def _prof_null_count(self, column_index: int) -> int:
         return self._get_column(column_index).null_count()
 
-    def _get_column(self, column_index: int) -> "pl.Series":
+    def _get_filtered_column(self, column_index: int) -> "pl.Series":
         column = self.table[:, column_index]
         if self.filtered_indices is not None:
             column = column.gather(self.filtered_indices)
         return column
 
+    def _take_rows(self, table, positions):
+        return table[positions]
+
+    def _factorize(self, table, column_index: int):
+        # Dense ranks are 1, 2, ..., leaving 0 for nulls
+        return table[:, column_index].rank("dense").fill_null(0).to_numpy()
+
+    _AGGREGATIONS = {
+        AggregationFunction.Count: "count",
+        AggregationFunction.Sum: "sum",
+        AggregationFunction.Mean: "mean",
+        AggregationFunction.Median: "median",
+        AggregationFunction.Min: "min",
+        AggregationFunction.Max: "max",
+        AggregationFunction.Stdev: "std",
+        AggregationFunction.NumUnique: "n_unique",
+    }
+
+    def _group_by(self, group_by: List[int], aggregations: List[ColumnAggregation]):
+        columns = self.table.columns
+        keys = [columns[i] for i in group_by]
+
+        table = self.table.select(
+            list(dict.fromkeys([*keys, *(columns[x.column_index] for x in aggregations)]))
+        )
+        if self.filtered_indices is not None:
+            table = table[self.filtered_indices]
+
+        exprs = [pl_.len().alias("count")]
+        for agg in aggregations:
+            column_name = columns[agg.column_index]
+            expr = getattr(pl_.col(column_name), self._AGGREGATIONS[agg.function])()
+            exprs.append(expr.alias(f"{column_name}_{agg.function.value}"))
+
+        try:
+            return table.group_by(keys).agg(exprs).sort(keys, nulls_last=True)
+        except pl_.exceptions.PolarsError as e:
+            raise _RequestError(f"Cannot compute aggregations: {e}") from e
+
     def _prof_summary_stats(self, column_index: int, options: FormatOptions) -> ColumnSummaryStats:
-        raise NotImplementedError
+        return self._prof_summary_stats_many([column_index], options)[column_index]
+
+    def _prof_summary_stats_many(
+        self, column_indices: List[int], options: FormatOptions
+    ) -> Dict[int, ColumnSummaryStats]:
+        # All of the statistics for all of the columns are aggregate
+        # expressions in a single select, so that polars can evaluate
+        # them in parallel in one query
+        display_types = {
+            column_index: self._get_type_display(self.table.dtypes[column_index])
+            for column_index in dict.fromkeys(column_indices)
+        }
+        try:
+            values = self._select_summary_stats(display_types)
+        except pl_.exceptions.PolarsError:
+            # Some errors only surface when the query runs. Start over
+            # computing the columns one at a time, so that a column
+            # polars cannot summarize does not fail the others
+            values = {}
+            for column_index, display_type in display_types.items():
+                try:
+                    values.update(self._select_summary_stats({column_index: display_type}))
+                except pl_.exceptions.PolarsError:
+                    logger.warning(
+                        f"Cannot compute summary statistics for column {column_index}",
+                        exc_info=True,
+                    )
+
+        results = {}
+        for column_index, display_type in display_types.items():
+            prefix = f"{column_index}:"
+            column_values = {
+                key[len(prefix) :]: value for key, value in values.items() if key.startswith(prefix)
+            }
+            if not column_values:
+                results[column_index] = ColumnSummaryStats(
+                    type_display=ColumnDisplayType(display_type)
+                )
+                continue
+            results[column_index] = self._summary_stats_from_values(
+                self.table.dtypes[column_index], display_type, column_values, options
+            )
+        return results
+
+    def _select_summary_stats(self, display_types: Dict[int, str]) -> dict:
+        columns = self.table.columns
+        exprs = []
+        for column_index, display_type in display_types.items():
+            stat_exprs = self._summary_stats_exprs(
+                pl_.col(columns[column_index]), self.table.dtypes[column_index], display_type
+            )
+            exprs.extend(expr.alias(f"{column_index}:{stat}") for stat, expr in stat_exprs.items())
+
+        if not exprs:
+            return {}
+
+        table = self.table.select([columns[i] for i in display_types])
+        if self.filtered_indices is not None:
+            table = table[self.filtered_indices]
+        return table.select(exprs).row(0, named=True)
+
+    @staticmethod
+    def _summary_stats_exprs(col: "pl.Expr", dtype: "pl.DataType", display_type: str):
+        if display_type == ColumnDisplayType.Number:
+            if dtype.is_float():
+                # Like pandas, skip NaN as well as nulls
+                col = col.fill_nan(None)
+            elif dtype == pl_.Decimal:
+                # polars does not implement all of these stats for
+                # decimals
+                col = col.cast(pl_.Float64)
+            return {
+                "min": col.min(),
+                "max": col.max(),
+                "mean": col.mean(),
+                "median": col.median(),
+                "stdev": col.std(),
+            }
+        elif display_type == ColumnDisplayType.String:
+            if dtype.is_(pl_.Binary):
+                is_empty = col.bin.encode("hex").str.len_chars() == 0
+            else:
+                is_empty = col.str.len_chars() == 0
+            return {
+                "num_empty": is_empty.sum(),
+                "num_unique": col.drop_nulls().n_unique(),
+            }
+        elif display_type == ColumnDisplayType.Boolean:
+            return {"true_count": col.sum(), "count": col.count()}
+        elif display_type in (ColumnDisplayType.Date, ColumnDisplayType.Datetime):
+            return {
+                "num_unique": col.drop_nulls().n_unique(),
+                "min": col.min(),
+                "mean": col.mean(),
+                "median": col.median(),
+                "max": col.max(),
+            }
+        else:
+            return {}
+
+    @staticmethod
+    def _summary_stats_from_values(
+        dtype: "pl.DataType", display_type: str, values: dict, options: FormatOptions
+    ) -> ColumnSummaryStats:
+        if display_type == ColumnDisplayType.Number:
+            float_format = _get_float_formatter(options)
+            min_val, max_val = values["min"], values["max"]
+            if min_val is None:
+                # All values are null
+                return ColumnSummaryStats(
+                    type_display=ColumnDisplayType.Number,
+                    number_stats=SummaryStatsNumber(),
+                )
+
+            mean_val = median_val = std_val = None
+            if not _isinf(min_val) and not _isinf(max_val):
+                # These stats are not defined when there is an
+                # inf/-inf in the data
+                mean_val = float_format(values["mean"])
+                median_val = float_format(values["median"])
+                if values["stdev"] is not None:
+                    std_val = float_format(values["stdev"])
+
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Number,
+                number_stats=SummaryStatsNumber(
+                    min_value=float_format(min_val),
+                    max_value=float_format(max_val),
+                    mean=mean_val,
+                    median=median_val,
+                    stdev=std_val,
+                ),
+            )
+        elif display_type == ColumnDisplayType.String:
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.String,
+                string_stats=SummaryStatsString(
+                    num_empty=int(values["num_empty"]), num_unique=int(values["num_unique"])
+                ),
+            )
+        elif display_type == ColumnDisplayType.Boolean:
+            true_count = int(values["true_count"] or 0)
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Boolean,
+                boolean_stats=SummaryStatsBoolean(
+                    true_count=true_count, false_count=int(values["count"]) - true_count
+                ),
+            )
+        elif display_type == ColumnDisplayType.Date:
+
+            def format_date(x):
+                return None if x is None else x.strftime("%Y-%m-%d")
+
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Date,
+                date_stats=SummaryStatsDate(
+                    num_unique=int(values["num_unique"]),
+                    min_date=format_date(values["min"]),
+                    mean_date=format_date(values["mean"]),
+                    median_date=format_date(values["median"]),
+                    max_date=format_date(values["max"]),
+                ),
+            )
+        elif display_type == ColumnDisplayType.Datetime:
+
+            def format_datetime(x):
+                return None if x is None else str(x)
+
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Datetime,
+                datetime_stats=SummaryStatsDatetime(
+                    num_unique=int(values["num_unique"]),
+                    min_date=format_datetime(values["min"]),
+                    mean_date=format_datetime(values["mean"]),
+                    median_date=format_datetime(values["median"]),
+                    max_date=format_datetime(values["max"]),
+                    timezone=str(dtype.time_zone),
+                ),
+            )
+        else:
+            # Return nothing for types we don't yet know how to summarize
+            return ColumnSummaryStats(type_display=ColumnDisplayType(display_type))
 
     def _prof_freq_table(self, column_index: int) -> ColumnFrequencyTable:
         raise NotImplementedError
@@ -1923,24 +3644,163 @@ class PolarsView(DataExplorerTableView):
                     profile_type=ColumnProfileType.NullCount,
                     support_status=SupportStatus.Supported,
                 ),
-                # Temporarily disabled for https://github.com/posit-dev/positron/issues/3490
-                # on 6/11/2024. This will be enabled again when the UI has been reworked to
-                # more fully support column profiles.
                 ColumnProfileTypeSupportStatus(
                     profile_type=ColumnProfileType.SummaryStats,
-                    support_status=SupportStatus.Unsupported,
+                    support_status=SupportStatus.Experimental,
                 ),
             ],
         ),
-        export_data_selection=ExportDataSelectionFeatures(support_status=SupportStatus.Unsupported),
+        export_data_selection=ExportDataSelectionFeatures(
+            support_status=SupportStatus.Supported,
+            supported_formats=[
+                ExportFormat.Csv,
+                ExportFormat.Tsv,
+                ExportFormat.Parquet,
+                ExportFormat.ArrowIpc,
+            ],
+        ),
         set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
+        set_group_by=SetGroupByFeatures(
+            support_status=SupportStatus.Supported,
+            supported_functions=list(AggregationFunction),
+        ),
+        set_sampling=SetSamplingFeatures(
+            support_status=SupportStatus.Supported,
+            supported_methods=list(SamplingMethod),
+        ),
+        find=FindFeatures(support_status=SupportStatus.Supported),
     )
 
 
+class NumpyView(PandasView):
+    """
+    View of a 1-D or 2-D NumPy array, a structured array or a dict of
+    equal-length 1-D arrays.
+
+    The value is wrapped in a pandas DataFrame with copy=False so that
+    each column is a (possibly strided) view into the original arrays
+    and the pandas filter, sort and profile kernels can be reused.
+    """
+
+    def _maybe_wrap(self, value):
+        return _numpy_to_dataframe(value)
+
+    def is_same_table_type(self, new_table) -> bool:
+        return _is_numpy_table(new_table)
+
+    def get_updated_state(self, new_table) -> StateUpdate:
+        # The wrapper is always a new object, but it cannot hide an
+        # in-place dtype change since NumPy arrays cannot change their
+        # dtype or shape in place
+        return super().get_updated_state(_numpy_to_dataframe(new_table))
+
+
+def _is_numpy_table(value) -> bool:
+    """
+    Whether a value is a NumPy array or a dict of NumPy arrays that
+    can be viewed as a table.
+    """
+    if np_ is None or pd_ is None:
+        return False
+
+    if isinstance(value, np_.ndarray):
+        fields = value.dtype.fields
+        if fields is None:
+            return value.ndim in (1, 2)
+
+        # Structured arrays with scalar (non-nested, non-subarray)
+        # fields only
+        return value.ndim == 1 and all(
+            dtype.shape == () and dtype.fields is None for dtype, *_ in fields.values()
+        )
+
+    if isinstance(value, dict) and len(value) > 0:
+        length = None
+        for column in value.values():
+            if (
+                not isinstance(column, np_.ndarray)
+                or column.ndim != 1
+                or column.dtype.fields is not None
+            ):
+                return False
+            if length is None:
+                length = len(column)
+            elif len(column) != length:
+                return False
+        return True
+
+    return False
+
+
+def _numpy_to_dataframe(value):
+    # copy=False keeps the columns as views into the original arrays
+    # rather than consolidating them into new memory
+    if isinstance(value, dict):
+        return pd_.DataFrame(value, copy=False)
+    elif value.dtype.fields is not None:
+        return pd_.DataFrame({name: value[name] for name in value.dtype.names}, copy=False)
+    else:
+        return pd_.DataFrame(value, copy=False)
+
+
 class PyArrowView(DataExplorerTableView):
     pass
 
 
+def _stratified_sample_positions(codes, sample_size: int, rng):
+    """
+    Sorted positions of a random sample of about sample_size rows,
+    with each stratum (distinct value of codes) represented in
+    proportion to its size and by at least one row
+    """
+    num_rows = len(codes)
+    if num_rows == 0:
+        return np_.arange(0)
+
+    counts = np_.bincount(codes)
+    quotas = np_.round(counts * (sample_size / num_rows)).astype(np_.intp)
+    quotas[(counts > 0) & (quotas == 0)] = 1
+
+    # Shuffle the rows, then group them by stratum keeping the
+    # shuffled order, and keep the first quota rows of each stratum
+    shuffled = rng.permutation(num_rows)
+    by_stratum = shuffled[np_.argsort(codes[shuffled], kind="stable")]
+    stratum_codes = codes[by_stratum]
+    stratum_starts = np_.concatenate([[0], np_.cumsum(counts)[:-1]])
+    rank_in_stratum = np_.arange(num_rows) - stratum_starts[stratum_codes]
+    return np_.sort(by_stratum[rank_in_stratum < quotas[stratum_codes]])
+
+
+def _get_export_chunk_size(num_columns: int) -> int:
+    return max(EXPORT_CHUNK_NUM_CELLS // max(num_columns, 1), 1)
+
+
+def _find_chunks(lower: int, upper: int, forward: bool, num_columns: int):
+    """
+    Split the view rows [lower, upper) into chunks in search order,
+    doubling in size so that nearby matches are found quickly while
+    long scans amortize the per-chunk overhead
+    """
+    size = max(FIND_INITIAL_CHUNK_NUM_CELLS // num_columns, 1)
+    max_size = max(FIND_CHUNK_NUM_CELLS // num_columns, 1)
+    while lower < upper:
+        if forward:
+            yield lower, min(lower + size, upper)
+            lower += size
+        else:
+            yield max(upper - size, lower), upper
+            upper -= size
+        size = min(2 * size, max_size)
+
+
+def _range_to_slice(selector):
+    # Contiguous selections are indexed with slices, which avoids
+    # materializing an array of positions
+    if isinstance(selector, range):
+        return slice(selector.start, selector.stop)
+    return selector
+
+
 def _is_pandas(table):
     return pd_ is not None and isinstance(table, (pd_.DataFrame, pd_.Series))
 
@@ -1949,13 +3809,15 @@ def _is_polars(table):
     return pl_ is not None and isinstance(table, (pl_.DataFrame, pl_.Series))
 
 
-def _get_table_view(table, filters=None, sort_keys=None, name=None):
+def _get_table_view(table, filters=None, sort_keys=None, name=None, shared=None):
     name = name or guid()
 
     if _is_pandas(table):
-        return PandasView(name, table, filters, sort_keys)
+        return PandasView(name, table, filters, sort_keys, shared)
     elif _is_polars(table):
-        return PolarsView(name, table, filters, sort_keys)
+        return PolarsView(name, table, filters, sort_keys, shared)
+    elif _is_numpy_table(table):
+        return NumpyView(name, table, filters, sort_keys, shared)
     else:
         return UnsupportedView(name, table)
 
@@ -1965,9 +3827,24 @@ def _value_type_is_supported(value):
         return True
     if _is_polars(value):
         return True
+    if _is_numpy_table(value):
+        return True
     return False
 
 
+# Requests served by the grouped table while a grouped view is set
+_GROUPED_VIEW_REQUESTS = {
+    DataExplorerBackendRequest.GetSchema,
+    DataExplorerBackendRequest.SearchSchema,
+    DataExplorerBackendRequest.GetDataValues,
+    DataExplorerBackendRequest.ExportDataSelection,
+    DataExplorerBackendRequest.ExportDataSelectionToFile,
+    DataExplorerBackendRequest.SetSortColumns,
+    DataExplorerBackendRequest.GetColumnProfiles,
+    DataExplorerBackendRequest.Find,
+}
+
+
 class DataExplorerService:
     def __init__(self, comm_target: str) -> None:
         self.comm_target = comm_target
@@ -1984,10 +3861,21 @@ class DataExplorerService:
         # Mapping from comm_id to the corresponding variable path, if any
         self.comm_id_to_path: Dict[str, PathKey] = {}
 
+        # Derived state shared by the explorers on each variable path
+        self._shared_states: Dict[PathKey, _SharedTableState] = {}
+
         # Called when comm closure is initiated from the backend
         self._close_callback = None
 
+        # Background tasks confirming provisional schemas, and the
+        # comm_ids that they are serving
+        self._pending_tasks: Set[asyncio.Task] = set()
+        self._refining_comm_ids: Set[str] = set()
+
     def shutdown(self) -> None:
+        for task in self._pending_tasks:
+            task.cancel()
+
         for comm_id in list(self.comms.keys()):
             self._close_explorer(comm_id)
 
@@ -2036,7 +3924,10 @@ class DataExplorerService:
         else:
             full_title = title
 
-        self.table_views[comm_id] = _get_table_view(table, name=full_title)
+        shared = None
+        if variable_path is not None:
+            shared = self._get_shared_state(tuple(variable_path), table)
+        self.table_views[comm_id] = _get_table_view(table, name=full_title, shared=shared)
 
         base_comm = comm.create_comm(
             target_name=self.comm_target,
@@ -2087,6 +3978,15 @@ class DataExplorerService:
             path = self.comm_id_to_path[comm_id]
             self.path_to_comm_ids[path].remove(comm_id)
             del self.comm_id_to_path[comm_id]
+            if len(self.path_to_comm_ids[path]) == 0:
+                self._shared_states.pop(path, None)
+
+    def _get_shared_state(self, path: PathKey, table) -> _SharedTableState:
+        state = self._shared_states.get(path)
+        if state is None or state.source is not table:
+            state = _SharedTableState(table)
+            self._shared_states[path] = state
+        return state
 
     def on_comm_closed(self, callback: Callable[[str], None]):
         """
@@ -2123,6 +4023,9 @@ class DataExplorerService:
     def handle_variable_updated(self, variable_name, new_variable):
         affected_paths = self.get_paths_for_variable(variable_name)
         for path in affected_paths:
+            # The data may have changed in place, so the explorers on
+            # the path start over with a new shared state
+            self._shared_states.pop(path, None)
             for comm_id in list(self.path_to_comm_ids[path]):
                 self._update_explorer_for_comm(comm_id, path, new_variable)
 
@@ -2176,7 +4079,7 @@ class DataExplorerService:
             # looking at invalid.
             return self._close_explorer(comm_id)
 
-        if not isinstance(new_table, type(table_view.table)):
+        if not table_view.is_same_table_type(new_table):
             # Data structure type has changed. For now, we drop the
             # entire state: sorting keys, filters, etc. and start
             # over. At some point we can return here and selectively
@@ -2187,12 +4090,25 @@ class DataExplorerService:
         else:
             (schema_updated, new_filters, new_sort_keys) = table_view.get_updated_state(new_table)
 
-        self.table_views[comm_id] = _get_table_view(
+        new_view = _get_table_view(
             new_table,
             filters=new_filters,
             sort_keys=new_sort_keys,
             name=full_title,
+            shared=self._get_shared_state(path, new_table),
         )
+        if table_view.sampling is not None and not schema_updated:
+            # Keep sampling, drawing a new sample from the new data
+            new_view._set_sampling(table_view.sampling)
+        if table_view.group_by is not None and not schema_updated:
+            # Keep the grouping, regrouping the new data
+            try:
+                new_view._set_group_by(table_view.group_by)
+            except _RequestError:
+                pass
+        self.table_views[comm_id] = new_view
+        if new_view.has_provisional_schema():
+            self._schedule_schema_refinement(comm_id)
 
         if schema_updated:
             comm.send_event(DataExplorerFrontendEvent.SchemaUpdate.value, {})
@@ -2210,7 +4126,40 @@ class DataExplorerService:
         comm = self.comms[comm_id]
         table = self.table_views[comm_id]
 
-        result = getattr(table, request.method.value)(request)
+        if request.method == DataExplorerBackendRequest.Batch:
+            result = self._handle_batch(comm_id, request)
+        else:
+            try:
+                result = self._handle_request(comm_id, request)
+            except _RequestError as e:
+                return comm.send_error(JsonRpcErrorCode.INVALID_PARAMS, str(e))
+
+        comm.send_result(result)
+
+        if table.has_provisional_schema():
+            self._schedule_schema_refinement(comm_id)
+
+    def _handle_request(self, comm_id: str, request):
+        comm = self.comms[comm_id]
+        table = self.table_views[comm_id]
+
+        # While a grouped view is set, the grid is served from the
+        # grouped table
+        target = table
+        if table.grouped_view is not None and request.method in _GROUPED_VIEW_REQUESTS:
+            target = table.grouped_view
+
+        if request.method == DataExplorerBackendRequest.ExportDataSelectionToFile:
+            # File exports report their progress as they go
+            def progress(path: str, rows_written: int, total_rows: int):
+                params = ExportProgressParams(
+                    path=path, rows_written=rows_written, total_rows=total_rows
+                )
+                comm.send_event(DataExplorerFrontendEvent.ExportProgress.value, params.dict())
+
+            result = target.export_data_selection_to_file(request, progress)
+        else:
+            result = getattr(target, request.method.value)(request)
 
         # To help remember to convert pydantic types to dicts
         if result is not None:
@@ -2220,4 +4169,90 @@ class DataExplorerService:
             else:
                 assert isinstance(result, dict)
 
-        comm.send_result(result)
+        return result
+
+    def _handle_batch(self, comm_id: str, request: BatchRequest):
+        """
+        Run the requests in a batch in order, returning a response for
+        each of them. A failed request does not stop the ones after it.
+        """
+        table = self.table_views[comm_id]
+
+        responses = []
+        with table.cached_columns():
+            for item in request.params.requests:
+                try:
+                    result = self._handle_request(comm_id, self._parse_batch_item(comm_id, item))
+                    response = BatchItemResponse(result=result)
+                except ValidationError as e:
+                    response = BatchItemResponse(
+                        error=BatchItemError(
+                            code=JsonRpcErrorCode.INVALID_REQUEST,
+                            message=f"Invalid request: {e}",
+                        )
+                    )
+                except _RequestError as e:
+                    response = BatchItemResponse(
+                        error=BatchItemError(code=JsonRpcErrorCode.INVALID_PARAMS, message=str(e))
+                    )
+                except Exception as e:
+                    # Unexpected errors are also reported per item, so
+                    # the rest of the batch still gets its responses
+                    logger.warning(e, exc_info=True)
+                    response = BatchItemResponse(
+                        error=BatchItemError(
+                            code=JsonRpcErrorCode.INTERNAL_ERROR,
+                            message=f"Failed to process {item.method} request: {e}",
+                        )
+                    )
+                responses.append(response.dict())
+
+        return responses
+
+    @staticmethod
+    def _parse_batch_item(comm_id: str, item: BatchItem):
+        if item.method == DataExplorerBackendRequest.Batch.value:
+            raise _RequestError("Batch requests cannot be nested")
+
+        content = DataExplorerBackendMessageContent.parse_obj(
+            {
+                "comm_id": comm_id,
+                "data": {"jsonrpc": "2.0", "method": item.method, "params": item.params},
+            }
+        )
+        return content.data
+
+    def _schedule_schema_refinement(self, comm_id: str) -> None:
+        if comm_id in self._refining_comm_ids:
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop (e.g. outside of the kernel) the
+            # provisional types are kept as they are
+            return
+
+        self._refining_comm_ids.add(comm_id)
+        create_task(
+            self._refine_schema(comm_id, self.table_views[comm_id]),
+            self._pending_tasks,
+        )
+
+    async def _refine_schema(self, comm_id: str, table: DataExplorerTableView) -> None:
+        try:
+            schema_updated = False
+            for is_changed in table.refine_schema():
+                schema_updated = schema_updated or is_changed
+
+                # Yield to the event loop between columns so that
+                # other requests are not held up
+                await asyncio.sleep(0)
+                if self.table_views.get(comm_id) is not table:
+                    # The explorer was closed or its table replaced
+                    return
+
+            if schema_updated:
+                self.comms[comm_id].send_event(DataExplorerFrontendEvent.SchemaUpdate.value, {})
+        finally:
+            self._refining_comm_ids.discard(comm_id)
@@ -119,6 +119,34 @@ class SearchFilterType(str, enum.Enum):
     RegexMatch = "regex_match"
 
 
+@enum.unique
+class FindType(str, enum.Enum):
+    """
+    Possible values for FindType
+    """
+
+    Equals = "equals"
+
+    Contains = "contains"
+
+    StartsWith = "starts_with"
+
+    EndsWith = "ends_with"
+
+    RegexMatch = "regex_match"
+
+
+@enum.unique
+class FindDirection(str, enum.Enum):
+    """
+    Possible values for FindDirection
+    """
+
+    Next = "next"
+
+    Previous = "previous"
+
+
 @enum.unique
 class ColumnProfileType(str, enum.Enum):
     """
@@ -134,6 +162,44 @@ class ColumnProfileType(str, enum.Enum):
     Histogram = "histogram"
 
 
+@enum.unique
+class AggregationFunction(str, enum.Enum):
+    """
+    Possible values for AggregationFunction
+    """
+
+    Count = "count"
+
+    Sum = "sum"
+
+    Mean = "mean"
+
+    Median = "median"
+
+    Min = "min"
+
+    Max = "max"
+
+    Stdev = "stdev"
+
+    NumUnique = "num_unique"
+
+
+@enum.unique
+class SamplingMethod(str, enum.Enum):
+    """
+    Possible values for SamplingMethod
+    """
+
+    Full = "full"
+
+    Head = "head"
+
+    Uniform = "uniform"
+
+    Stratified = "stratified"
+
+
 @enum.unique
 class DataSelectionKind(str, enum.Enum):
     """
@@ -165,6 +231,10 @@ class ExportFormat(str, enum.Enum):
 
     Html = "html"
 
+    Parquet = "parquet"
+
+    ArrowIpc = "arrow_ipc"
+
 
 @enum.unique
 class SupportStatus(str, enum.Enum):
@@ -194,6 +264,26 @@ class SearchSchemaResult(BaseModel):
     )
 
 
+class FindResult(BaseModel):
+    """
+    The location of a found value
+    """
+
+    found: StrictBool = Field(
+        description="Whether a match was found",
+    )
+
+    row_index: Optional[StrictInt] = Field(
+        default=None,
+        description="View row index of the match",
+    )
+
+    column_index: Optional[StrictInt] = Field(
+        default=None,
+        description="Column index of the match",
+    )
+
+
 class ExportedData(BaseModel):
     """
     Exported result
@@ -208,6 +298,24 @@ class ExportedData(BaseModel):
     )
 
 
+class ExportedFile(BaseModel):
+    """
+    Result of exporting to a file
+    """
+
+    path: StrictStr = Field(
+        description="Absolute path of the written file",
+    )
+
+    num_rows: StrictInt = Field(
+        description="Number of rows written",
+    )
+
+    num_bytes: StrictInt = Field(
+        description="Size of the written file in bytes",
+    )
+
+
 class FilterResult(BaseModel):
     """
     The result of applying filters to a table
@@ -223,6 +331,26 @@ class FilterResult(BaseModel):
     )
 
 
+class GroupByResult(BaseModel):
+    """
+    The result of grouping the table
+    """
+
+    num_groups: StrictInt = Field(
+        description="Number of groups (rows) in the grouped table",
+    )
+
+
+class SamplingResult(BaseModel):
+    """
+    The result of setting the sampling mode
+    """
+
+    num_rows: StrictInt = Field(
+        description="Number of rows that the grid, filters, sorts and profiles are computed on",
+    )
+
+
 class BackendState(BaseModel):
     """
     The current backend state for the data explorer
@@ -252,6 +380,16 @@ class BackendState(BaseModel):
         description="The features currently supported by the backend instance",
     )
 
+    group_by: Optional[GroupBySpec] = Field(
+        default=None,
+        description="The grouping currently applied, if any",
+    )
+
+    sampling: Optional[SamplingState] = Field(
+        default=None,
+        description="Set when the table is being served from a sample rather than in full",
+    )
+
 
 class ColumnSchema(BaseModel):
     """
@@ -773,6 +911,82 @@ class ColumnSortKey(BaseModel):
     )
 
 
+class ColumnAggregation(BaseModel):
+    """
+    An aggregation to compute over a column for each group
+    """
+
+    column_index: StrictInt = Field(
+        description="Column index to aggregate",
+    )
+
+    function: AggregationFunction = Field(
+        description="Aggregation function",
+    )
+
+
+class GroupBySpec(BaseModel):
+    """
+    Group keys and aggregations of a grouped view
+    """
+
+    group_by: List[StrictInt] = Field(
+        description="Indices of the columns grouped by",
+    )
+
+    aggregations: List[ColumnAggregation] = Field(
+        description="Aggregations computed for each group",
+    )
+
+
+class SamplingParams(BaseModel):
+    """
+    Parameters for sampling a table
+    """
+
+    method: SamplingMethod = Field(
+        description="How to sample the table",
+    )
+
+    num_rows: Optional[StrictInt] = Field(
+        default=None,
+        description="Target number of rows in the sample. Defaults to a backend-defined size",
+    )
+
+    column_index: Optional[StrictInt] = Field(
+        default=None,
+        description="For stratified sampling, the column whose values define the strata",
+    )
+
+    seed: Optional[StrictInt] = Field(
+        default=None,
+        description="Seed for random sampling, for reproducible samples",
+    )
+
+
+class SamplingState(BaseModel):
+    """
+    The sampling currently applied to a table
+    """
+
+    method: SamplingMethod = Field(
+        description="How the table was sampled",
+    )
+
+    num_rows: StrictInt = Field(
+        description="Number of rows in the sample",
+    )
+
+    unsampled_num_rows: StrictInt = Field(
+        description="Number of rows in the full table",
+    )
+
+    column_index: Optional[StrictInt] = Field(
+        default=None,
+        description="For stratified samples, the column whose values define the strata",
+    )
+
+
 class SupportedFeatures(BaseModel):
     """
     For each field, returns flags indicating supported features
@@ -798,6 +1012,21 @@ class SupportedFeatures(BaseModel):
         description="Support for 'export_data_selection' RPC and its features",
     )
 
+    set_group_by: Optional[SetGroupByFeatures] = Field(
+        default=None,
+        description="Support for 'set_group_by' RPC and its features",
+    )
+
+    set_sampling: Optional[SetSamplingFeatures] = Field(
+        default=None,
+        description="Support for 'set_sampling' RPC and its features",
+    )
+
+    find: Optional[FindFeatures] = Field(
+        default=None,
+        description="Support for 'find' RPC and its features",
+    )
+
 
 class SearchSchemaFeatures(BaseModel):
     """
@@ -809,6 +1038,16 @@ class SearchSchemaFeatures(BaseModel):
     )
 
 
+class FindFeatures(BaseModel):
+    """
+    Feature flags for 'find' RPC
+    """
+
+    support_status: SupportStatus = Field(
+        description="The support status for this RPC method",
+    )
+
+
 class SetRowFiltersFeatures(BaseModel):
     """
     Feature flags for 'set_row_filters' RPC
@@ -843,13 +1082,19 @@ class GetColumnProfilesFeatures(BaseModel):
 
 class ExportDataSelectionFeatures(BaseModel):
     """
-    Feature flags for 'export_data_selction' RPC
+    Feature flags for 'export_data_selection' and
+    'export_data_selection_to_file' RPCs
     """
 
     support_status: SupportStatus = Field(
         description="The support status for this RPC method",
     )
 
+    supported_formats: Optional[List[ExportFormat]] = Field(
+        default=None,
+        description="Export formats supported by the backend",
+    )
+
 
 class SetSortColumnsFeatures(BaseModel):
     """
@@ -861,6 +1106,36 @@ class SetSortColumnsFeatures(BaseModel):
     )
 
 
+class SetGroupByFeatures(BaseModel):
+    """
+    Feature flags for 'set_group_by' RPC
+    """
+
+    support_status: SupportStatus = Field(
+        description="The support status for this RPC method",
+    )
+
+    supported_functions: Optional[List[AggregationFunction]] = Field(
+        default=None,
+        description="Aggregation functions supported by the backend",
+    )
+
+
+class SetSamplingFeatures(BaseModel):
+    """
+    Feature flags for 'set_sampling' RPC
+    """
+
+    support_status: SupportStatus = Field(
+        description="The support status for this RPC method",
+    )
+
+    supported_methods: Optional[List[SamplingMethod]] = Field(
+        default=None,
+        description="Sampling methods supported by the backend",
+    )
+
+
 class DataSelection(BaseModel):
     """
     A selection on the data grid, for copying to the clipboard or other
@@ -936,6 +1211,57 @@ class DataSelectionIndices(BaseModel):
     )
 
 
+class BatchItem(BaseModel):
+    """
+    A request run as part of a batch
+    """
+
+    method: StrictStr = Field(
+        description="The JSON-RPC method name",
+    )
+
+    params: BatchItemParams = Field(
+        description="The parameters for the method",
+    )
+
+
+BatchItemParams = Any
+
+
+class BatchItemResponse(BaseModel):
+    """
+    The response to a request run as part of a batch, with either a result
+    or an error
+    """
+
+    result: Optional[BatchItemResult] = Field(
+        default=None,
+        description="The result of the request",
+    )
+
+    error: Optional[BatchItemError] = Field(
+        default=None,
+        description="The error if the request failed",
+    )
+
+
+BatchItemResult = Any
+
+
+class BatchItemError(BaseModel):
+    """
+    An error from a request run as part of a batch
+    """
+
+    code: StrictInt = Field(
+        description="The JSON-RPC error code",
+    )
+
+    message: StrictStr = Field(
+        description="The error message",
+    )
+
+
 # ColumnValue
 ColumnValue = Union[
     StrictInt,
@@ -965,21 +1291,36 @@ class DataExplorerBackendRequest(str, enum.Enum):
     # Get a rectangle of data values
     GetDataValues = "get_data_values"
 
+    # Find the next or previous occurrence of a value
+    Find = "find"
+
     # Export data selection as a string in different formats
     ExportDataSelection = "export_data_selection"
 
+    # Export data selection to a file
+    ExportDataSelectionToFile = "export_data_selection_to_file"
+
     # Set row filters based on column values
     SetRowFilters = "set_row_filters"
 
     # Set or clear sort-by-column(s)
     SetSortColumns = "set_sort_columns"
 
+    # Set or clear a grouped view
+    SetGroupBy = "set_group_by"
+
+    # Set or clear a sampling view mode
+    SetSampling = "set_sampling"
+
     # Request a batch of column profiles
     GetColumnProfiles = "get_column_profiles"
 
     # Get the state
     GetState = "get_state"
 
+    # Run several requests at once
+    Batch = "batch"
+
 
 class GetSchemaParams(BaseModel):
     """
@@ -1092,6 +1433,63 @@ class GetDataValuesRequest(BaseModel):
     )
 
 
+class FindParams(BaseModel):
+    """
+    Search one or more columns for a value, starting from a row of the
+    current (filtered and sorted) view and moving in the given direction,
+    stopping at the first match
+    """
+
+    term: StrictStr = Field(
+        description="The value or pattern to search for",
+    )
+
+    find_type: FindType = Field(
+        description="How values are matched against the term",
+    )
+
+    case_sensitive: StrictBool = Field(
+        description="Whether text matching is case sensitive",
+    )
+
+    column_indices: List[StrictInt] = Field(
+        description="Columns to search, in order of precedence for matches in the same row. Searches all columns if empty",
+    )
+
+    start_index: StrictInt = Field(
+        description="View row index to start searching from, inclusive",
+    )
+
+    direction: FindDirection = Field(
+        description="Direction to search in",
+    )
+
+    wrap: StrictBool = Field(
+        description="Whether to continue searching from the other end of the view",
+    )
+
+
+class FindRequest(BaseModel):
+    """
+    Search one or more columns for a value, starting from a row of the
+    current (filtered and sorted) view and moving in the given direction,
+    stopping at the first match
+    """
+
+    params: FindParams = Field(
+        description="Parameters to the Find method",
+    )
+
+    method: Literal[DataExplorerBackendRequest.Find] = Field(
+        description="The JSON-RPC method name (find)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class ExportDataSelectionParams(BaseModel):
     """
     Export data selection as a string in different formats like CSV, TSV,
@@ -1127,6 +1525,45 @@ class ExportDataSelectionRequest(BaseModel):
     )
 
 
+class ExportDataSelectionToFileParams(BaseModel):
+    """
+    Export data selection to a file in different formats, writing the
+    selection in row chunks and emitting export_progress events as it goes
+    """
+
+    selection: DataSelection = Field(
+        description="The data selection",
+    )
+
+    format: ExportFormat = Field(
+        description="Exported file format",
+    )
+
+    path: StrictStr = Field(
+        description="Path of the file to write",
+    )
+
+
+class ExportDataSelectionToFileRequest(BaseModel):
+    """
+    Export data selection to a file in different formats, writing the
+    selection in row chunks and emitting export_progress events as it goes
+    """
+
+    params: ExportDataSelectionToFileParams = Field(
+        description="Parameters to the ExportDataSelectionToFile method",
+    )
+
+    method: Literal[DataExplorerBackendRequest.ExportDataSelectionToFile] = Field(
+        description="The JSON-RPC method name (export_data_selection_to_file)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class SetRowFiltersParams(BaseModel):
     """
     Set or clear row filters on table, replacing any previous filters
@@ -1187,6 +1624,80 @@ class SetSortColumnsRequest(BaseModel):
     )
 
 
+class SetGroupByParams(BaseModel):
+    """
+    Group the filtered rows by one or more columns and compute
+    aggregations for each group. While set, the schema, data values,
+    profiles, sorting and exports are served from the grouped table. Pass
+    no group keys to return to the ungrouped view
+    """
+
+    group_by: List[StrictInt] = Field(
+        description="Indices of the columns to group by. Clears any existing grouping if empty",
+    )
+
+    aggregations: List[ColumnAggregation] = Field(
+        description="Aggregations to compute for each group, in addition to the number of rows in each group",
+    )
+
+
+class SetGroupByRequest(BaseModel):
+    """
+    Group the filtered rows by one or more columns and compute
+    aggregations for each group. While set, the schema, data values,
+    profiles, sorting and exports are served from the grouped table. Pass
+    no group keys to return to the ungrouped view
+    """
+
+    params: SetGroupByParams = Field(
+        description="Parameters to the SetGroupBy method",
+    )
+
+    method: Literal[DataExplorerBackendRequest.SetGroupBy] = Field(
+        description="The JSON-RPC method name (set_group_by)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
+class SetSamplingParams(BaseModel):
+    """
+    Serve the grid, filters, sorts and profiles from a fixed-size sample
+    of the table so that huge tables can be explored immediately. Filters
+    and sort keys are kept and re-evaluated on the sample. Pass the 'full'
+    method to return to computing on the full table
+    """
+
+    sampling: SamplingParams = Field(
+        description="The sampling mode to apply",
+    )
+
+
+class SetSamplingRequest(BaseModel):
+    """
+    Serve the grid, filters, sorts and profiles from a fixed-size sample
+    of the table so that huge tables can be explored immediately. Filters
+    and sort keys are kept and re-evaluated on the sample. Pass the 'full'
+    method to return to computing on the full table
+    """
+
+    params: SetSamplingParams = Field(
+        description="Parameters to the SetSampling method",
+    )
+
+    method: Literal[DataExplorerBackendRequest.SetSampling] = Field(
+        description="The JSON-RPC method name (set_sampling)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class GetColumnProfilesParams(BaseModel):
     """
     Requests a statistical summary or data profile for batch of columns
@@ -1236,17 +1747,55 @@ class GetStateRequest(BaseModel):
     )
 
 
+class BatchParams(BaseModel):
+    """
+    Run several data explorer requests in order and return all of their
+    results in a single response, sharing work like recomputing the view
+    between them
+    """
+
+    requests: List[BatchItem] = Field(
+        description="The requests to run, in order",
+    )
+
+
+class BatchRequest(BaseModel):
+    """
+    Run several data explorer requests in order and return all of their
+    results in a single response, sharing work like recomputing the view
+    between them
+    """
+
+    params: BatchParams = Field(
+        description="Parameters to the Batch method",
+    )
+
+    method: Literal[DataExplorerBackendRequest.Batch] = Field(
+        description="The JSON-RPC method name (batch)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class DataExplorerBackendMessageContent(BaseModel):
     comm_id: str
     data: Union[
         GetSchemaRequest,
         SearchSchemaRequest,
         GetDataValuesRequest,
+        FindRequest,
         ExportDataSelectionRequest,
+        ExportDataSelectionToFileRequest,
         SetRowFiltersRequest,
         SetSortColumnsRequest,
+        SetGroupByRequest,
+        SetSamplingRequest,
         GetColumnProfilesRequest,
         GetStateRequest,
+        BatchRequest,
     ] = Field(..., discriminator="method")
 
 
@@ -1262,13 +1811,42 @@ class DataExplorerFrontendEvent(str, enum.Enum):
     # Clear cache and request fresh data
     DataUpdate = "data_update"
 
+    # Progress of a file export
+    ExportProgress = "export_progress"
+
+
+class ExportProgressParams(BaseModel):
+    """
+    Progress of a file export
+    """
+
+    path: StrictStr = Field(
+        description="Path of the file being written",
+    )
+
+    rows_written: StrictInt = Field(
+        description="Number of rows written so far",
+    )
+
+    total_rows: StrictInt = Field(
+        description="Total number of rows being exported",
+    )
+
 
 SearchSchemaResult.update_forward_refs()
 
+FindResult.update_forward_refs()
+
 ExportedData.update_forward_refs()
 
+ExportedFile.update_forward_refs()
+
 FilterResult.update_forward_refs()
 
+GroupByResult.update_forward_refs()
+
+SamplingResult.update_forward_refs()
+
 BackendState.update_forward_refs()
 
 ColumnSchema.update_forward_refs()
@@ -1321,10 +1899,20 @@ ColumnQuantileValue.update_forward_refs()
 
 ColumnSortKey.update_forward_refs()
 
+ColumnAggregation.update_forward_refs()
+
+GroupBySpec.update_forward_refs()
+
+SamplingParams.update_forward_refs()
+
+SamplingState.update_forward_refs()
+
 SupportedFeatures.update_forward_refs()
 
 SearchSchemaFeatures.update_forward_refs()
 
+FindFeatures.update_forward_refs()
+
 SetRowFiltersFeatures.update_forward_refs()
 
 GetColumnProfilesFeatures.update_forward_refs()
@@ -1333,6 +1921,10 @@ ExportDataSelectionFeatures.update_forward_refs()
 
 SetSortColumnsFeatures.update_forward_refs()
 
+SetGroupByFeatures.update_forward_refs()
+
+SetSamplingFeatures.update_forward_refs()
+
 DataSelection.update_forward_refs()
 
 DataSelectionSingleCell.update_forward_refs()
@@ -1343,6 +1935,12 @@ DataSelectionRange.update_forward_refs()
 
 DataSelectionIndices.update_forward_refs()
 
+BatchItem.update_forward_refs()
+
+BatchItemResponse.update_forward_refs()
+
+BatchItemError.update_forward_refs()
+
 GetSchemaParams.update_forward_refs()
 
 GetSchemaRequest.update_forward_refs()
@@ -1355,10 +1953,18 @@ GetDataValuesParams.update_forward_refs()
 
 GetDataValuesRequest.update_forward_refs()
 
+FindParams.update_forward_refs()
+
+FindRequest.update_forward_refs()
+
 ExportDataSelectionParams.update_forward_refs()
 
 ExportDataSelectionRequest.update_forward_refs()
 
+ExportDataSelectionToFileParams.update_forward_refs()
+
+ExportDataSelectionToFileRequest.update_forward_refs()
+
 SetRowFiltersParams.update_forward_refs()
 
 SetRowFiltersRequest.update_forward_refs()
@@ -1367,8 +1973,22 @@ SetSortColumnsParams.update_forward_refs()
 
 SetSortColumnsRequest.update_forward_refs()
 
+SetGroupByParams.update_forward_refs()
+
+SetGroupByRequest.update_forward_refs()
+
+SetSamplingParams.update_forward_refs()
+
+SetSamplingRequest.update_forward_refs()
+
 GetColumnProfilesParams.update_forward_refs()
 
 GetColumnProfilesRequest.update_forward_refs()
 
 GetStateRequest.update_forward_refs()
+
+BatchParams.update_forward_refs()
+
+BatchRequest.update_forward_refs()
+
+ExportProgressParams.update_forward_refs()
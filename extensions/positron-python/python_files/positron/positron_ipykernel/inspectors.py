@@ -4,9 +4,12 @@
 #
 from __future__ import annotations
 
+import abc
 import copy
 import datetime
+import hashlib
 import inspect
+import itertools
 import logging
 import numbers
 import pydoc
@@ -32,6 +35,8 @@ from typing import (
     FrozenSet,
     Generic,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Sized,
     Tuple,
@@ -69,6 +74,21 @@ PRINT_WIDTH: int = 100
 ARRAY_THRESHOLD = 20
 ARRAY_EDGEITEMS = 9
 
+# Budget for number of "units" of work to allow for namespace change
+# detection. The costs are defined by `get_comparison_cost` below.
+# Units are rough estimates of the number of bytes copied.
+MAX_SNAPSHOT_COMPARISON_BUDGET: int = 10_000_000
+
+# Fingerprints for change detection hash data buffers in blocks of
+# this many bytes
+FINGERPRINT_BLOCK_SIZE: int = 1 << 20
+
+# If set, buffers larger than this many bytes are fingerprinted from
+# an evenly spaced sample of blocks rather than in full. This keeps
+# very large objects cheap to track, at the cost of missing changes
+# that fall entirely outside of the sampled blocks.
+FINGERPRINT_SAMPLE_THRESHOLD: Optional[int] = None
+
 logger = logging.getLogger(__name__)
 
 #
@@ -98,6 +118,8 @@ class PositronInspector(Generic[T]):
     Base inspector for any type
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
         self.value = value
 
@@ -175,6 +197,31 @@ class PositronInspector(Generic[T]):
         # If the value is immutable, the deepcopy may reference the same value.
         return self.value
 
+    def has_shallow_copy(self) -> bool:
+        """
+        Whether `deepcopy` can share memory with the value because the value's buffers are never
+        mutated in place (e.g. pandas copy-on-write or polars), in which case copying is cheaper
+        than fingerprinting.
+        """
+        return False
+
+    def fingerprint(self) -> Optional[bytes]:
+        """
+        Returns a digest of the value's contents for change detection, or None if the value
+        cannot be fingerprinted, in which case change detection falls back to `deepcopy` and
+        `equals`. Values with equal fingerprints are considered unchanged.
+        """
+        return None
+
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        """
+        Returns the number of bytes of memory used by the value itself, and the objects that it
+        references whose memory should be counted too (see `MemorySizer`). Memory in buffers that
+        may be shared should only be counted if the buffer's key is not in `seen`, after adding
+        it.
+        """
+        return sys.getsizeof(self.value), ()
+
     def to_html(self) -> str:
         return repr(self.value)
 
@@ -210,17 +257,279 @@ class PositronInspector(Generic[T]):
         )
 
 
+def _new_fingerprint(value: Any, *metadata: Any) -> Any:
+    hasher = hashlib.sha1()
+    hasher.update(repr((get_qualname(value),) + metadata).encode())
+    return hasher
+
+
+def _update_fingerprint(hasher: Any, data: np.ndarray) -> None:
+    """
+    Hash a flat uint8 array blockwise, sampling blocks if it exceeds
+    FINGERPRINT_SAMPLE_THRESHOLD.
+    """
+    nbytes = len(data)
+    block_size = FINGERPRINT_BLOCK_SIZE
+    num_blocks = -(-nbytes // block_size)
+
+    step = 1
+    if FINGERPRINT_SAMPLE_THRESHOLD is not None and nbytes > FINGERPRINT_SAMPLE_THRESHOLD:
+        max_blocks = max(FINGERPRINT_SAMPLE_THRESHOLD // block_size, 1)
+        step = -(-num_blocks // max_blocks)
+
+    hasher.update(str(nbytes).encode())
+    for i in range(0, num_blocks, step):
+        hasher.update(data[i * block_size : (i + 1) * block_size])
+    if (num_blocks - 1) % step:
+        # Always include the last block when sampling
+        hasher.update(data[(num_blocks - 1) * block_size :])
+
+
+def _numpy_bytes(array: np.ndarray) -> Optional[np.ndarray]:
+    # Arrays of Python objects hold pointers, not data
+    if array.dtype.hasobject:
+        return None
+    return not_none(np_).ascontiguousarray(array).reshape(-1).view(not_none(np_).uint8)
+
+
+_FINGERPRINT_OBJECT_TYPES = {str, bytes, type(None)}
+
+
+def _update_pandas_fingerprint(hasher: Any, values: Union[pd.Series, pd.Index]) -> bool:
+    """
+    Hash the values of a pandas Series or Index, returning False if they cannot be hashed.
+    """
+    pd = not_none(pd_)
+
+    names = list(values.names) if isinstance(values, pd.Index) else [values.name]
+    hasher.update(repr((str(values.dtype), names, len(values))).encode())
+
+    if isinstance(values, pd.RangeIndex):
+        hasher.update(repr((values.start, values.stop, values.step)).encode())
+        return True
+
+    data = None
+    if isinstance(values.dtype, not_none(np_).dtype):
+        data = _numpy_bytes(values.to_numpy())
+        if data is None:
+            # Object values are hashed by their string form, which
+            # misses in-place changes to mutable objects and confuses
+            # e.g. 1 and "1", so only immutable strings are supported.
+            # Their types are hashed too, since "a" and b"a" (and None
+            # and NaN) hash the same
+            value_types = set(map(type, values))
+            if not value_types <= _FINGERPRINT_OBJECT_TYPES:
+                return False
+            hasher.update(repr(sorted(t.__name__ for t in value_types)).encode())
+    if data is None:
+        # Extension and object dtypes are reduced to one uint64 hash
+        # per value
+        try:
+            hashed = pd.util.hash_pandas_object(values, index=False)
+        except TypeError:
+            # Unhashable values like lists
+            return False
+        data = _numpy_bytes(hashed.to_numpy())
+
+    _update_fingerprint(hasher, not_none(data))
+    return True
+
+
+def _update_polars_fingerprint(hasher: Any, values: pl.Series) -> bool:
+    """
+    Hash the values of a polars Series, returning False if they cannot be hashed.
+    """
+    hasher.update(repr((values.name, str(values.dtype), len(values))).encode())
+    try:
+        hashed = values.hash(seed=0, seed_1=1, seed_2=2, seed_3=3)
+    except Exception:
+        # Not all dtypes support hashing in all polars versions
+        return False
+
+    _update_fingerprint(hasher, not_none(_numpy_bytes(hashed.to_numpy())))
+    return True
+
+
+def _pandas_copy_on_write() -> bool:
+    pd = not_none(pd_)
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except Exception:
+        # The option was introduced in pandas 1.5
+        return False
+
+
+def _pandas_shares_buffers(
+    left: Union[pd.DataFrame, pd.Series], right: Union[pd.DataFrame, pd.Series]
+) -> bool:
+    """
+    Whether two pandas objects hold the same axes and data arrays. Under copy-on-write, arrays
+    referenced by more than one object are copied before being modified, so objects sharing
+    arrays are equal.
+    """
+    if not (
+        isinstance(right, type(left))
+        and left.index.is_(right.index)
+        and (
+            left.columns.is_(right.columns)
+            if isinstance(left, not_none(pd_).DataFrame)
+            else left.name == right.name
+        )
+    ):
+        return False
+
+    try:
+        left_arrays = left._mgr.arrays
+        right_arrays = right._mgr.arrays
+    except AttributeError:
+        return False
+
+    return len(left_arrays) == len(right_arrays) and all(
+        x is y for x, y in zip(left_arrays, right_arrays)
+    )
+
+
+def _polars_buffers(value: Union[pl.DataFrame, pl.Series]) -> Optional[list]:
+    """
+    The addresses of the Arrow buffers backing a polars object, or None if they are not available
+    for one of its dtypes. Buffers shared with a clone are copied before being modified, so while
+    the clone is alive, equal addresses imply equal values.
+    """
+    columns = value.get_columns() if hasattr(value, "get_columns") else [value]
+    result = []
+    try:
+        for column in columns:
+            result.append((column.name, column.dtype))
+            for chunk in column.get_chunks():
+                for buffer in chunk._get_buffers().values():
+                    result.append(None if buffer is None else buffer._get_buffer_info())
+    except Exception:
+        # Nested dtypes don't expose their buffers in all polars versions
+        return None
+    return result
+
+
+def _polars_shares_buffers(
+    left: Union[pl.DataFrame, pl.Series], right: Union[pl.DataFrame, pl.Series]
+) -> bool:
+    left_buffers = _polars_buffers(left)
+    return left_buffers is not None and left_buffers == _polars_buffers(right)
+
+
+def _exceeds_comparison_budget(inspector: PositronInspector) -> bool:
+    """
+    Whether comparing a value in full costs more than the budget for namespace change detection,
+    e.g. after a buffer identity check failed for a value that was cheap to snapshot.
+    """
+    return inspector.get_size() > MAX_SNAPSHOT_COMPARISON_BUDGET
+
+
+def _pandas_memory_footprint(
+    value: Union[pd.DataFrame, pd.Series, pd.Index],
+) -> Tuple[int, Iterable[Any]]:
+    """
+    The memory footprint of a pandas object, as its underlying arrays, so that arrays shared
+    between objects (e.g. views) and the Python objects in object dtype arrays are counted once.
+    """
+    pd = not_none(pd_)
+
+    # Avoid sys.getsizeof, which calls memory_usage(deep=True)
+    size = object.__sizeof__(value)
+
+    if isinstance(value, pd.RangeIndex):
+        return size + value.memory_usage(), ()
+
+    if isinstance(value, pd.MultiIndex):
+        return size, [*value.levels, *value.codes]
+
+    if isinstance(value, pd.DataFrame):
+        arrays = list(value._mgr.arrays)
+        referents = [value.index, value.columns]
+    elif isinstance(value, pd.Series):
+        arrays = [value._values]
+        referents = [value.index]
+    else:
+        arrays = [value._values]
+        referents = []
+
+    for array in arrays:
+        array_size, array_referents = _pandas_array_memory_footprint(array)
+        size += array_size
+        referents.extend(array_referents)
+
+    return size, referents
+
+
+def _pandas_array_memory_footprint(array: Any) -> Tuple[int, List[Any]]:
+    np = not_none(np_)
+    pd = not_none(pd_)
+
+    if isinstance(array, np.ndarray):
+        return 0, [array]
+
+    # Extension arrays backed by NumPy arrays, e.g. datetimes, strings, and
+    # nullable or categorical dtypes
+    referents = [
+        data
+        for data in (
+            getattr(array, name, None) for name in ("_ndarray", "_data", "_mask", "_codes")
+        )
+        if isinstance(data, np.ndarray)
+    ]
+    if isinstance(array, pd.Categorical):
+        referents.append(array.categories)
+    if referents:
+        return object.__sizeof__(array), referents
+
+    # Otherwise e.g. Arrow-backed arrays
+    return object.__sizeof__(array) + array.nbytes, []
+
+
+def _polars_memory_footprint(
+    value: Union[pl.DataFrame, pl.Series], seen: MutableSet[Any]
+) -> Tuple[int, Iterable[Any]]:
+    """
+    The memory footprint of a polars object, counting chunks that share Arrow buffers (e.g. in
+    clones) once.
+    """
+    size = object.__sizeof__(value)
+    columns = value.get_columns() if hasattr(value, "get_columns") else [value]
+    for column in columns:
+        for chunk in column.get_chunks():
+            try:
+                key = tuple(
+                    None if buffer is None else buffer._get_buffer_info()
+                    for buffer in chunk._get_buffers().values()
+                )
+            except Exception:
+                # Nested dtypes don't expose their buffers in all polars versions
+                key = None
+
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            size += chunk.estimated_size()
+    return size, ()
+
+
 #
 # Scalars
 #
 
 
 class NoneInspector(PositronInspector[type(None)]):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return False
 
 
 class BooleanInspector(PositronInspector[bool]):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return False
 
@@ -239,6 +548,8 @@ class BooleanInspector(PositronInspector[bool]):
 
 
 class BytesInspector(PositronInspector[bytes]):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return not isinstance(self.value, bytes)
 
@@ -280,6 +591,8 @@ class BytesInspector(PositronInspector[bytes]):
 
 
 class ObjectInspector(PositronInspector[T], ABC):
+    __slots__ = ()
+
     def has_child(self, key: str) -> bool:
         return hasattr(self.value, key)
 
@@ -299,8 +612,22 @@ class ObjectInspector(PositronInspector[T], ABC):
         else:
             return attr
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        size = sys.getsizeof(self.value)
+
+        # Count instance attributes, but not those of modules and classes,
+        # which are shared by the whole program
+        if isinstance(self.value, (type, types.ModuleType)):
+            return size, ()
+        try:
+            return size, (vars(self.value),)
+        except TypeError:
+            return size, ()
+
 
 class ClassInspector(ObjectInspector[type]):
+    __slots__ = ()
+
     def get_kind(self) -> str:
         return "class"
 
@@ -324,11 +651,15 @@ class ClassInspector(ObjectInspector[type]):
 
 
 class PropertyInspector(PositronInspector[property]):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return False
 
 
 class FunctionInspector(PositronInspector[Callable]):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return False
 
@@ -351,6 +682,8 @@ NT = TypeVar("NT", numbers.Number, "np.number")
 
 
 class NumberInspector(PositronInspector[NT], ABC):
+    __slots__ = ()
+
     def get_display_type(self) -> str:
         ty = type(self.value)
         mod = ty.__module__
@@ -410,6 +743,8 @@ class NumberInspector(PositronInspector[NT], ABC):
 
 
 class NumpyNumberInspector(NumberInspector["np.number"]):
+    __slots__ = ()
+
     CLASS_QNAME = numpy_numeric_scalars
 
     def get_display_value(
@@ -423,6 +758,8 @@ class NumpyNumberInspector(NumberInspector["np.number"]):
 
 
 class StringInspector(PositronInspector[str]):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return False
 
@@ -462,6 +799,8 @@ Timestamp = TypeVar("Timestamp", datetime.datetime, "pd.Timestamp")
 
 
 class _BaseTimestampInspector(PositronInspector[Timestamp], ABC):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return False
 
@@ -482,6 +821,8 @@ class _BaseTimestampInspector(PositronInspector[Timestamp], ABC):
 
 
 class DatetimeInspector(_BaseTimestampInspector[datetime.datetime]):
+    __slots__ = ()
+
     CLASS_QNAME = "datetime.datetime"
 
     @classmethod
@@ -490,6 +831,8 @@ class DatetimeInspector(_BaseTimestampInspector[datetime.datetime]):
 
 
 class PandasTimestampInspector(_BaseTimestampInspector["pd.Timestamp"]):
+    __slots__ = ()
+
     CLASS_QNAME = "pandas._libs.tslibs.timestamps.Timestamp"
 
     @classmethod
@@ -506,6 +849,8 @@ CT = TypeVar("CT", CollectionT, "np.ndarray", "torch.Tensor")
 
 
 class _BaseCollectionInspector(PositronInspector[CT], ABC):
+    __slots__ = ()
+
     def get_kind(self) -> str:
         return "collection"
 
@@ -540,6 +885,8 @@ class _BaseCollectionInspector(PositronInspector[CT], ABC):
 
 
 class CollectionInspector(_BaseCollectionInspector[CollectionT]):
+    __slots__ = ()
+
     def get_display_type(self) -> str:
         # Display length for various collections and maps
         # using the Python notation for the type
@@ -564,6 +911,12 @@ class CollectionInspector(_BaseCollectionInspector[CollectionT]):
             or safe_isinstance(self.value, "fastcore.foundation", "L")
         )
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        size = sys.getsizeof(self.value)
+        if isinstance(self.value, range):
+            return size, ()
+        return size, self.value
+
     def value_to_json(self) -> JsonData:
         if isinstance(self.value, range):
             return {
@@ -603,6 +956,8 @@ Array = TypeVar("Array", "np.ndarray", "torch.Tensor")
 
 
 class _BaseArrayInspector(_BaseCollectionInspector[Array], ABC):
+    __slots__ = ()
+
     def get_kind(self) -> str:
         return "collection" if self.value.ndim > 0 else "number"
 
@@ -648,6 +1003,8 @@ class _BaseArrayInspector(_BaseCollectionInspector[Array], ABC):
 
 
 class NumpyNdarrayInspector(_BaseArrayInspector["np.ndarray"]):
+    __slots__ = ()
+
     CLASS_QNAME = "numpy.ndarray"
 
     def get_display_value(
@@ -669,13 +1026,46 @@ class NumpyNdarrayInspector(_BaseArrayInspector["np.ndarray"]):
     def equals(self, value: np.ndarray) -> bool:
         return not_none(np_).array_equal(self.value, value)
 
+    def has_viewer(self) -> bool:
+        from .data_explorer import _is_numpy_table
+
+        return _is_numpy_table(self.value)
+
     def deepcopy(self) -> np.ndarray:
         # TODO: ndarray.copy() is actually a shallow copy which could cause unexpected behavior for
         #       arrays of Python objects. We should raise a copy.Error in that case.
         return self.value.copy()
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        # Includes the data if the array owns it
+        size = sys.getsizeof(self.value)
+
+        if not self.value.flags.owndata:
+            # A view keeps the data of the array it's a view of alive,
+            # which is counted once
+            base = self.value
+            while isinstance(base.base, not_none(np_).ndarray):
+                base = base.base
+            if id(base) not in seen:
+                seen.add(id(base))
+                size += base.nbytes
+
+        # Arrays of Python objects hold pointers to the objects
+        return size, self.value.flat if self.value.dtype.hasobject else ()
+
+    def fingerprint(self) -> Optional[bytes]:
+        data = _numpy_bytes(self.value)
+        if data is None:
+            return None
+
+        hasher = _new_fingerprint(self.value, str(self.value.dtype), self.value.shape)
+        _update_fingerprint(hasher, data)
+        return hasher.digest()
+
 
 class TorchTensorInspector(_BaseArrayInspector["torch.Tensor"]):
+    __slots__ = ()
+
     CLASS_QNAME = "torch.Tensor"
 
     def get_display_value(
@@ -726,6 +1116,16 @@ class TorchTensorInspector(_BaseArrayInspector["torch.Tensor"]):
 
         return num_elements * self.value.element_size()
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        # Tensors that are views of each other share a storage, which is counted once
+        size = object.__sizeof__(self.value)
+        storage = self.value.untyped_storage()
+        key = ("storage", storage.data_ptr())
+        if key not in seen:
+            seen.add(key)
+            size += storage.nbytes()
+        return size, ()
+
 
 #
 # Maps
@@ -744,6 +1144,8 @@ MT = TypeVar(
 
 
 class _BaseMapInspector(PositronInspector[MT], ABC):
+    __slots__ = ()
+
     def get_kind(self) -> str:
         return "map"
 
@@ -764,9 +1166,20 @@ class _BaseMapInspector(PositronInspector[MT], ABC):
 
 
 class MapInspector(_BaseMapInspector[Mapping]):
+    __slots__ = ()
+
     def get_children(self) -> Collection[Any]:
         return self.value.keys()
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        return sys.getsizeof(self.value), itertools.chain.from_iterable(self.value.items())
+
+    def has_viewer(self) -> bool:
+        # Dicts of equal-length NumPy arrays can be viewed as tables
+        from .data_explorer import _is_numpy_table
+
+        return _is_numpy_table(self.value)
+
     def is_mutable(self) -> bool:
         return isinstance(self.value, MutableMapping)
 
@@ -775,6 +1188,8 @@ Column = TypeVar("Column", "pd.Series", "pl.Series", "pd.Index")
 
 
 class BaseColumnInspector(_BaseMapInspector[Column], ABC):
+    __slots__ = ()
+
     def is_mutable(self) -> bool:
         return True
 
@@ -800,6 +1215,8 @@ class BaseColumnInspector(_BaseMapInspector[Column], ABC):
 
 
 class PandasSeriesInspector(BaseColumnInspector["pd.Series"]):
+    __slots__ = ()
+
     CLASS_QNAME = "pandas.core.series.Series"
 
     def get_display_name(self, key: int) -> str:
@@ -813,13 +1230,39 @@ class PandasSeriesInspector(BaseColumnInspector["pd.Series"]):
         # #so that it shows up in the "data" section
         return "table"
 
+    def get_comparison_cost(self) -> int:
+        if self.has_shallow_copy():
+            return 1
+        return super().get_comparison_cost()
+
+    def has_shallow_copy(self) -> bool:
+        return _pandas_copy_on_write()
+
     def equals(self, value: pd.Series) -> bool:
+        if self.has_shallow_copy():
+            if _pandas_shares_buffers(self.value, value):
+                return True
+            # Too expensive to compare in full, so treat as changed
+            if _exceeds_comparison_budget(self):
+                return False
         return self.value.equals(value)
 
     def deepcopy(self) -> pd.Series:
-        # Copies memory because pandas < 3.0 does not have
-        # copy-on-write.
-        return self.value.copy(deep=True)
+        # Copies memory unless copy-on-write is enabled, which is
+        # opt-in for pandas < 3.0.
+        return self.value.copy(deep=not self.has_shallow_copy())
+
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        return _pandas_memory_footprint(self.value)
+
+    def fingerprint(self) -> Optional[bytes]:
+        hasher = _new_fingerprint(self.value)
+        if not (
+            _update_pandas_fingerprint(hasher, self.value.index)
+            and _update_pandas_fingerprint(hasher, self.value)
+        ):
+            return None
+        return hasher.digest()
 
     def to_html(self) -> str:
         # TODO: Support HTML
@@ -833,6 +1276,8 @@ class PandasSeriesInspector(BaseColumnInspector["pd.Series"]):
 
 
 class PandasIndexInspector(BaseColumnInspector["pd.Index"]):
+    __slots__ = ()
+
     CLASS_QNAME = [
         "pandas.core.indexes.base.Index",
         "pandas.core.indexes.datetimes.DatetimeIndex",
@@ -844,6 +1289,9 @@ class PandasIndexInspector(BaseColumnInspector["pd.Index"]):
     def is_mutable(self) -> bool:
         return False
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        return _pandas_memory_footprint(self.value)
+
     def get_display_value(
         self,
         print_width: Optional[int] = PRINT_WIDTH,
@@ -876,12 +1324,25 @@ class PandasIndexInspector(BaseColumnInspector["pd.Index"]):
 
 
 class PolarsSeriesInspector(BaseColumnInspector["pl.Series"]):
+    __slots__ = ()
+
     CLASS_QNAME = [
         "polars.series.series.Series",
         "polars.internals.series.series.Series",
     ]
 
+    def get_comparison_cost(self) -> int:
+        return 1
+
+    def has_shallow_copy(self) -> bool:
+        return True
+
     def equals(self, value: pl.Series) -> bool:
+        if _polars_shares_buffers(self.value, value):
+            return True
+        # Too expensive to compare in full, so treat as changed
+        if _exceeds_comparison_budget(self):
+            return False
         try:
             return self.value.equals(value)
         except AttributeError:  # polars.Series.equals was introduced in v0.19.16
@@ -892,6 +1353,15 @@ class PolarsSeriesInspector(BaseColumnInspector["pl.Series"]):
         # in this operation.
         return self.value.clone()
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        return _polars_memory_footprint(self.value, seen)
+
+    def fingerprint(self) -> Optional[bytes]:
+        hasher = _new_fingerprint(self.value)
+        if not _update_polars_fingerprint(hasher, self.value):
+            return None
+        return hasher.digest()
+
     def to_html(self) -> str:
         # TODO: Support HTML
         return self.to_plaintext()
@@ -908,6 +1378,8 @@ class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):
     Base inspector for tabular data
     """
 
+    __slots__ = ()
+
     def get_display_type(self) -> str:
         type_name = type(self.value).__name__
         shape = self.value.shape
@@ -946,6 +1418,8 @@ class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):
 
 
 class PandasDataFrameInspector(BaseTableInspector["pd.DataFrame", "pd.Series"]):
+    __slots__ = ()
+
     CLASS_QNAME = "pandas.core.frame.DataFrame"
 
     def get_display_name(self, key: int) -> str:
@@ -957,13 +1431,42 @@ class PandasDataFrameInspector(BaseTableInspector["pd.DataFrame", "pd.Series"]):
     def get_child(self, key: int) -> Any:
         return self.value.iloc[:, key]
 
+    def get_comparison_cost(self) -> int:
+        if self.has_shallow_copy():
+            return self.value.shape[1]
+        return super().get_comparison_cost()
+
+    def has_shallow_copy(self) -> bool:
+        return _pandas_copy_on_write()
+
     def equals(self, value: pd.DataFrame) -> bool:
+        if self.has_shallow_copy():
+            if _pandas_shares_buffers(self.value, value):
+                return True
+            # Too expensive to compare in full, so treat as changed
+            if _exceeds_comparison_budget(self):
+                return False
         return self.value.equals(value)
 
     def deepcopy(self) -> pd.DataFrame:
-        # Copies memory because pandas < 3.0 does not have
-        # copy-on-write.
-        return self.value.copy(deep=True)
+        # Copies memory unless copy-on-write is enabled, which is
+        # opt-in for pandas < 3.0.
+        return self.value.copy(deep=not self.has_shallow_copy())
+
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        return _pandas_memory_footprint(self.value)
+
+    def fingerprint(self) -> Optional[bytes]:
+        hasher = _new_fingerprint(self.value, self.value.shape)
+        if not (
+            _update_pandas_fingerprint(hasher, self.value.columns)
+            and _update_pandas_fingerprint(hasher, self.value.index)
+        ):
+            return None
+        for _, column in self.value.items():
+            if not _update_pandas_fingerprint(hasher, column):
+                return None
+        return hasher.digest()
 
     def to_html(self) -> str:
         return self.value.to_html()
@@ -973,6 +1476,8 @@ class PandasDataFrameInspector(BaseTableInspector["pd.DataFrame", "pd.Series"]):
 
 
 class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
+    __slots__ = ()
+
     CLASS_QNAME = [
         "polars.dataframe.frame.DataFrame",
         "polars.internals.dataframe.frame.DataFrame",
@@ -991,7 +1496,18 @@ class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
         display_value = f"[{shape[0]} rows x {shape[1]} columns] {qualname}"
         return (display_value, True)
 
+    def get_comparison_cost(self) -> int:
+        return self.value.shape[1]
+
+    def has_shallow_copy(self) -> bool:
+        return True
+
     def equals(self, value: pl.DataFrame) -> bool:
+        if _polars_shares_buffers(self.value, value):
+            return True
+        # Too expensive to compare in full, so treat as changed
+        if _exceeds_comparison_budget(self):
+            return False
         try:
             return self.value.equals(value)
         except AttributeError:  # polars.DataFrame.equals was introduced in v0.19.16
@@ -1002,6 +1518,16 @@ class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
         # in this operation.
         return self.value.clone()
 
+    def get_memory_footprint(self, seen: MutableSet[Any]) -> Tuple[int, Iterable[Any]]:
+        return _polars_memory_footprint(self.value, seen)
+
+    def fingerprint(self) -> Optional[bytes]:
+        hasher = _new_fingerprint(self.value, self.value.shape)
+        for column in self.value.get_columns():
+            if not _update_polars_fingerprint(hasher, column):
+                return None
+        return hasher.digest()
+
     def to_html(self) -> str:
         return self.value._repr_html_()
 
@@ -1010,6 +1536,8 @@ class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
 
 
 class BaseConnectionInspector(ObjectInspector):
+    __slots__ = ()
+
     def has_viewer(self) -> bool:
         return self._is_active(self.value)
 
@@ -1028,6 +1556,8 @@ class BaseConnectionInspector(ObjectInspector):
 
 
 class SQLiteConnectionInspector(BaseConnectionInspector):
+    __slots__ = ()
+
     # in older Python versions (eg 3.9) the qualname for sqlite3.Connection is just "Connection"
     CLASS_QNAME = ["Connection", "sqlite3.Connection"]
 
@@ -1041,6 +1571,8 @@ class SQLiteConnectionInspector(BaseConnectionInspector):
 
 
 class SQLAlchemyEngineInspector(BaseConnectionInspector):
+    __slots__ = ()
+
     CLASS_QNAME = ["sqlalchemy.engine.base.Engine"]
 
     def _is_active(self, value) -> bool:
@@ -1052,31 +1584,83 @@ class SQLAlchemyEngineInspector(BaseConnectionInspector):
         return True
 
 
-INSPECTOR_CLASSES: Dict[str, Type[PositronInspector]] = {
-    PandasDataFrameInspector.CLASS_QNAME: PandasDataFrameInspector,
-    PandasSeriesInspector.CLASS_QNAME: PandasSeriesInspector,
-    **dict.fromkeys(PandasIndexInspector.CLASS_QNAME, PandasIndexInspector),
-    PandasTimestampInspector.CLASS_QNAME: PandasTimestampInspector,
-    **dict.fromkeys(NumpyNumberInspector.CLASS_QNAME, NumpyNumberInspector),
-    NumpyNdarrayInspector.CLASS_QNAME: NumpyNdarrayInspector,
-    TorchTensorInspector.CLASS_QNAME: TorchTensorInspector,
-    **dict.fromkeys(PolarsDataFrameInspector.CLASS_QNAME, PolarsDataFrameInspector),
-    **dict.fromkeys(PolarsSeriesInspector.CLASS_QNAME, PolarsSeriesInspector),
-    DatetimeInspector.CLASS_QNAME: DatetimeInspector,
-    **dict.fromkeys(SQLiteConnectionInspector.CLASS_QNAME, SQLiteConnectionInspector),
-    **dict.fromkeys(SQLAlchemyEngineInspector.CLASS_QNAME, SQLAlchemyEngineInspector),
-    "boolean": BooleanInspector,
-    "bytes": BytesInspector,
-    "class": ClassInspector,
-    "collection": CollectionInspector,
-    "empty": NoneInspector,
-    "function": FunctionInspector,
-    "map": MapInspector,
-    "number": NumberInspector,
-    "other": ObjectInspector,
-    "property": PropertyInspector,
-    "string": StringInspector,
-}
+# Cache of the inspector class resolved for each type, see `get_inspector`
+_INSPECTOR_CLASS_CACHE: Dict[type, Type[PositronInspector]] = {}
+
+# Maximum number of types in the inspector class cache, in case of
+# dynamically created types
+_INSPECTOR_CLASS_CACHE_SIZE = 1024
+
+# ABC cache token that the inspector class cache is valid for, since
+# registering virtual subclasses of ABCs can change a type's kind
+_inspector_class_cache_token = abc.get_cache_token()
+
+
+class _InspectorClasses(dict):
+    """
+    Inspector classes by qualified class name or kind. Changes invalidate the inspector class cache.
+    """
+
+    def __setitem__(self, key: str, value: Type[PositronInspector]) -> None:
+        super().__setitem__(key, value)
+        _INSPECTOR_CLASS_CACHE.clear()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        _INSPECTOR_CLASS_CACHE.clear()
+
+    def __ior__(self, other: Any) -> _InspectorClasses:
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        _INSPECTOR_CLASS_CACHE.clear()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        _INSPECTOR_CLASS_CACHE.clear()
+        return super().setdefault(key, default)
+
+    def pop(self, key: str, *args: Any) -> Any:
+        _INSPECTOR_CLASS_CACHE.clear()
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[str, Type[PositronInspector]]:
+        _INSPECTOR_CLASS_CACHE.clear()
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        _INSPECTOR_CLASS_CACHE.clear()
+
+
+INSPECTOR_CLASSES: Dict[str, Type[PositronInspector]] = _InspectorClasses(
+    {
+        PandasDataFrameInspector.CLASS_QNAME: PandasDataFrameInspector,
+        PandasSeriesInspector.CLASS_QNAME: PandasSeriesInspector,
+        **dict.fromkeys(PandasIndexInspector.CLASS_QNAME, PandasIndexInspector),
+        PandasTimestampInspector.CLASS_QNAME: PandasTimestampInspector,
+        **dict.fromkeys(NumpyNumberInspector.CLASS_QNAME, NumpyNumberInspector),
+        NumpyNdarrayInspector.CLASS_QNAME: NumpyNdarrayInspector,
+        TorchTensorInspector.CLASS_QNAME: TorchTensorInspector,
+        **dict.fromkeys(PolarsDataFrameInspector.CLASS_QNAME, PolarsDataFrameInspector),
+        **dict.fromkeys(PolarsSeriesInspector.CLASS_QNAME, PolarsSeriesInspector),
+        DatetimeInspector.CLASS_QNAME: DatetimeInspector,
+        **dict.fromkeys(SQLiteConnectionInspector.CLASS_QNAME, SQLiteConnectionInspector),
+        **dict.fromkeys(SQLAlchemyEngineInspector.CLASS_QNAME, SQLAlchemyEngineInspector),
+        "boolean": BooleanInspector,
+        "bytes": BytesInspector,
+        "class": ClassInspector,
+        "collection": CollectionInspector,
+        "empty": NoneInspector,
+        "function": FunctionInspector,
+        "map": MapInspector,
+        "number": NumberInspector,
+        "other": ObjectInspector,
+        "property": PropertyInspector,
+        "string": StringInspector,
+    }
+)
 
 #
 # Helper functions
@@ -1084,6 +1668,40 @@ INSPECTOR_CLASSES: Dict[str, Type[PositronInspector]] = {
 
 
 def get_inspector(value: T) -> PositronInspector[T]:
+    global _inspector_class_cache_token
+
+    token = abc.get_cache_token()
+    if token != _inspector_class_cache_token:
+        _INSPECTOR_CLASS_CACHE.clear()
+        _inspector_class_cache_token = token
+
+    value_type = type(value)
+    inspector_cls = _INSPECTOR_CLASS_CACHE.get(value_type)
+
+    if inspector_cls is None:
+        inspector_cls = _get_inspector_class(value)
+
+        if _is_inspector_class_cacheable(value):
+            if len(_INSPECTOR_CLASS_CACHE) >= _INSPECTOR_CLASS_CACHE_SIZE:
+                _INSPECTOR_CLASS_CACHE.clear()
+            _INSPECTOR_CLASS_CACHE[value_type] = inspector_cls
+
+    return inspector_cls(value)
+
+
+def _is_inspector_class_cacheable(value: Any) -> bool:
+    # The inspector class only depends on the value's type if its
+    # qualname is looked up on the type (see `get_qualname`), and if
+    # `isinstance` checks see the same type
+    return not (
+        isinstance(value, (type, property, types.ModuleType))
+        or callable(value)
+        or inspect.isgetsetdescriptor(value)
+        or value.__class__ is not type(value)
+    )
+
+
+def _get_inspector_class(value: Any) -> Type[PositronInspector]:
     # Look for a specific inspector by qualified classname
     if isinstance(value, type):
         qualname = "type"
@@ -1102,9 +1720,7 @@ def get_inspector(value: T) -> PositronInspector[T]:
     if inspector_cls is None:
         inspector_cls = PositronInspector
 
-    inspector = inspector_cls(value)
-
-    return inspector
+    return inspector_cls
 
 
 def _get_kind(value: Any) -> str:
@@ -1128,3 +1744,83 @@ def _get_kind(value: Any) -> str:
         return "other"
     else:
         return "empty"
+
+
+class MemorySizer:
+    """
+    Computes the deep memory size of a value, i.e. including the memory of the objects that it
+    references (see `PositronInspector.get_memory_footprint`), counting each object and shared
+    buffer once. The objects are visited in steps, so that the size of large values can be
+    computed incrementally.
+    """
+
+    __slots__ = ("size", "_seen", "_stack")
+
+    def __init__(self, value: Any) -> None:
+        self.size = 0
+        self._seen: MutableSet[Any] = set()
+        self._stack: List[Iterator[Any]] = [iter((value,))]
+
+    def step(self, max_objects: Optional[int] = None) -> bool:
+        """
+        Visits up to `max_objects` objects (or all if None), returning whether the size is
+        complete.
+        """
+        stack = self._stack
+        seen = self._seen
+        num_objects = 0
+        while stack:
+            if max_objects is not None and num_objects >= max_objects:
+                return False
+
+            try:
+                value = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+            except RuntimeError:
+                # The container changed size since the last step
+                stack.pop()
+                continue
+
+            num_objects += 1
+            value_type = type(value)
+
+            # Fast path for numbers, which don't reference other objects,
+            # and aren't tracked in `seen` to limit its size, except for
+            # cached small ints
+            if (value_type is int and not -5 <= value <= 256) or value_type is float:
+                self.size += sys.getsizeof(value)
+                continue
+
+            key = id(value)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if value_type is str or value_type is bytes or value_type is int:
+                self.size += sys.getsizeof(value)
+                continue
+
+            try:
+                size, referents = get_inspector(value).get_memory_footprint(seen)
+            except Exception:
+                logger.debug(f"Failed to get the memory footprint of {type(value)}", exc_info=True)
+                try:
+                    size, referents = sys.getsizeof(value), ()
+                except Exception:
+                    size, referents = 0, ()
+
+            self.size += size
+            stack.append(iter(referents))
+
+        return True
+
+
+def get_memory_size(value: Any) -> int:
+    """
+    Returns the deep memory size of a value in bytes, see `MemorySizer`.
+    """
+    sizer = MemorySizer(value)
+    sizer.step()
+    return sizer.size
@@ -25,7 +25,13 @@ from ipykernel.zmqshell import ZMQDisplayPublisher, ZMQInteractiveShell
 from IPython.core import magic_arguments, oinspect, page
 from IPython.core.error import UsageError
 from IPython.core.interactiveshell import ExecutionInfo, InteractiveShell
-from IPython.core.magic import Magics, MagicsManager, line_magic, magics_class
+from IPython.core.magic import (
+    Magics,
+    MagicsManager,
+    line_cell_magic,
+    line_magic,
+    magics_class,
+)
 from IPython.utils import PyColorize
 
 from .access_keys import encode_access_key
@@ -34,10 +40,20 @@ from .data_explorer import DataExplorerService
 from .help import HelpService, help
 from .lsp import LSPService
 from .plots import PlotsService
+from .profiler import (
+    DEFAULT_ALLOCATION_FRAMES,
+    DEFAULT_ALLOCATION_SITES,
+    DEFAULT_INTERVAL,
+    Profiler,
+    ProfilerService,
+    display_text,
+    format_flat_profile,
+    get_title,
+)
 from .session_mode import SessionMode
 from .ui import UiService
 from .utils import JsonRecord, get_qualname
-from .variables import VariablesService
+from .variables import TrackedNamespace, VariablesService
 from .widget import PositronWidgetHook
 
 
@@ -190,6 +206,122 @@ class PositronMagics(Magics):
         except TypeError:
             raise UsageError(f"cannot show object of type '{get_qualname(info.obj)}'")
 
+    @line_cell_magic
+    def profile(self, line: str, cell: Optional[str] = None) -> None:
+        """
+        Profile a statement or cell with a low-overhead sampling profiler.
+
+        The flat profile is opened in the Positron Data Explorer, or shown as text if neither pandas
+        nor polars is installed.
+
+        Usage, in line mode:
+          %profile [-i INTERVAL] [-q] statement
+          %profile [-i INTERVAL] on
+          %profile off
+
+        Usage, in cell mode:
+          %%profile [-i INTERVAL] [-q]
+          code...
+
+        Options:
+
+        -i INTERVAL: the interval between samples in seconds (default: 0.005).
+
+        -q: don't open the flat profile in the Data Explorer.
+
+        `%profile on` profiles every following cell execution, showing the functions with the most
+        samples after each one, until `%profile off`.
+
+        Examples
+        --------
+        Profile a statement:
+
+        >>> %profile fit(model, data)
+        """
+        opts, code = self.parse_options(line, "i:q", posix=False, strict=False)
+        try:
+            interval = float(opts.get("i", DEFAULT_INTERVAL))
+            # Validate the interval
+            profiler = Profiler(interval)
+        except ValueError:
+            raise UsageError(f"invalid sampling interval: {opts['i']}")
+
+        service = self.shell.kernel.profiler_service
+        # Don't profile the cell that runs this magic
+        service.cancel_cell()
+
+        if cell is None and code.strip() in ("on", "off"):
+            service.profile_cells = code.strip() == "on"
+            service.interval = interval
+            return
+
+        if cell is not None:
+            code = cell
+        if not code.strip():
+            raise UsageError("nothing to profile")
+
+        title = get_title(code)
+        source = self.shell.transform_cell(code)
+        code_obj = self.shell.compile(source, self.shell.compile.cache(source), "exec")
+        try:
+            profiler.runctx(code_obj, self.shell.user_global_ns, self.shell.user_ns)
+        finally:
+            if "q" not in opts and not service.view(profiler, title):
+                display_text(format_flat_profile(profiler))
+
+    @magic_arguments.magic_arguments()
+    @magic_arguments.argument(
+        "state",
+        choices=["on", "off"],
+        help="Whether to track the memory allocated by each cell execution.",
+    )
+    @magic_arguments.argument(
+        "-f",
+        "--frames",
+        type=int,
+        default=DEFAULT_ALLOCATION_FRAMES,
+        help=(
+            "The number of frames to record per allocation. More frames distinguish allocation "
+            "sites better, but slow down execution. Ignored if tracemalloc is already tracing."
+        ),
+    )
+    @magic_arguments.argument(
+        "-n",
+        "--sites",
+        type=int,
+        default=DEFAULT_ALLOCATION_SITES,
+        help="The number of allocation sites to report per execution.",
+    )
+    @line_magic
+    def trace_allocations(self, line: str) -> None:
+        """
+        Track the memory allocated by each cell execution using tracemalloc.
+
+        After each execution, the allocation sites with the largest net growth in memory are shown,
+        along with the variables holding memory allocated there.
+
+        Examples
+        --------
+        Track allocations, recording 5 frames per allocation:
+
+        >>> %trace_allocations -f 5 on
+
+        Stop tracking allocations:
+
+        >>> %trace_allocations off
+        """
+        args = magic_arguments.parse_argstring(self.trace_allocations, line)
+
+        service = self.shell.kernel.profiler_service
+        if args.state == "off":
+            service.disable_allocation_tracking()
+            return
+
+        try:
+            service.enable_allocation_tracking(args.frames, args.sites)
+        except ValueError as exception:
+            raise UsageError(str(exception))
+
 
 _traceback_file_link_re = re.compile(r"^(File \x1b\[\d+;\d+m)(.+):(\d+)")
 
@@ -208,6 +340,16 @@ class PositronShell(ZMQInteractiveShell):
         help="Class to use to instantiate the shell inspector",
     ).tag(config=True)
 
+    track_user_ns = traitlets.Bool(
+        False,
+        help=(
+            "Record the names assigned and deleted in the user namespace, so that only those are "
+            "checked for changes after each execution. This speeds up change detection for large "
+            "namespaces, but slows down name lookups and assignments in user code, and misses "
+            "names bound by functions via a `global` statement."
+        ),
+    ).tag(config=True)
+
     # Positron-specific attributes:
     session_mode: SessionMode = SessionMode.trait()  # type: ignore
 
@@ -257,6 +399,9 @@ class PositronShell(ZMQInteractiveShell):
         self.register_magics(PositronMagics)
 
     def init_user_ns(self):
+        if self.track_user_ns:
+            self._init_tracked_user_ns()
+
         super().init_user_ns()
 
         # Use Positron's help service
@@ -273,6 +418,18 @@ class PositronShell(ZMQInteractiveShell):
             }
         )
 
+    def _init_tracked_user_ns(self) -> None:
+        # Only supported when the user namespace is also the global namespace i.e. when not
+        # embedded
+        if isinstance(self.user_ns, TrackedNamespace) or self.user_ns is not self.user_global_ns:
+            return
+
+        self.user_module, self.user_ns = self.prepare_user_module(
+            user_ns=TrackedNamespace(self.user_ns)
+        )
+        self.ns_table.update(user_global=self.user_global_ns, user_local=self.user_ns)
+        self.init_sys_modules()
+
     def _handle_pre_run_cell(self, info: ExecutionInfo) -> None:
         """
         Prior to execution, reset the user environment watch state.
@@ -282,12 +439,22 @@ class PositronShell(ZMQInteractiveShell):
         except Exception:
             logger.warning("Failed to snapshot user namespace", exc_info=True)
 
+        try:
+            self.kernel.profiler_service.start_cell()
+        except Exception:
+            logger.exception("Error starting the profiler")
+
     def _handle_post_run_cell(self, info: ExecutionInfo) -> None:
         """
         After execution, sends an update message to the client to summarize
         the changes observed to variables in the user's environment.
         """
         # TODO: Split these to separate callbacks?
+        try:
+            self.kernel.profiler_service.stop_cell()
+        except Exception:
+            logger.exception("Error stopping the profiler")
+
         # Check for changes to the working directory
         try:
             self.kernel.ui_service.poll_working_directory()
@@ -414,6 +581,7 @@ class PositronIPyKernel(IPythonKernel):
         self.variables_service = VariablesService(self)
         self.widget_hook = PositronWidgetHook(_CommTarget.Widget, self.comm_manager)
         self.connections_service = ConnectionsService(self, _CommTarget.Connections)
+        self.profiler_service = ProfilerService(self)
 
         # Register comm targets
         self.comm_manager.register_target(_CommTarget.Lsp, self.lsp_service.on_comm_open)
@@ -470,6 +638,7 @@ class PositronIPyKernel(IPythonKernel):
         self.widget_hook.shutdown()
         await self.variables_service.shutdown()
         self.connections_service.shutdown()
+        self.profiler_service.shutdown()
 
         # We don't call super().do_shutdown since it sets shell.exit_now = True which tries to
         # stop the event loop at the same time as self.shutdown_request (since self.shell_stream.io_loop
@@ -0,0 +1,530 @@
+#
+# Copyright (C) 2024 Posit Software, PBC. All rights reserved.
+# Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
+#
+from __future__ import annotations
+
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import islice
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from IPython.core.interactiveshell import InteractiveShell
+from IPython.display import display
+
+from .inspectors import get_inspector
+from .third_party import pd_, pl_
+
+if TYPE_CHECKING:
+    from .positron_ipkernel import PositronIPyKernel
+
+# The default interval between samples, in seconds. Taking a sample costs in the order of ten
+# microseconds for typical call stacks, so this keeps the overhead well under one percent.
+DEFAULT_INTERVAL = 0.005
+
+# The maximum length of a profile's title.
+MAX_TITLE_LENGTH = 80
+
+# The default number of frames recorded per traced allocation. Tracing and snapshots get slower
+# with more frames.
+DEFAULT_ALLOCATION_FRAMES = 1
+
+# The number of functions shown after each cell execution profiled with `%profile on`.
+CELL_PROFILE_ROWS = 5
+
+# The default number of allocation sites reported per execution.
+DEFAULT_ALLOCATION_SITES = 10
+
+# The maximum number of objects referenced by a variable that are checked for whether they were
+# allocated at a reported site.
+MAX_REFERENTS = 100
+
+# A call stack, from the outermost to the innermost frame.
+Stack = Tuple[CodeType, ...]
+
+# The profiler whose stack is sampled by the SIGPROF handler.
+_signal_profiler: Optional[Profiler] = None
+
+
+def _handle_sigprof(signum: int, frame: Optional[FrameType]) -> None:
+    profiler = _signal_profiler
+    if profiler is not None:
+        profiler._sample(frame)
+
+
+class Profiler:
+    """
+    A statistical profiler that periodically samples the call stack of the thread that started it.
+
+    On POSIX systems, when started from the main thread, samples are taken by a SIGPROF handler
+    that is driven by a timer on the process' CPU time. Otherwise, for example on Windows or if
+    SIGPROF is already handled, a background thread samples the stack on wall-clock time.
+
+    Only frames of the user's code are recorded, that is, frames called from IPython's `run_code`
+    or from `Profiler.runctx`.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        if interval <= 0:
+            raise ValueError(f"Sampling interval must be positive, got: {interval}")
+
+        self.interval = interval
+        self.stacks: Dict[Stack, int] = defaultdict(int)
+        self.elapsed = 0.0
+
+        self._start_time: Optional[float] = None
+        self._thread_id: Optional[int] = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._start_time is not None
+
+    @property
+    def num_samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def start(self) -> None:
+        """
+        Starts sampling the current thread's call stack.
+        """
+        global _signal_profiler
+
+        if self.is_running:
+            raise RuntimeError("The profiler is already running")
+
+        self._thread_id = threading.get_ident()
+        if (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+            and _signal_profiler is None
+            # Don't replace a handler installed by the user.
+            and signal.getsignal(signal.SIGPROF) in (signal.SIG_DFL, _handle_sigprof)
+        ):
+            _signal_profiler = self
+            signal.signal(signal.SIGPROF, _handle_sigprof)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._stop_event.clear()
+            self._sampler_thread = threading.Thread(
+                target=self._run_sampler, name="PositronProfiler", daemon=True
+            )
+            self._sampler_thread.start()
+
+        self._start_time = time.perf_counter()
+
+    def stop(self) -> None:
+        """
+        Stops sampling. The profiler can be restarted to add more samples.
+        """
+        global _signal_profiler
+
+        if self._start_time is None:
+            return
+
+        self.elapsed += time.perf_counter() - self._start_time
+        self._start_time = None
+
+        if self._sampler_thread is None:
+            # Leave our (no-op) handler installed. Restoring the default handler would terminate
+            # the process on a pending signal.
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            _signal_profiler = None
+        else:
+            self._stop_event.set()
+            self._sampler_thread.join()
+            self._sampler_thread = None
+
+    def runctx(self, code: CodeType, globals: Dict[str, Any], locals: Dict[str, Any]) -> None:
+        """
+        Executes compiled code while sampling its call stack.
+        """
+        self.start()
+        try:
+            exec(code, globals, locals)
+        finally:
+            self.stop()
+
+    def get_flat_profile(self) -> Dict[str, List[Any]]:
+        """
+        Returns the flat profile as columns, with a row per function ordered by the number of
+        samples in which it was executing. Times are estimated from the number of samples.
+        """
+        self_samples: Dict[CodeType, int] = defaultdict(int)
+        total_samples: Dict[CodeType, int] = defaultdict(int)
+        for stack, count in self.stacks.items():
+            self_samples[stack[-1]] += count
+            # Count recursive functions once per sample.
+            for code in set(stack):
+                total_samples[code] += count
+
+        codes = sorted(total_samples, key=lambda code: (-self_samples[code], -total_samples[code]))
+        num_samples = max(self.num_samples, 1)
+        return {
+            "function": [_get_function_name(code) for code in codes],
+            "filename": [code.co_filename for code in codes],
+            "line_number": [code.co_firstlineno for code in codes],
+            "self_samples": [self_samples[code] for code in codes],
+            "total_samples": [total_samples[code] for code in codes],
+            "self_time": [self_samples[code] * self.interval for code in codes],
+            "total_time": [total_samples[code] * self.interval for code in codes],
+            "self_percent": [100 * self_samples[code] / num_samples for code in codes],
+            "total_percent": [100 * total_samples[code] / num_samples for code in codes],
+        }
+
+    def _run_sampler(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)  # type: ignore
+            self._sample(frame)
+
+    def _sample(self, frame: Optional[FrameType]) -> None:
+        stack: List[CodeType] = []
+        while frame is not None:
+            code = frame.f_code
+            if code in _ROOT_CODES:
+                if stack and stack[-1] not in _PROFILER_CODES:
+                    stack.reverse()
+                    self.stacks[tuple(stack)] += 1
+                return
+            stack.append(code)
+            frame = frame.f_back
+
+
+# Code objects whose callees are the user's code.
+_ROOT_CODES = frozenset([InteractiveShell.run_code.__code__, Profiler.runctx.__code__])
+
+# Code objects of the profiler itself, which may be sampled while starting or stopping.
+_PROFILER_CODES = frozenset([Profiler.start.__code__, Profiler.stop.__code__])
+
+
+def _get_function_name(code: CodeType) -> str:
+    # co_qualname is only available in Python 3.11+.
+    return getattr(code, "co_qualname", code.co_name)
+
+
+def format_flat_profile(profiler: Profiler, max_rows: int = 20) -> str:
+    """
+    Formats the functions with the most samples in a profile as text.
+    """
+    columns = profiler.get_flat_profile()
+    lines = [
+        f"{profiler.num_samples} samples in {profiler.elapsed:.3f}s",
+        f"{'self %':>7} {'total %':>7}  function",
+    ]
+    for i in range(min(len(columns["function"]), max_rows)):
+        lines.append(
+            f"{columns['self_percent'][i]:7.1f} {columns['total_percent'][i]:7.1f}  "
+            f"{columns['function'][i]} ({columns['filename'][i]}:{columns['line_number'][i]})"
+        )
+    return "\n".join(lines)
+
+
+def _format_size_diff(size_diff: int) -> str:
+    size = float(abs(size_diff))
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            break
+        size /= 1024
+    else:
+        unit = "GiB"
+    sign = "-" if size_diff < 0 else "+"
+    return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+
+
+def format_allocations(size_diff: int, sites: List[AllocationSite]) -> str:
+    """
+    Formats the net change in traced memory of an execution and its allocation sites as text.
+    """
+    lines = [f"Memory: {_format_size_diff(size_diff)} net"]
+    for site in sites:
+        # Frames are ordered from the most recent frame.
+        frame = site.frames[0]
+        line = (
+            f"{_format_size_diff(site.size_diff):>12} {site.count_diff:>+8} blocks  "
+            f"{frame.filename}:{frame.line_number}"
+        )
+        if site.variables:
+            line += f"  ({', '.join(site.variables)})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def display_text(text: str) -> None:
+    """
+    Displays plain text in the output of the current execution.
+    """
+    display({"text/plain": text}, raw=True)
+
+
+@dataclass
+class AllocationFrame:
+    """
+    A frame in the call stack of an allocation.
+    """
+
+    filename: str
+    line_number: int
+
+
+@dataclass
+class AllocationSite:
+    """
+    A call stack at which memory was allocated.
+    """
+
+    # The frames of the call stack, most recent first.
+    frames: List[AllocationFrame]
+    # The net growth of the memory allocated at this site, in bytes.
+    size_diff: int
+    # The net growth of the number of memory blocks allocated at this site.
+    count_diff: int
+    # The names of the variables holding memory allocated at this site, where known.
+    variables: List[str]
+
+
+def get_title(code: str) -> str:
+    """
+    Returns a short title for profiling some code: its first non-blank line.
+    """
+    for line in code.splitlines():
+        line = line.strip()
+        if line:
+            if len(line) > MAX_TITLE_LENGTH:
+                line = line[: MAX_TITLE_LENGTH - 3] + "..."
+            return line
+    return ""
+
+
+class AllocationTracker:
+    """
+    Tracks the memory allocated by executions, by comparing tracemalloc snapshots taken before and
+    after each execution.
+
+    Tracing slows down all allocations, and taking a snapshot takes time proportional to the
+    number of live memory blocks. Both costs grow with the number of frames recorded per
+    allocation.
+    """
+
+    def __init__(
+        self, nframes: int = DEFAULT_ALLOCATION_FRAMES, max_sites: int = DEFAULT_ALLOCATION_SITES
+    ) -> None:
+        if nframes < 1:
+            raise ValueError(f"Number of frames must be positive, got: {nframes}")
+        if max_sites < 1:
+            raise ValueError(f"Number of allocation sites must be positive, got: {max_sites}")
+
+        self.nframes = nframes
+        self.max_sites = max_sites
+
+        self._started_tracing = False
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._snapshot is not None
+
+    def enable(self) -> None:
+        """
+        Starts tracing allocations, unless they're already being traced.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started_tracing = True
+
+    def disable(self) -> None:
+        """
+        Stops tracing allocations, if tracing was started by `enable`.
+        """
+        self._snapshot = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def start(self) -> None:
+        """
+        Takes a snapshot before an execution.
+        """
+        self._snapshot = _take_snapshot()
+
+    def stop(self, variables: Mapping[str, Any]) -> Tuple[int, List[AllocationSite]]:
+        """
+        Takes a snapshot after an execution, returning the net change in traced memory and the
+        allocation sites with the largest net growth. Sites are annotated with the given variables
+        that hold memory allocated there.
+        """
+        before = self._snapshot
+        if before is None:
+            raise RuntimeError("The allocation tracker is not running")
+        self._snapshot = None
+
+        diffs = _take_snapshot().compare_to(before, "traceback")
+        size_diff = sum(diff.size_diff for diff in diffs)
+        diffs = sorted(
+            (diff for diff in diffs if diff.size_diff > 0),
+            key=lambda diff: diff.size_diff,
+            reverse=True,
+        )[: self.max_sites]
+
+        site_variables: Dict[tracemalloc.Traceback, List[str]] = {
+            diff.traceback: [] for diff in diffs
+        }
+        if site_variables:
+            for name, value in variables.items():
+                for traceback in _get_allocation_tracebacks(value):
+                    names = site_variables.get(traceback)
+                    if names is not None and name not in names:
+                        names.append(name)
+
+        sites = [
+            AllocationSite(
+                # Tracebacks are ordered from the oldest frame.
+                frames=[
+                    AllocationFrame(filename=frame.filename, line_number=frame.lineno)
+                    for frame in reversed(diff.traceback)
+                ],
+                size_diff=diff.size_diff,
+                count_diff=diff.count_diff,
+                variables=site_variables[diff.traceback],
+            )
+            for diff in diffs
+        ]
+        return size_diff, sites
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    # Exclude allocations by tracemalloc and the profiler themselves.
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+    )
+
+
+def _get_allocation_tracebacks(value: Any) -> List[tracemalloc.Traceback]:
+    """
+    Returns where a value and (some of) the objects that it references were allocated.
+    """
+    objects = [value]
+    try:
+        _, referents = get_inspector(value).get_memory_footprint(set())
+        objects.extend(islice(referents, MAX_REFERENTS))
+    except Exception:
+        pass
+
+    tracebacks = []
+    for obj in objects:
+        traceback = tracemalloc.get_object_traceback(obj)
+        if traceback is not None:
+            tracebacks.append(traceback)
+    return tracebacks
+
+
+class ProfilerService:
+    """
+    Profiles and tracks the allocations of code executed in the kernel.
+    """
+
+    def __init__(self, kernel: PositronIPyKernel) -> None:
+        self._kernel = kernel
+
+        # Whether to profile each cell execution, and the sampling interval to use.
+        self.profile_cells = False
+        self.interval = DEFAULT_INTERVAL
+
+        # Tracks the memory allocated by each cell execution, if enabled.
+        self.allocation_tracker: Optional[AllocationTracker] = None
+
+        self._cell_profiler: Optional[Profiler] = None
+
+    def enable_allocation_tracking(self, nframes: int, max_sites: int) -> None:
+        """
+        Starts tracking the memory allocated by each cell execution.
+        """
+        tracker = AllocationTracker(nframes, max_sites)
+        self.disable_allocation_tracking()
+        tracker.enable()
+        self.allocation_tracker = tracker
+
+    def disable_allocation_tracking(self) -> None:
+        """
+        Stops tracking the memory allocated by each cell execution.
+        """
+        if self.allocation_tracker is not None:
+            self.allocation_tracker.disable()
+            self.allocation_tracker = None
+
+    def start_cell(self) -> None:
+        """
+        Starts profiling and tracking the allocations of a cell execution, if enabled.
+        """
+        if self.profile_cells and self._cell_profiler is None:
+            profiler = Profiler(self.interval)
+            profiler.start()
+            self._cell_profiler = profiler
+
+        # Take the snapshot last, to exclude the allocations above.
+        if self.allocation_tracker is not None:
+            self.allocation_tracker.start()
+
+    def stop_cell(self) -> None:
+        """
+        Stops profiling and tracking the allocations of a cell execution, displaying a summary of
+        the results in the cell's output.
+        """
+        # Take the snapshot first, to exclude the allocations below.
+        tracker = self.allocation_tracker
+        if tracker is not None and tracker.is_running:
+            size_diff, sites = tracker.stop(self._get_user_variables())
+            if sites:
+                display_text(format_allocations(size_diff, sites))
+
+        profiler = self._cell_profiler
+        if profiler is None:
+            return
+
+        self._cell_profiler = None
+        profiler.stop()
+        if profiler.num_samples > 0:
+            display_text(format_flat_profile(profiler, CELL_PROFILE_ROWS))
+
+    def cancel_cell(self) -> None:
+        """
+        Stops profiling a cell execution, discarding its profile.
+        """
+        if self._cell_profiler is not None:
+            self._cell_profiler.stop()
+            self._cell_profiler = None
+
+    def view(self, profiler: Profiler, title: str) -> bool:
+        """
+        Opens a profile's flat profile in the data explorer. Returns False if there's no supported
+        dataframe library to open it with.
+        """
+        columns = profiler.get_flat_profile()
+        if pd_ is not None:
+            table = pd_.DataFrame(columns)
+        elif pl_ is not None:
+            table = pl_.DataFrame(columns)
+        else:
+            return False
+
+        self._kernel.data_explorer_service.register_table(table, f"Profile: {title}")
+        return True
+
+    def shutdown(self) -> None:
+        self.cancel_cell()
+        self.disable_allocation_tracking()
+
+    def _get_user_variables(self) -> Dict[str, Any]:
+        shell = self._kernel.shell
+        hidden = shell.user_ns_hidden or {}
+        return {name: value for name, value in (shell.user_ns or {}).items() if name not in hidden}
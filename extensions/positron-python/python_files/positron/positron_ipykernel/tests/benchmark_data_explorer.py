@@ -0,0 +1,551 @@
+#
+# Copyright (C) 2024 Posit Software, PBC. All rights reserved.
+# Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
+#
+
+"""
+Latency and memory benchmarks for the data explorer backend.
+
+Synthetic pandas and polars tables with mixed dtypes and nulls are
+registered with a DataExplorerService and driven through a fake comm,
+so that each measured request pays the same parsing and dispatch
+costs as a request coming from the frontend.
+
+Run with e.g.:
+
+    python -m positron_ipykernel.tests.benchmark_data_explorer \\
+        --backends pandas polars --rows 1000000 --columns 10 1000 \\
+        --output results.json
+
+The JSON output is intended to be diffed between runs for regression
+tracking. The default grid (up to 100M rows by 10,000 columns) needs a
+large-memory machine; use --rows and --columns to select a subset.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import comm
+
+from ..data_explorer import DataExplorerService
+from ..utils import guid
+from .utils import json_rpc_request
+
+DEFAULT_ROWS = [1_000_000, 10_000_000, 100_000_000]
+DEFAULT_COLUMNS = [10, 100, 1_000, 10_000]
+DEFAULT_BACKENDS = ["pandas", "polars"]
+
+OPERATIONS = [
+    "get_schema",
+    "get_data_values",
+    "set_row_filters",
+    "set_sort_columns",
+    "get_column_profiles",
+    "search_schema",
+    "export_data_selection",
+]
+
+# The dtypes cycled through when generating columns
+COLUMN_KINDS = ["int", "float", "string", "bool", "datetime", "category"]
+
+# Wide tables reuse this many distinct arrays per column kind so that
+# memory use scales with the number of rows and not the number of
+# columns
+DISTINCT_ARRAYS_PER_KIND = 2
+
+STRING_VOCABULARY_SIZE = 1000
+
+FORMAT_OPTIONS = {
+    "large_num_digits": 2,
+    "small_num_digits": 4,
+    "max_integral_digits": 7,
+    "thousands_sep": ",",
+}
+
+TARGET_NAME = "positron.dataExplorer"
+
+
+class BenchmarkComm(comm.base_comm.BaseComm):
+    """
+    A comm that only keeps the last published message, to avoid
+    holding onto large responses across repetitions.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.last_message = None
+        super().__init__(*args, **kwargs)
+
+    def publish_msg(self, msg_type, **msg):  # type: ignore ReportIncompatibleMethodOverride
+        msg["msg_type"] = msg_type
+        self.last_message = msg
+
+
+# ----------------------------------------------------------------------
+# Synthetic data
+
+
+def _make_arrays(num_rows: int, null_fraction: float, seed: int) -> Dict[str, List[Any]]:
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array([f"value_{i}" for i in range(STRING_VOCABULARY_SIZE)], dtype=object)
+    categories = np.array(["alpha", "beta", "gamma", "delta", "epsilon"], dtype=object)
+
+    def null_mask():
+        return rng.random(num_rows) < null_fraction
+
+    arrays = {kind: [] for kind in COLUMN_KINDS}
+    for _ in range(DISTINCT_ARRAYS_PER_KIND):
+        # Nullable integers are stored as floats by NumPy, so we keep
+        # a mask alongside the values and let each backend build its
+        # own nullable integer column
+        arrays["int"].append((rng.integers(-1_000_000, 1_000_000, num_rows), null_mask()))
+
+        floats = rng.standard_normal(num_rows) * 1000
+        floats[null_mask()] = np.nan
+        arrays["float"].append(floats)
+
+        arrays["string"].append(
+            (rng.integers(0, len(vocabulary), num_rows), null_mask(), vocabulary)
+        )
+
+        arrays["bool"].append(rng.random(num_rows) < 0.5)
+
+        datetimes = np.datetime64("2020-01-01", "ms") + rng.integers(0, 10**12, num_rows).astype(
+            "timedelta64[ms]"
+        )
+        datetimes[null_mask()] = np.datetime64("NaT")
+        arrays["datetime"].append(datetimes)
+
+        codes = rng.integers(0, len(categories), num_rows)
+        codes[null_mask()] = -1
+        arrays["category"].append((codes, categories))
+
+    return arrays
+
+
+def _column_plan(num_columns: int):
+    for i in range(num_columns):
+        kind = COLUMN_KINDS[i % len(COLUMN_KINDS)]
+        which = (i // len(COLUMN_KINDS)) % DISTINCT_ARRAYS_PER_KIND
+        yield f"{kind}_{i}", kind, which
+
+
+def make_pandas_table(num_rows: int, num_columns: int, null_fraction=0.1, seed=0):
+    import pandas as pd
+
+    arrays = _make_arrays(num_rows, null_fraction, seed)
+
+    columns = {}
+    for kind in COLUMN_KINDS:
+        converted = []
+        for arr in arrays[kind]:
+            if kind == "int":
+                values, mask = arr
+                arr = pd.arrays.IntegerArray(values, mask)
+            elif kind == "string":
+                indices, mask, vocabulary = arr
+                arr = vocabulary.take(indices)
+                arr[mask] = None
+            elif kind == "category":
+                codes, categories = arr
+                arr = pd.Categorical.from_codes(codes, categories=categories)
+            converted.append(arr)
+        columns[kind] = converted
+
+    data = {name: columns[kind][which] for name, kind, which in _column_plan(num_columns)}
+
+    # copy=False lets wide tables share the underlying arrays
+    return pd.DataFrame(data, copy=False)
+
+
+def make_polars_table(num_rows: int, num_columns: int, null_fraction=0.1, seed=0):
+    import polars as pl
+
+    arrays = _make_arrays(num_rows, null_fraction, seed)
+
+    columns = {}
+    for kind in COLUMN_KINDS:
+        converted = []
+        for arr in arrays[kind]:
+            if kind == "int":
+                values, mask = arr
+                series = pl.Series(values).set(pl.Series(mask), None)  # type: ignore
+            elif kind == "string":
+                indices, mask, vocabulary = arr
+                series = pl.Series(vocabulary.tolist(), dtype=pl.Utf8).gather(indices)
+                series = series.set(pl.Series(mask), None)  # type: ignore
+            elif kind == "category":
+                codes, categories = arr
+                series = pl.Series(categories.tolist(), dtype=pl.Utf8).gather(
+                    pl.Series(codes).set(pl.Series(codes == -1), None)  # type: ignore
+                )
+                series = series.cast(pl.Categorical)
+            else:
+                series = pl.Series(arr)
+            converted.append(series)
+        columns[kind] = converted
+
+    # Renaming a Series does not copy its buffers
+    return pl.DataFrame(
+        [columns[kind][which].alias(name) for name, kind, which in _column_plan(num_columns)]
+    )
+
+
+TABLE_FACTORIES: Dict[str, Callable] = {
+    "pandas": make_pandas_table,
+    "polars": make_polars_table,
+}
+
+
+# ----------------------------------------------------------------------
+# Request drivers
+
+
+class ExplorerDriver:
+    """
+    Sends JSON-RPC requests to a registered table through its comm,
+    the same way the frontend does.
+    """
+
+    def __init__(self, service: DataExplorerService, table: Any, title: str):
+        self.service = service
+        self.comm_id = guid()
+        service.register_table(table, title, comm_id=self.comm_id)
+
+        state = self.rpc("get_state")
+        self.features = state["supported_features"]
+        self.num_rows = state["table_shape"]["num_rows"]
+        self.num_columns = state["table_shape"]["num_columns"]
+        self.schema = self.rpc("get_schema", start_index=0, num_columns=self.num_columns)["columns"]
+
+    def rpc(self, method: str, **params):
+        base_comm = self.service.comms[self.comm_id].comm
+        base_comm.handle_msg(json_rpc_request(method, params=params, comm_id=self.comm_id))
+        data = base_comm.last_message["data"]
+        if "error" in data:
+            raise RuntimeError(data["error"]["message"])
+        return data["result"]
+
+    def first_column(self, type_display: str) -> Optional[Dict[str, Any]]:
+        for column in self.schema:
+            if column["type_display"] == type_display:
+                return column
+        return None
+
+    def profile_supported(self, profile_type: str) -> bool:
+        for entry in self.features["get_column_profiles"]["supported_types"]:
+            if entry["profile_type"] == profile_type:
+                return entry["support_status"] != "unsupported"
+        return False
+
+    def close(self):
+        self.service._close_explorer(self.comm_id)
+
+
+def _filter(column_schema, filter_type, **params):
+    return {
+        "filter_id": guid(),
+        "filter_type": filter_type,
+        "column_schema": column_schema,
+        "condition": "and",
+        **params,
+    }
+
+
+def _prepare_operation(driver: ExplorerDriver, operation: str):
+    """
+    Returns a tuple of (run, reset) callables for the operation, or a
+    string explaining why the operation was skipped.
+    """
+    features = driver.features
+
+    def noop():
+        pass
+
+    if operation == "get_schema":
+        num_columns = min(driver.num_columns, 1000)
+
+        def run():
+            driver.rpc("get_schema", start_index=0, num_columns=num_columns)
+
+        return run, noop
+    elif operation == "get_data_values":
+        # A typical screenful of data from the middle of the table
+        row_start = max(driver.num_rows // 2 - 50, 0)
+        column_indices = list(range(min(driver.num_columns, 50)))
+
+        def run():
+            driver.rpc(
+                "get_data_values",
+                row_start_index=row_start,
+                num_rows=100,
+                column_indices=column_indices,
+                format_options=FORMAT_OPTIONS,
+            )
+
+        return run, noop
+    elif operation == "set_row_filters":
+        if features["set_row_filters"]["support_status"] == "unsupported":
+            return "set_row_filters unsupported by backend"
+
+        filters = []
+        number_column = driver.first_column("number")
+        if number_column is not None:
+            filters.append(
+                _filter(number_column, "compare", compare_params={"op": ">", "value": "0"})
+            )
+        string_column = driver.first_column("string")
+        if string_column is not None:
+            filters.append(
+                _filter(
+                    string_column,
+                    "search",
+                    search_params={
+                        "search_type": "contains",
+                        "term": "1",
+                        "case_sensitive": False,
+                    },
+                )
+            )
+        if len(filters) == 0:
+            return "no filterable columns"
+
+        def run():
+            driver.rpc("set_row_filters", filters=filters)
+
+        def reset():
+            driver.rpc("set_row_filters", filters=[])
+
+        return run, reset
+    elif operation == "set_sort_columns":
+        sort_column = driver.first_column("number") or driver.schema[0]
+        sort_keys = [{"column_index": sort_column["column_index"], "ascending": True}]
+
+        def run():
+            driver.rpc("set_sort_columns", sort_keys=sort_keys)
+
+        def reset():
+            driver.rpc("set_sort_columns", sort_keys=[])
+
+        return run, reset
+    elif operation == "get_column_profiles":
+        profile_types = [
+            tp for tp in ["null_count", "summary_stats"] if driver.profile_supported(tp)
+        ]
+        if len(profile_types) == 0:
+            return "column profiles unsupported by backend"
+
+        profiles = [
+            {"column_index": i, "profile_type": tp}
+            for i in range(min(driver.num_columns, 10))
+            for tp in profile_types
+        ]
+
+        def run():
+            driver.rpc("get_column_profiles", profiles=profiles, format_options=FORMAT_OPTIONS)
+
+        return run, noop
+    elif operation == "search_schema":
+        if features["search_schema"]["support_status"] == "unsupported":
+            return "search_schema unsupported by backend"
+
+        def run():
+            driver.rpc("search_schema", search_term="string_1", start_index=0, max_results=100)
+
+        return run, noop
+    elif operation == "export_data_selection":
+        if features["export_data_selection"]["support_status"] == "unsupported":
+            return "export_data_selection unsupported by backend"
+
+        selection = {
+            "kind": "cell_range",
+            "selection": {
+                "first_row_index": 0,
+                "last_row_index": min(driver.num_rows, 1000) - 1,
+                "first_column_index": 0,
+                "last_column_index": min(driver.num_columns, 10) - 1,
+            },
+        }
+
+        def run():
+            driver.rpc("export_data_selection", selection=selection, format="csv")
+
+        return run, noop
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    # Linear interpolation between closest ranks
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def measure(run: Callable, reset: Callable, repeat: int) -> Dict[str, Any]:
+    """
+    Time `repeat` calls of `run`, then do one more call with
+    tracemalloc enabled to record the peak traced memory. Timings are
+    taken without tracing, since tracemalloc slows down allocations.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+        reset()
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        reset()
+
+    timings.sort()
+    return {
+        "repeat": repeat,
+        "p50_ms": _percentile(timings, 50) * 1000,
+        "p99_ms": _percentile(timings, 99) * 1000,
+        "min_ms": timings[0] * 1000,
+        "max_ms": timings[-1] * 1000,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(
+    backends: Sequence[str] = DEFAULT_BACKENDS,
+    rows: Sequence[int] = DEFAULT_ROWS,
+    columns: Sequence[int] = DEFAULT_COLUMNS,
+    operations: Sequence[str] = OPERATIONS,
+    repeat: int = 5,
+    null_fraction: float = 0.1,
+    seed: int = 0,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark grid and return the machine-readable results.
+    """
+    original_create_comm = comm.create_comm
+    comm.create_comm = BenchmarkComm
+    service = DataExplorerService(TARGET_NAME)
+
+    results = []
+    try:
+        for backend in backends:
+            factory = TABLE_FACTORIES[backend]
+            for num_rows in rows:
+                for num_columns in columns:
+                    table = factory(num_rows, num_columns, null_fraction=null_fraction, seed=seed)
+
+                    start = time.perf_counter()
+                    driver = ExplorerDriver(service, table, f"{backend}_{num_rows}x{num_columns}")
+                    open_ms = (time.perf_counter() - start) * 1000
+
+                    case = {"backend": backend, "num_rows": num_rows, "num_columns": num_columns}
+                    results.append({**case, "operation": "open", "p50_ms": open_ms})
+
+                    for operation in operations:
+                        prepared = _prepare_operation(driver, operation)
+                        entry: Dict[str, Any] = {**case, "operation": operation}
+                        if isinstance(prepared, str):
+                            entry["skipped"] = prepared
+                        else:
+                            try:
+                                entry.update(measure(*prepared, repeat=repeat))
+                            except Exception as e:
+                                entry["error"] = str(e)
+                        results.append(entry)
+
+                        if log is not None:
+                            log(_format_entry(entry))
+
+                    driver.close()
+                    del driver, table
+    finally:
+        service.shutdown()
+        comm.create_comm = original_create_comm
+
+    return {"metadata": _metadata(), "results": results}
+
+
+def _format_entry(entry: Dict[str, Any]) -> str:
+    case = f"{entry['backend']:>6} {entry['num_rows']:>11,} x {entry['num_columns']:>6,}"
+    if "skipped" in entry:
+        outcome = f"skipped ({entry['skipped']})"
+    elif "error" in entry:
+        outcome = f"error ({entry['error']})"
+    else:
+        outcome = (
+            f"p50 {entry['p50_ms']:10.2f} ms  p99 {entry['p99_ms']:10.2f} ms  "
+            f"peak {entry['peak_memory_bytes'] / 2**20:10.1f} MiB"
+        )
+    return f"{case}  {entry['operation']:<22} {outcome}"
+
+
+def _metadata() -> Dict[str, Any]:
+    versions = {}
+    for package in ["numpy", "pandas", "polars", "pyarrow"]:
+        try:
+            versions[package] = __import__(package).__version__
+        except ImportError:
+            versions[package] = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "packages": versions,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--backends", nargs="+", choices=DEFAULT_BACKENDS, default=DEFAULT_BACKENDS)
+    parser.add_argument("--rows", nargs="+", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--columns", nargs="+", type=int, default=DEFAULT_COLUMNS)
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=OPERATIONS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--null-fraction", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Path to write JSON results to, or '-' for standard output",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        backends=args.backends,
+        rows=args.rows,
+        columns=args.columns,
+        operations=args.operations,
+        repeat=args.repeat,
+        null_fraction=args.null_fraction,
+        seed=args.seed,
+        log=lambda line: print(line, file=sys.stderr),
+    )
+
+    output = json.dumps(results, indent=2)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    main()
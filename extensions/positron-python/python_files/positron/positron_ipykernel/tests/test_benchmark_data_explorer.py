@@ -0,0 +1,20 @@
+#
+# Copyright (C) 2024 Posit Software, PBC. All rights reserved.
+# Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
+#
+
+import pytest
+
+from .benchmark_data_explorer import OPERATIONS, run_benchmarks
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_benchmark_smoke(backend):
+    # Keep the benchmark harness runnable as the backend evolves
+    results = run_benchmarks(backends=[backend], rows=[100], columns=[7], repeat=1)["results"]
+
+    assert [entry["operation"] for entry in results] == ["open"] + OPERATIONS
+    for entry in results:
+        assert "error" not in entry, entry
+        if "skipped" not in entry:
+            assert entry["p50_ms"] >= 0
@@ -5,6 +5,7 @@
 
 # ruff: noqa: E712
 
+import asyncio
 import inspect
 import math
 import pprint
@@ -19,6 +20,8 @@ import polars as pl
 import pytest
 import pytz
 
+from .. import data_explorer
+from .. import variables as variables_module
 from .._vendor.pydantic import BaseModel
 from ..access_keys import encode_access_key
 from ..data_explorer import (
@@ -36,6 +39,8 @@ from ..data_explorer import (
 )
 from ..data_explorer_comm import (
     ColumnDisplayType,
+    ColumnFrequencyTable,
+    ColumnFrequencyTableItem,
     ColumnProfileResult,
     ColumnProfileTypeSupportStatus,
     ColumnSchema,
@@ -46,6 +51,7 @@ from ..data_explorer_comm import (
     RowFilterTypeSupportStatus,
     SupportStatus,
 )
+from ..positron_comm import JsonRpcErrorCode
 from ..utils import guid
 from .conftest import DummyComm, PositronShell
 from .test_variables import BIG_ARRAY_LENGTH
@@ -235,6 +241,75 @@ def test_explorer_delete_variable(
     _check_delete_variable("y")
 
 
+def test_explorers_share_derived_state(
+    shell: PositronShell,
+    de_service: DataExplorerService,
+    variables_comm: DummyComm,
+    monkeypatch,
+):
+    x = pd.DataFrame({"a": [5, 1, 4, 2, 3], "b": ["e", "a", "d", "b", "c"]})
+    _assign_variables(shell, variables_comm, x=x)
+
+    path = _open_viewer(variables_comm, ["x"])
+    _open_viewer(variables_comm, ["x"])
+    comm_ids = list(de_service.path_to_comm_ids[path])
+
+    num_filter_evals = []
+    num_sorts = []
+    eval_filters = PandasView._eval_filters
+    sort_data = PandasView._sort_data
+
+    def counting_eval_filters(self, filters):
+        num_filter_evals.append(1)
+        return eval_filters(self, filters)
+
+    def counting_sort_data(self):
+        num_sorts.append(1)
+        return sort_data(self)
+
+    monkeypatch.setattr(PandasView, "_eval_filters", counting_eval_filters)
+    monkeypatch.setattr(PandasView, "_sort_data", counting_sort_data)
+
+    def _rpc(comm_id, method, **params):
+        msg = json_rpc_request(method, params=params, comm_id=comm_id)
+        de_service.comms[comm_id].comm.handle_msg(msg)
+        return get_last_message(de_service, comm_id)["data"]["result"]
+
+    def _get_values(comm_id):
+        return _rpc(
+            comm_id,
+            "get_data_values",
+            row_start_index=0,
+            num_rows=5,
+            column_indices=[1],
+            format_options=DEFAULT_FORMAT,
+        )["columns"]
+
+    schema = _rpc(comm_ids[0], "get_schema", start_index=0, num_columns=2)["columns"]
+    sort_keys = [{"column_index": 0, "ascending": False}]
+
+    # Each explorer assigns its own filter ids
+    for comm_id in comm_ids:
+        result = _rpc(comm_id, "set_row_filters", filters=[_compare_filter(schema[0], ">", "1")])
+        assert result == {"selected_num_rows": 4, "had_errors": False}
+        _rpc(comm_id, "set_sort_columns", sort_keys=sort_keys)
+        assert _get_values(comm_id) == [["e", "d", "c", "b"]]
+
+    assert (len(num_filter_evals), len(num_sorts)) == (1, 1)
+
+    # Updating the variable in place starts over
+    shell.run_cell("x.iloc[0, 0] = 0")
+    for comm_id in comm_ids:
+        assert _get_values(comm_id) == [["d", "c", "b"]]
+
+    assert (len(num_filter_evals), len(num_sorts)) == (2, 2)
+
+    # The shared state is dropped with the last explorer on the path
+    for comm_id in comm_ids:
+        de_service.comms[comm_id].comm.handle_close({})
+    assert de_service._shared_states == {}
+
+
 def _check_update_variable(de_service, name, update_type="schema"):
     paths = de_service.get_paths_for_variable(name)
     assert len(paths) > 0
@@ -398,12 +473,55 @@ class DataExplorerFixture:
             format=format,
         )
 
+    def export_data_selection_to_file(self, table_name, selection, path, format="csv"):
+        return self.do_json_rpc(
+            table_name,
+            "export_data_selection_to_file",
+            selection=selection,
+            format=format,
+            path=path,
+        )
+
     def set_row_filters(self, table_name, filters=None):
         return self.do_json_rpc(table_name, "set_row_filters", filters=filters)
 
     def set_sort_columns(self, table_name, sort_keys=None):
         return self.do_json_rpc(table_name, "set_sort_columns", sort_keys=sort_keys)
 
+    def set_group_by(self, table_name, group_by, aggregations=None):
+        return self.do_json_rpc(
+            table_name,
+            "set_group_by",
+            group_by=group_by,
+            aggregations=aggregations or [],
+        )
+
+    def set_sampling(self, table_name, method, **params):
+        return self.do_json_rpc(table_name, "set_sampling", sampling={"method": method, **params})
+
+    def find(
+        self,
+        table_name,
+        term,
+        find_type="contains",
+        case_sensitive=False,
+        column_indices=None,
+        start_index=0,
+        direction="next",
+        wrap=False,
+    ):
+        return self.do_json_rpc(
+            table_name,
+            "find",
+            term=term,
+            find_type=find_type,
+            case_sensitive=case_sensitive,
+            column_indices=column_indices or [],
+            start_index=start_index,
+            direction=direction,
+            wrap=wrap,
+        )
+
     def get_column_profiles(self, table_name, profiles, format_options=DEFAULT_FORMAT):
         return self.do_json_rpc(
             table_name,
@@ -1385,12 +1503,145 @@ def test_pandas_filter_search(dxf: DataExplorerFixture):
         )
 
 
+def test_pandas_filter_categorical(dxf: DataExplorerFixture):
+    values = ["foo", "bar", None, "", "Foo2", "baz", "bar", None, "qux", ""]
+    df = pd.DataFrame(
+        {
+            "a": pd.Categorical(
+                values, categories=["qux", "foo", "bar", "", "Foo2", "baz", "unused"]
+            ),
+            "b": pd.Categorical([3, 1, 2, None, 3, 1, 1, 2, None, 3], ordered=True),
+        }
+    )
+    schema = dxf.get_schema_for(df)
+
+    # Expected results are computed on the plain object column
+    a = pd.Series(values, dtype=object)
+    cases = [
+        ([_filter("is_null", schema[0])], a.isnull()),
+        ([_filter("not_null", schema[0])], a.notnull()),
+        ([_filter("is_empty", schema[0])], a.str.len() == 0),
+        ([_filter("not_empty", schema[0])], a.str.len() != 0),
+        ([_compare_filter(schema[0], "=", "bar")], a == "bar"),
+        ([_compare_filter(schema[0], "!=", "bar")], a != "bar"),
+        ([_compare_filter(schema[0], "=", "unused")], a == "unused"),
+        ([_set_member_filter(schema[0], ["foo", "baz", "missing"])], a.isin(["foo", "baz"])),
+        ([_set_member_filter(schema[0], ["foo", "baz"], False)], ~a.isin(["foo", "baz"])),
+        ([_search_filter(schema[0], "fo")], a.str.lower().str.contains("fo")),
+        ([_search_filter(schema[0], "Fo", case_sensitive=True)], a.str.contains("Fo")),
+        ([_search_filter(schema[0], "ba", search_type="starts_with")], a.str.startswith("ba")),
+        ([_search_filter(schema[0], "^b.r$", search_type="regex_match")], a.str.match("^b.r$")),
+        ([_set_member_filter(schema[1], [1, 3])], df["b"].isin([1, 3])),
+        ([_set_member_filter(schema[1], ["x"])], df["b"].isin([])),
+        ([_compare_filter(schema[1], "=", "2")], df["b"] == 2),
+    ]
+
+    for filter_set, mask in cases:
+        # Nulls in the expected masks do not match
+        dxf.check_filter_case(df, filter_set, df[mask.eq(True).to_numpy()])
+
+    # Searching matches categories only, so nulls never match
+    dxf.check_filter_case(df, [_search_filter(schema[0], "nan")], df.iloc[[]])
+
+
+def test_pandas_arrow_backed_columns(dxf: DataExplorerFixture):
+    import pyarrow as pa
+
+    strings = ["foo", "Bar", None, "", "food", "barf", "FOO", None]
+    df = pd.DataFrame(
+        {
+            "a": pd.Series(strings, dtype="string[pyarrow]"),
+            "b": pd.Series(strings, dtype=pd.ArrowDtype(pa.large_string())),
+            "c": pd.Series([1.5, None, -2, 3, 4, 5, 6, 7], dtype=pd.ArrowDtype(pa.float64())),
+            "d": pd.Series([True, False, None, True] * 2, dtype=pd.ArrowDtype(pa.bool_())),
+        }
+    )
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    assert [c["type_display"] for c in schema] == ["string", "string", "number", "boolean"]
+
+    # Expected results are computed on the plain object column
+    a = pd.Series(strings, dtype=object)
+    for column_schema in schema[:2]:
+        cases = [
+            ([_filter("is_null", column_schema)], a.isnull()),
+            ([_filter("not_null", column_schema)], a.notnull()),
+            ([_filter("is_empty", column_schema)], a.str.len() == 0),
+            ([_filter("not_empty", column_schema)], a.str.len() > 0),
+            ([_search_filter(column_schema, "fo")], a.str.lower().str.contains("fo")),
+            ([_search_filter(column_schema, "F.O", case_sensitive=True)], a.str.contains("F.O")),
+            (
+                [_search_filter(column_schema, "bar", search_type="starts_with")],
+                a.str.lower().str.startswith("bar"),
+            ),
+            (
+                [_search_filter(column_schema, "f", search_type="ends_with")],
+                a.str.lower().str.endswith("f"),
+            ),
+            (
+                [_search_filter(column_schema, "b.r", search_type="regex_match")],
+                a.str.match("b.r", case=False),
+            ),
+        ]
+        for filter_set, mask in cases:
+            dxf.check_filter_case(df, filter_set, df[mask.eq(True).to_numpy()])
+
+    dxf.check_filter_case(df, [_compare_filter(schema[2], ">", "2")], df.iloc[[3, 4, 5, 6, 7]])
+    dxf.check_filter_case(df, [_filter("is_true", schema[3])], df.iloc[[0, 3, 4, 7]])
+
+    results = dxf.get_column_profiles("df", [_get_null_count(i) for i in range(4)])
+    assert results == [ColumnProfileResult(null_count=x) for x in [2, 2, 1, 2]]
+
+    string_stats = dxf.get_column_profiles("df", [_get_summary_stats(0), _get_summary_stats(1)])
+    dxf.register_table("df_object", pd.DataFrame({"a": a}))
+    assert string_stats == dxf.get_column_profiles("df_object", [_get_summary_stats(0)]) * 2
+
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=3, column_indices=[0, 1, 2, 3])
+    assert result["columns"] == [
+        ["foo", "Bar", _VALUE_NA],
+        ["foo", "Bar", _VALUE_NA],
+        ["1.50", _VALUE_NA, "-2.00"],
+        ["True", "False", _VALUE_NA],
+    ]
+
+
+def test_pandas_sort_categorical(dxf: DataExplorerFixture):
+    df = pd.DataFrame(
+        {
+            "a": pd.Categorical(
+                ["low", None, "high", "mid", "low", "high"],
+                categories=["low", "mid", "high"],
+                ordered=True,
+            ),
+            "b": [1, 2, 3, 4, 5, 6],
+        }
+    )
+
+    # Categoricals sort by category order, with nulls last
+    for ascending in [True, False]:
+        dxf.check_sort_case(
+            df,
+            [{"column_index": 0, "ascending": ascending}],
+            df.sort_values("a", ascending=ascending, kind="mergesort"),
+        )
+
+    dxf.check_sort_case(
+        df,
+        [{"column_index": 0, "ascending": False}, {"column_index": 1, "ascending": False}],
+        df.sort_values(["a", "b"], ascending=[False, False]),
+    )
+
+
 def test_variable_updates(
     shell: PositronShell,
     de_service: DataExplorerService,
     variables_comm: DummyComm,
     dxf: DataExplorerFixture,
+    monkeypatch,
 ):
+    # Treat big_x and big_xpl as too large for any change detection
+    monkeypatch.setattr(variables_module, "MAX_SNAPSHOT_FINGERPRINT_BUDGET", 0)
+
     x = pd.DataFrame({"a": [1, 0, 3, 4]})
     x_pl = pl.DataFrame({"a": [1, 0, 3, 4]})
     big_array = np.arange(BIG_ARRAY_LENGTH)
@@ -1444,7 +1695,13 @@ def test_variable_updates(
     # Execute code that triggers an update event for big_x because it's large
     shell.run_cell("None")
     _check_update_variable(de_service, "big_x", update_type="schema")
-    _check_update_variable(de_service, "big_xpl", update_type="schema")
+
+    # Polars snapshots are shallow copies, so big_xpl is not too large
+    # to detect that it's unchanged
+    for path in de_service.get_paths_for_variable("big_xpl"):
+        for comm_id in de_service.path_to_comm_ids[path]:
+            messages = cast(DummyComm, de_service.comms[comm_id].comm).messages
+            assert [msg["msg_type"] for msg in messages] == ["comm_open"]
 
     # Update nested values in y and check for schema updates
     shell.run_cell(
@@ -1722,6 +1979,162 @@ def test_schema_change_scenario8(ssf: SchemaChangeFixture):
     ssf.check_scenario("dfp", scenario8, "dfp = dfp.drop('b')")
 
 
+def test_numpy_tables(dxf: DataExplorerFixture):
+    arr = np.arange(20, dtype="float64").reshape(5, 4)
+    rec = np.array(
+        [(1, 2.5, "a"), (2, 0.5, "b"), (3, 1.5, "c")],
+        dtype=[("x", "i8"), ("y", "f8"), ("z", "U1")],
+    )
+    arrays = {"x": np.array([3, 1, 2]), "y": np.array([True, False, True])}
+
+    for name, table in [("arr", arr), ("rec", rec), ("arrays", arrays)]:
+        dxf.register_table(name, table)
+
+    def _get_names_and_types(name):
+        return [(c["column_name"], c["type_display"]) for c in dxf.get_schema(name)]
+
+    assert _get_names_and_types("arr") == [(str(i), "number") for i in range(4)]
+    assert _get_names_and_types("rec") == [("x", "number"), ("y", "number"), ("z", "string")]
+    assert _get_names_and_types("arrays") == [("x", "number"), ("y", "boolean")]
+
+    # Columns are views of the original array, not copies
+    paths = dxf.de_service.get_paths_for_variable("arr")
+    comm_id = list(dxf.de_service.path_to_comm_ids[paths[0]])[0]
+    view = dxf.de_service.table_views[comm_id]
+    assert np.shares_memory(view.table.iloc[:, 1].to_numpy(), arr)
+
+    schema = dxf.get_schema("arr")
+    dxf.set_row_filters("arr", filters=[_compare_filter(schema[0], ">", "4")])
+    dxf.set_sort_columns("arr", sort_keys=[{"column_index": 1, "ascending": False}])
+    result = dxf.get_data_values("arr", row_start_index=0, num_rows=10, column_indices=[0, 1])
+    assert result["columns"] == [
+        ["16.00", "12.00", "8.00"],
+        ["17.00", "13.00", "9.00"],
+    ]
+
+    dxf.set_sort_columns("rec", sort_keys=[{"column_index": 1, "ascending": True}])
+    result = dxf.get_data_values("rec", row_start_index=0, num_rows=10, column_indices=[2])
+    assert result["columns"] == [["b", "c", "a"]]
+
+
+def test_numpy_table_updates(dxf: DataExplorerFixture):
+    dxf.assign_and_open_viewer("arr", np.arange(20, dtype="float64").reshape(5, 4))
+
+    schema = dxf.get_schema("arr")
+    dxf.set_row_filters("arr", filters=[_compare_filter(schema[3], ">", "4")])
+
+    # In-place updates keep the filter and show the new data
+    dxf.execute_code("arr[4, 0] = 100")
+    _check_update_variable(dxf.de_service, "arr", update_type="data")
+    result = dxf.get_data_values("arr", row_start_index=0, num_rows=10, column_indices=[0])
+    assert result["columns"] == [["4.00", "8.00", "12.00", "100.00"]]
+
+    # Dropping the filtered column invalidates the filter
+    dxf.execute_code("arr = arr[:, :2]")
+    _check_update_variable(dxf.de_service, "arr", update_type="schema")
+    state = dxf.get_state("arr")
+    assert state["table_shape"] == {"num_rows": 5, "num_columns": 2}
+    assert not state["row_filters"][0]["is_valid"]
+
+
+def test_schema_change_wide_table(dxf: DataExplorerFixture):
+    # Columns shifted by an insertion in a wide table, with duplicate
+    # column names
+    num_columns = 1000
+    columns = [f"c{i}" for i in range(num_columns)] + ["c0"]
+    df = pd.DataFrame(np.arange(2 * (num_columns + 1)).reshape(2, -1), columns=columns)
+    dxf.assign_and_open_viewer("df", df)
+
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[500], ">", "0")])
+    dxf.set_sort_columns("df", sort_keys=[{"column_index": 999, "ascending": False}])
+
+    dxf.execute_code("df = df.copy(); df.insert(0, 'new', 0); df['c500'] = df['c500'] * 1.5")
+
+    state = dxf.get_state("df")
+    filt = state["row_filters"][0]
+    assert filt["is_valid"]
+    assert filt["column_schema"]["column_index"] == 501
+    assert filt["column_schema"]["type_name"] == "float64"
+    assert state["sort_keys"] == [{"column_index": 1000, "ascending": False}]
+
+
+@pytest.mark.asyncio
+async def test_pandas_schema_sampled_type_inference(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(data_explorer, "INFER_DTYPE_SAMPLE_SIZE", 10)
+
+    # Rows 0, 11, 22, ..., 99 are sampled, so the integer in row 5
+    # is only found by the full scan
+    mixed = [f"s{i}" for i in range(100)]
+    mixed[5] = 5
+    strings = [f"s{i}" for i in range(100)]
+
+    dxf.register_table("df", pd.DataFrame({"a": mixed, "b": strings}))
+    schema = dxf.get_schema("df")
+    assert [c["type_name"] for c in schema] == ["string", "string"]
+
+    # The full scan corrects the provisional type and notifies the UI
+    await asyncio.gather(*dxf.de_service._pending_tasks)
+    _check_update_variable(dxf.de_service, "df", "schema")
+    schema = dxf.get_schema("df")
+    assert [c["type_name"] for c in schema] == ["mixed-integer", "string"]
+    assert schema[0]["type_display"] == "number"
+
+    # No update is sent when the sample was representative
+    dxf.register_table("df2", pd.DataFrame({"b": strings}))
+    dxf.get_schema("df2")
+    await asyncio.gather(*dxf.de_service._pending_tasks)
+    comm_id = list(dxf.de_service.path_to_comm_ids[(encode_access_key("df2"),)])[0]
+    dummy_comm = cast(DummyComm, dxf.de_service.comms[comm_id].comm)
+    assert all(msg["data"].get("method") != "schema_update" for msg in dummy_comm.messages)
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([f"s{i}" for i in range(100)], "string"),
+        ([None] * 60 + [f"s{i}" for i in range(40)], "string"),
+        ([5] + [f"s{i}" for i in range(99)], "mixed-integer"),
+        ([None] * 100, "empty"),
+    ],
+)
+def test_infer_dtype_chunked(values, expected, monkeypatch):
+    monkeypatch.setattr(data_explorer, "INFER_DTYPE_CHUNK_SIZE", 30)
+    column = pd.Series(values, dtype=object)
+
+    # The type is yielded after the last of 4 chunks
+    assert list(data_explorer._infer_dtype_chunked(column)) == [None, None, None, expected]
+    assert pd.api.types.infer_dtype(column) == expected
+
+
+@pytest.mark.asyncio
+async def test_pandas_filter_sampled_type_inference(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(data_explorer, "INFER_DTYPE_SAMPLE_SIZE", 10)
+    monkeypatch.setattr(data_explorer, "INFER_DTYPE_CHUNK_SIZE", 30)
+
+    dxf.assign_and_open_viewer("df", pd.DataFrame({"a": [f"s{i}" for i in range(100)]}))
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", [_search_filter(schema[0], "s1")])
+    await asyncio.gather(*dxf.de_service._pending_tasks)
+
+    # The filter is carried over with the type of a sample, which
+    # misses the integer in row 5
+    dxf.execute_code("df = df.copy(); df.iloc[5, 0] = 5")
+    state = dxf.get_state("df")
+    assert state["row_filters"][0]["column_schema"]["type_name"] == "string"
+    assert state["row_filters"][0]["is_valid"]
+
+    # The full scan corrects the filter's type and re-applies it
+    await asyncio.gather(*dxf.de_service._pending_tasks)
+    _check_update_variable(dxf.de_service, "df", "schema")
+    state = dxf.get_state("df")
+    filt = state["row_filters"][0]
+    assert filt["column_schema"]["type_name"] == "mixed-integer"
+    assert not filt["is_valid"]
+    assert filt["error_message"] == "Unsupported column type for filter"
+    assert state["table_shape"]["num_rows"] == 100
+
+
 def test_pandas_set_sort_columns(dxf: DataExplorerFixture):
     tables = {
         "df1": SIMPLE_PANDAS_DF,
@@ -1776,6 +2189,363 @@ def test_pandas_set_sort_columns(dxf: DataExplorerFixture):
             dxf.check_sort_case(df, wrapped_keys, expected_filtered, filters=filters)
 
 
+def _aggregation(column_index, function):
+    return {"column_index": column_index, "function": function}
+
+
+def _check_grouped_values(dxf: DataExplorerFixture, table_name, expected_table):
+    # The grouped grid should match an explorer on the expected table
+    expected_name = guid()
+    dxf.register_table(expected_name, expected_table)
+
+    assert dxf.get_schema(table_name) == dxf.get_schema(expected_name)
+    num_rows = len(expected_table)
+    num_columns = len(expected_table.columns)
+    params = {
+        "row_start_index": 0,
+        "num_rows": num_rows,
+        "column_indices": list(range(num_columns)),
+    }
+    result = dxf.get_data_values(table_name, **params)
+    assert result["columns"] == dxf.get_data_values(expected_name, **params)["columns"]
+
+
+def test_pandas_group_by(dxf: DataExplorerFixture, monkeypatch):
+    df = pd.DataFrame(
+        {
+            "a": ["x", "y", "x", None, "y", "x"],
+            "b": [1, 2, 3, 4, 5, 6],
+            "c": [1.0, np.nan, 3, 4, 5, 6],
+            "d": ["foo", "bar", "baz", "qux", "foo", "bar"],
+        }
+    )
+    dxf.register_table("df", df)
+
+    aggregations = [_aggregation(1, "sum"), _aggregation(2, "mean"), _aggregation(3, "num_unique")]
+    assert dxf.set_group_by("df", [0], aggregations) == {"num_groups": 3}
+
+    def _expected(table):
+        grouped = table.groupby("a", dropna=False)
+        return pd.DataFrame(
+            {
+                # pandas represents the null group key as NaN
+                "a": ["x", "y", np.nan],
+                "count": grouped.size().to_numpy(),
+                "b_sum": grouped["b"].sum().to_numpy(),
+                "c_mean": grouped["c"].mean().to_numpy(),
+                "d_num_unique": grouped["d"].nunique().to_numpy(),
+            }
+        )
+
+    state = dxf.get_state("df")
+    assert state["table_shape"] == {"num_rows": 3, "num_columns": 5}
+    assert state["table_unfiltered_shape"] == {"num_rows": 6, "num_columns": 4}
+    assert state["group_by"] == {"group_by": [0], "aggregations": aggregations}
+    _check_grouped_values(dxf, "df", _expected(df))
+
+    # Filters refer to the ungrouped columns, so they cannot be changed
+    # while the grid shows the grouped table
+    schema = dxf.get_schema_for(df)
+    with pytest.raises(AssertionError, match="clear the grouping first"):
+        dxf.set_row_filters("df", [_compare_filter(schema[1], ">", "1")])
+    assert dxf.get_state("df")["row_filters"] == []
+
+    # Filters apply to the rows being grouped
+    dxf.set_group_by("df", [])
+    dxf.set_row_filters("df", [_compare_filter(schema[1], ">", "1")])
+    dxf.set_group_by("df", [0], aggregations)
+    assert dxf.get_state("df")["table_shape"] == {"num_rows": 3, "num_columns": 5}
+    _check_grouped_values(dxf, "df", _expected(df[df["b"] > 1]))
+
+    # Sorting applies to the grouped table
+    dxf.set_sort_columns("df", [{"column_index": 2, "ascending": False}])
+    assert dxf.get_state("df")["sort_keys"] == [{"column_index": 2, "ascending": False}]
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=3, column_indices=[2])
+    assert result["columns"] == [["9", "7", "4"]]
+
+    # Grouped tables are cached by grouping and filters
+    comm_id = list(dxf.de_service.path_to_comm_ids[(encode_access_key("df"),)])[0]
+    table_view = dxf.de_service.table_views[comm_id]
+    grouped_view = table_view.grouped_view
+    dxf.set_group_by("df", [3])
+    dxf.set_group_by("df", [0], aggregations)
+    assert table_view.grouped_view is grouped_view
+
+    # ...up to a total number of cells, evicting the oldest first
+    monkeypatch.setattr(data_explorer, "GROUP_BY_CACHE_NUM_CELLS", 20)
+    dxf.set_group_by("df", [3], [_aggregation(1, "sum")])
+    num_cells = [math.prod(view.table.shape) for view in table_view._grouped_views.values()]
+    assert num_cells == [8, 12]
+    assert grouped_view not in table_view._grouped_views.values()
+    dxf.set_group_by("df", [0], aggregations)
+    assert table_view.grouped_view is not grouped_view
+
+    # Clearing the grouping returns to the filtered rows
+    assert dxf.set_group_by("df", []) == {"num_groups": 0}
+    state = dxf.get_state("df")
+    assert state["table_shape"] == {"num_rows": 5, "num_columns": 4}
+    assert state["group_by"] is None
+    assert state["sort_keys"] == []
+
+    with pytest.raises(AssertionError, match="Cannot compute mean of column d"):
+        dxf.set_group_by("df", [0], [_aggregation(3, "mean")])
+
+    with pytest.raises(AssertionError, match="Column index out of range: 4"):
+        dxf.set_group_by("df", [4])
+
+
+def test_pandas_group_by_invalid(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": ["x", "y", "x"], "b": [1, 2, 3], "d": ["foo", "bar", "baz"]})
+    dxf.register_table("df", df)
+
+    aggregations = [_aggregation(1, "sum")]
+    dxf.set_group_by("df", [0], aggregations)
+
+    # A rejected grouping keeps the current one
+    with pytest.raises(AssertionError, match="Cannot compute mean of column d"):
+        dxf.set_group_by("df", [0], [_aggregation(2, "mean")])
+    state = dxf.get_state("df")
+    assert state["group_by"] == {"group_by": [0], "aggregations": aggregations}
+    assert state["table_shape"] == {"num_rows": 2, "num_columns": 3}
+
+    # ...so later requests still succeed
+    _check_grouped_values(
+        dxf, "df", pd.DataFrame({"a": ["x", "y"], "count": [2, 1], "b_sum": [4, 2]})
+    )
+
+    # Nor does a rejected grouping replace no grouping
+    dxf.set_group_by("df", [])
+    with pytest.raises(AssertionError, match="Cannot compute mean of column d"):
+        dxf.set_group_by("df", [0], [_aggregation(2, "mean")])
+    assert dxf.get_state("df")["group_by"] is None
+
+
+def test_pandas_find(dxf: DataExplorerFixture, monkeypatch):
+    length = 1000
+    df = pd.DataFrame(
+        {
+            "a": np.arange(length),
+            "b": [f"id-{i:04}" for i in range(length)],
+            "c": pd.Categorical(["even", "odd"] * (length // 2)),
+            "d": pd.array([f"Key{i}" for i in range(length)], dtype="string[pyarrow]"),
+            "e": [None] * (length - 1) + [7.5],
+        }
+    )
+    dxf.register_table("df", df)
+
+    def _found(row_index, column_index):
+        return {"found": True, "row_index": row_index, "column_index": column_index}
+
+    not_found = {"found": False, "row_index": None, "column_index": None}
+
+    # Small chunks, so that the matches are found across chunks
+    monkeypatch.setattr(data_explorer, "FIND_INITIAL_CHUNK_NUM_CELLS", 10)
+    monkeypatch.setattr(data_explorer, "FIND_CHUNK_NUM_CELLS", 100)
+
+    # Values are compared for equality, text is searched otherwise
+    assert dxf.find("df", "500", find_type="equals") == _found(500, 0)
+    assert dxf.find("df", "0500", find_type="contains", column_indices=[1]) == _found(500, 1)
+    assert dxf.find("df", "7.5", find_type="equals") == _found(999, 4)
+    assert dxf.find("df", "not a number", find_type="equals", column_indices=[0]) == not_found
+
+    # Ties in the same row go to the first requested column
+    assert dxf.find("df", "5", column_indices=[1, 0], start_index=3) == _found(5, 1)
+    assert dxf.find("df", "5", column_indices=[0, 1], start_index=3) == _found(5, 0)
+
+    # Categorical and Arrow-backed columns
+    assert dxf.find("df", "ODD", find_type="equals", start_index=10) == _found(11, 2)
+    assert dxf.find("df", "ODD", find_type="equals", case_sensitive=True) == not_found
+    assert dxf.find("df", "key99", find_type="ends_with", column_indices=[3]) == _found(99, 3)
+    assert dxf.find("df", "Key9", find_type="starts_with", column_indices=[3], start_index=10) == (
+        _found(90, 3)
+    )
+
+    # Previous and wrapping
+    assert dxf.find("df", "id-00", column_indices=[1], start_index=500, direction="previous") == (
+        _found(99, 1)
+    )
+    assert dxf.find("df", "id-08", column_indices=[1], start_index=999) == not_found
+    assert dxf.find("df", "id-08", column_indices=[1], start_index=999, wrap=True) == (
+        _found(800, 1)
+    )
+    assert dxf.find(
+        "df", "id-00", column_indices=[1], start_index=50, direction="previous", wrap=True
+    ) == _found(50, 1)
+    assert dxf.find(
+        "df", "id-09", column_indices=[1], start_index=50, direction="previous", wrap=True
+    ) == _found(999, 1)
+
+    # Positions are in the filtered and sorted view
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", [_compare_filter(schema[0], ">=", "100")])
+    dxf.set_sort_columns("df", [{"column_index": 0, "ascending": False}])
+    assert dxf.find("df", "id-0899", find_type="equals", column_indices=[1]) == _found(100, 1)
+    assert dxf.find("df", "id-0099", find_type="equals", column_indices=[1]) == not_found
+
+    with pytest.raises(AssertionError, match="Invalid column index"):
+        dxf.find("df", "x", column_indices=[5])
+
+    # Contains terms are regular expressions
+    with pytest.raises(AssertionError, match=r"Invalid regular expression 'id-\('"):
+        dxf.find("df", "id-(")
+
+    # Arrow does not support all of Python's regular expression syntax
+    with pytest.raises(AssertionError, match="Invalid regular expression"):
+        dxf.find("df", "(?=Key)", column_indices=[3])
+
+
+def test_pandas_batch(dxf: DataExplorerFixture, monkeypatch):
+    df = pd.DataFrame({"a": np.arange(10), "b": [f"x{i}" for i in range(10)]})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", [_compare_filter(schema[0], ">=", "5")])
+
+    num_materialized = []
+    get_filtered_column = PandasView._get_filtered_column
+
+    def counting_get_filtered_column(self, column_index):
+        num_materialized.append(column_index)
+        return get_filtered_column(self, column_index)
+
+    monkeypatch.setattr(PandasView, "_get_filtered_column", counting_get_filtered_column)
+
+    profiles = [_get_null_count(0), _get_summary_stats(0)]
+    data_params = {
+        "row_start_index": 0,
+        "num_rows": 2,
+        "column_indices": [0, 1],
+        "format_options": DEFAULT_FORMAT,
+    }
+    requests = [
+        {"method": "get_state", "params": {}},
+        {"method": "get_data_values", "params": data_params},
+        {
+            "method": "get_column_profiles",
+            "params": {"profiles": profiles, "format_options": DEFAULT_FORMAT},
+        },
+        {
+            "method": "get_column_profiles",
+            "params": {"profiles": profiles[:1], "format_options": DEFAULT_FORMAT},
+        },
+        {"method": "get_schema", "params": {"start_index": 0}},
+        {"method": "not_a_method", "params": {}},
+        {
+            "method": "find",
+            "params": {
+                "term": "x",
+                "find_type": "contains",
+                "case_sensitive": False,
+                "column_indices": [7],
+                "start_index": 0,
+                "direction": "next",
+                "wrap": False,
+            },
+        },
+        {"method": "batch", "params": {"requests": []}},
+    ]
+    responses = dxf.do_json_rpc("df", "batch", requests=requests)
+
+    # Filtered column 0 is only materialized once for all profiles
+    assert num_materialized == [0]
+
+    assert [response["error"] for response in responses[:4]] == [None] * 4
+    assert responses[0]["result"] == dxf.get_state("df")
+    assert responses[1]["result"] == dxf.get_data_values("df", **data_params)
+    assert responses[2]["result"] == dxf.get_column_profiles("df", profiles)
+    assert responses[3]["result"] == dxf.get_column_profiles("df", profiles[:1])
+
+    # Failed requests do not stop the ones after them
+    assert responses[4]["error"]["code"] == JsonRpcErrorCode.INVALID_REQUEST
+    assert responses[5]["error"]["code"] == JsonRpcErrorCode.INVALID_REQUEST
+    assert responses[6]["error"] == {
+        "code": JsonRpcErrorCode.INVALID_PARAMS,
+        "message": "Invalid column index: 7",
+    }
+    assert responses[7]["error"]["message"] == "Batch requests cannot be nested"
+
+
+def test_pandas_batch_unexpected_error(dxf: DataExplorerFixture, monkeypatch):
+    dxf.register_table("df", pd.DataFrame({"a": [1, 2, 3]}))
+
+    def failing_null_count(self, column_index):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(PandasView, "_prof_null_count", failing_null_count)
+
+    requests = [
+        {"method": "get_state", "params": {}},
+        {
+            "method": "get_column_profiles",
+            "params": {"profiles": [_get_null_count(0)], "format_options": DEFAULT_FORMAT},
+        },
+        {"method": "get_schema", "params": {"start_index": 0, "num_columns": 1}},
+    ]
+    responses = dxf.do_json_rpc("df", "batch", requests=requests)
+
+    # An unexpected error fails only its own request
+    assert responses[0]["result"] == dxf.get_state("df")
+    assert responses[1] == {
+        "result": None,
+        "error": {
+            "code": JsonRpcErrorCode.INTERNAL_ERROR,
+            "message": "Failed to process get_column_profiles request: boom",
+        },
+    }
+    assert responses[2]["result"]["columns"] == dxf.get_schema("df")
+
+
+def test_pandas_sampling(dxf: DataExplorerFixture):
+    length = 1000
+    df = pd.DataFrame(
+        {
+            "a": np.arange(length),
+            "g": ["x"] * 900 + ["y"] * 90 + [None] * 10,
+        }
+    )
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", [_compare_filter(schema[0], ">", "500")])
+
+    assert dxf.set_sampling("df", "head", num_rows=50) == {"num_rows": 50}
+    state = dxf.get_state("df")
+    assert state["sampling"] == {
+        "method": "head",
+        "num_rows": 50,
+        "unsampled_num_rows": length,
+        "column_index": None,
+    }
+    assert state["table_unfiltered_shape"] == {"num_rows": 50, "num_columns": 2}
+    # Filters are evaluated on the sample
+    assert state["table_shape"] == {"num_rows": 0, "num_columns": 2}
+
+    # Uniform samples are random rows in their original order
+    dxf.set_sampling("df", "uniform", num_rows=100, seed=1)
+    positions = np.sort(np.random.default_rng(1).choice(length, size=100, replace=False))
+    expected_labels = [str(x) for x in positions[positions > 500]]
+    assert dxf.get_state("df")["table_shape"]["num_rows"] == len(expected_labels)
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=100, column_indices=[0])
+    assert result["row_labels"] == [expected_labels]
+
+    # Stratified samples represent each value in proportion, with at
+    # least one row each
+    dxf.set_row_filters("df", [])
+    dxf.set_sampling("df", "stratified", num_rows=50, column_index=1, seed=2)
+    assert dxf.get_state("df")["sampling"]["column_index"] == 1
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=100, column_indices=[1])
+    values = result["columns"][0]
+    assert (values.count("x"), values.count("y"), values.count(_VALUE_NONE)) == (45, 4, 1)
+    assert result["row_labels"] == [sorted(result["row_labels"][0], key=int)]
+
+    # Promote back to the full table
+    assert dxf.set_sampling("df", "full") == {"num_rows": length}
+    state = dxf.get_state("df")
+    assert state["sampling"] is None
+    assert state["table_shape"] == {"num_rows": length, "num_columns": 2}
+
+    with pytest.raises(AssertionError, match="requires a valid column_index"):
+        dxf.set_sampling("df", "stratified")
+
+
 def test_pandas_change_schema_after_sort(
     shell: PositronShell,
     de_service: DataExplorerService,
@@ -1967,27 +2737,213 @@ def test_pandas_export_data_selection(dxf: DataExplorerFixture):
             assert filt_result["data"] == filt_expected
 
 
-def _profile_request(column_index, profile_type):
-    return {"column_index": column_index, "profile_type": profile_type}
+def test_pandas_export_data_selection_chunked(dxf: DataExplorerFixture, monkeypatch):
+    # Render 3 rows at a time
+    monkeypatch.setattr(data_explorer, "EXPORT_CHUNK_NUM_CELLS", 6)
 
+    df = pd.DataFrame(
+        {
+            "a": np.arange(20),
+            "b": [f"s{i}" if i % 3 else None for i in range(20)],
+        }
+    )
+    dxf.register_table("df", df)
+    dxf.register_table("sorted", df)
+    dxf.set_sort_columns("sorted", sort_keys=[{"column_index": 0, "ascending": False}])
 
-def _get_null_count(column_index):
-    return _profile_request(column_index, "null_count")
+    cases = [
+        ("df", _select_row_range(1, 15), df.iloc[1:16]),
+        ("df", _select_row_indices([19, 0, 4, 7, 2]), df.iloc[[19, 0, 4, 7, 2]]),
+        ("df", _select_row_range(5, 4), df.iloc[5:5]),
+        ("sorted", _select_cell_range(2, 12, 0, 1), df.iloc[::-1].iloc[2:13]),
+    ]
+    for name, selection, expected in cases:
+        for fmt, sep in [("csv", ","), ("tsv", "\t")]:
+            result = dxf.export_data_selection(name, selection, fmt)
+            assert result["data"] == expected.to_csv(sep=sep, index=False)
 
 
-def _get_summary_stats(column_index):
-    return _profile_request(column_index, "summary_stats")
+def test_export_data_selection_clipboard_size_cap(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(data_explorer, "MAX_CLIPBOARD_EXPORT_SIZE", 100)
 
+    dxf.register_table("df", pd.DataFrame({"a": np.arange(100)}))
 
-def test_pandas_profile_null_counts(dxf: DataExplorerFixture):
-    df1 = pd.DataFrame(
-        {
-            "a": [0, np.nan, 2, np.nan, 4, 5, 6],
-            "b": ["zero", None, None, None, "four", "five", "six"],
-            "c": [False, False, False, None, None, None, None],
-            "d": [0, 1, 2, 3, 4, 5, 6],
-        }
-    )
+    result = dxf.export_data_selection("df", _select_row_range(0, 5))
+    assert result["data"] == "a\n0\n1\n2\n3\n4\n5\n"
+
+    with pytest.raises(AssertionError, match="export it to a file instead"):
+        dxf.export_data_selection("df", _select_row_range(0, 99))
+
+
+def test_export_data_selection_to_file(dxf: DataExplorerFixture, monkeypatch, tmp_path):
+    monkeypatch.setattr(data_explorer, "EXPORT_CHUNK_NUM_CELLS", 20)
+
+    length = 50
+    df = pd.DataFrame({"a": np.arange(length), "b": np.arange(length) * 0.5})
+    dfp = pl.DataFrame({"a": np.arange(length), "b": np.arange(length) * 0.5})
+
+    for name, table in [("df", df), ("dfp", dfp)]:
+        dxf.register_table(name, table)
+
+        path = tmp_path / f"{name}.csv"
+        result = dxf.export_data_selection_to_file(name, _select_row_range(0, 44), str(path))
+        assert result == {
+            "path": str(path),
+            "num_rows": 45,
+            "num_bytes": path.stat().st_size,
+        }
+
+        expected = pd.DataFrame({"a": np.arange(45), "b": np.arange(45) * 0.5})
+        pd.testing.assert_frame_equal(pd.read_csv(path), expected)
+
+        # Progress is reported after each chunk of 10 rows
+        paths = dxf.de_service.get_paths_for_variable(name)
+        comm_id = list(dxf.de_service.path_to_comm_ids[paths[0]])[0]
+        messages = cast(DummyComm, dxf.de_service.comms[comm_id].comm).messages
+        progress = [
+            msg["data"]["params"]
+            for msg in messages
+            if msg["data"].get("method") == "export_progress"
+        ]
+        assert [p["rows_written"] for p in progress] == [10, 20, 30, 40, 45]
+        assert all(p["total_rows"] == 45 and p["path"] == str(path) for p in progress)
+
+    with pytest.raises(AssertionError, match="Could not write to"):
+        dxf.export_data_selection_to_file(
+            "df", _select_row_range(0, 5), str(tmp_path / "missing" / "df.csv")
+        )
+
+    # A failed export leaves an existing file untouched, and no partial
+    # file behind
+    path = tmp_path / "dfp.html"
+    path.write_text("existing")
+    with pytest.raises(AssertionError):
+        dxf.export_data_selection_to_file("dfp", _select_row_range(0, 5), str(path), "html")
+    assert path.read_text() == "existing"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["df.csv", "dfp.csv", "dfp.html"]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow_ipc"])
+def test_pandas_export_data_selection_binary(dxf: DataExplorerFixture, monkeypatch, tmp_path, fmt):
+    import pyarrow.feather
+    import pyarrow.parquet
+
+    # Render 10 rows at a time
+    monkeypatch.setattr(data_explorer, "EXPORT_CHUNK_NUM_CELLS", 30)
+
+    length = 100
+    df = pd.DataFrame(
+        {
+            "a": np.arange(length),
+            "b": [None] * 50 + [f"s{i}" for i in range(50)],
+            "c": pd.Categorical(["x", "y"] * 50),
+            "d": np.arange(length) * 0.5,
+        }
+    )
+    dxf.register_table("df", df)
+
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], ">=", "20")])
+    dxf.set_sort_columns("df", sort_keys=[{"column_index": 0, "ascending": False}])
+
+    path = tmp_path / f"df.{fmt}"
+    result = dxf.export_data_selection_to_file(
+        "df", _select_column_indices([0, 1, 2]), str(path), fmt
+    )
+    assert result["num_rows"] == 80
+
+    if fmt == "parquet":
+        exported = pyarrow.parquet.read_table(path).to_pandas()
+    else:
+        exported = pyarrow.feather.read_table(path).to_pandas()
+
+    expected = df.iloc[::-1].iloc[:80, :3].reset_index(drop=True)
+    pd.testing.assert_frame_equal(exported, expected)
+
+    # Binary formats cannot be copied to the clipboard
+    with pytest.raises(AssertionError, match="can only be exported to a file"):
+        dxf.export_data_selection("df", _select_row_range(0, 5), fmt)
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow_ipc"])
+def test_polars_export_data_selection_binary(dxf: DataExplorerFixture, tmp_path, fmt):
+    dfp = pl.DataFrame({"a": np.arange(100), "b": [f"s{i}" for i in range(100)]})
+    dxf.register_table("dfp", dfp)
+
+    schema = dxf.get_schema("dfp")
+    dxf.set_row_filters("dfp", filters=[_compare_filter(schema[0], "<", "30")])
+
+    path = tmp_path / f"dfp.{fmt}"
+    result = dxf.export_data_selection_to_file("dfp", _select_row_range(5, 24), str(path), fmt)
+    assert result["num_rows"] == 20
+
+    if fmt == "parquet":
+        exported = pl.read_parquet(path)
+    else:
+        exported = pl.read_ipc(path)
+
+    assert exported.equals(dfp[5:25])
+
+
+def test_polars_export_data_selection(dxf: DataExplorerFixture):
+    length = 100
+    ncols = 5
+
+    np.random.seed(12345)
+    dfp = pl.DataFrame({f"a{i}": np.random.standard_normal(length) for i in range(ncols)})
+
+    dxf.register_table("dfp", dfp)
+    dxf.register_table("filtered", dfp)
+
+    schema = dxf.get_schema("filtered")
+    dxf.set_row_filters("filtered", filters=[_compare_filter(schema[0], ">", "0")])
+    filtered = dfp.filter(pl.col("a0") > 0)
+
+    for row_index, col_index in [(0, 0), (5, 3), (10, 4)]:
+        selection = _select_single_cell(row_index, col_index)
+        result = dxf.export_data_selection("filtered", selection, "csv")
+        assert result["data"] == str(filtered[row_index, col_index])
+
+    range_cases = [
+        (_select_cell_range(1, 4, 2, 3), lambda x: x[1:5, 2:4]),
+        (_select_column_range(1, 2), lambda x: x[:, 1:3]),
+        (_select_row_range(1, 5), lambda x: x[1:6]),
+        (_select_row_indices([0, 3, 5, 7]), lambda x: x[[0, 3, 5, 7]]),
+        (_select_column_indices([0, 3]), lambda x: x[:, [0, 3]]),
+    ]
+    for rpc_selection, select in range_cases:
+        for name, table in [("dfp", dfp), ("filtered", filtered)]:
+            result = dxf.export_data_selection(name, rpc_selection, "csv")
+            assert result["data"] == select(table).write_csv()
+
+            result = dxf.export_data_selection(name, rpc_selection, "tsv")
+            assert result["data"] == select(table).write_csv(separator="\t")
+
+    with pytest.raises(AssertionError, match="not supported for polars"):
+        dxf.export_data_selection("dfp", _select_row_range(1, 5), "html")
+
+
+def _profile_request(column_index, profile_type):
+    return {"column_index": column_index, "profile_type": profile_type}
+
+
+def _get_null_count(column_index):
+    return _profile_request(column_index, "null_count")
+
+
+def _get_summary_stats(column_index):
+    return _profile_request(column_index, "summary_stats")
+
+
+def test_pandas_profile_null_counts(dxf: DataExplorerFixture):
+    df1 = pd.DataFrame(
+        {
+            "a": [0, np.nan, 2, np.nan, 4, 5, 6],
+            "b": ["zero", None, None, None, "four", "five", "six"],
+            "c": [False, False, False, None, None, None, None],
+            "d": [0, 1, 2, 3, 4, 5, 6],
+        }
+    )
     tables = {"df1": df1}
 
     for name, df in tables.items():
@@ -2052,6 +3008,53 @@ def test_pandas_profile_null_counts(dxf: DataExplorerFixture):
         assert results == ex_results
 
 
+def test_pandas_profile_frequency_table(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(data_explorer, "FREQUENCY_TABLE_NUM_VALUES", 2)
+
+    values = ["b", "a", None, "c", "b", "a", "b", None, "d"]
+    df = pd.DataFrame(
+        {
+            "cat": pd.Categorical(values, categories=["d", "a", "b", "c", "unused"]),
+            "obj": values,
+        }
+    )
+    dxf.register_table("df", df)
+
+    def _freq_table(counts, other_count):
+        return ColumnProfileResult(
+            frequency_table=ColumnFrequencyTable(
+                counts=[ColumnFrequencyTableItem(value=v, count=c) for v, c in counts],
+                other_count=other_count,
+            )
+        )
+
+    results = dxf.get_column_profiles(
+        "df",
+        [
+            _profile_request(0, "frequency_table"),
+            _profile_request(1, "frequency_table"),
+            _get_null_count(0),
+        ],
+    )
+    assert results == [
+        _freq_table([("b", 3), ("a", 2)], 2),
+        _freq_table([("b", 3), ("a", 2)], 2),
+        ColumnProfileResult(null_count=2),
+    ]
+
+    # Categoricals of strings are summarized like strings
+    cat_stats, obj_stats = dxf.get_column_profiles(
+        "df", [_get_summary_stats(0), _get_summary_stats(1)]
+    )
+    assert cat_stats == obj_stats
+
+    # Profiles respect filters
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", [_set_member_filter(schema[0], ["a", "c", "d"])])
+    results = dxf.get_column_profiles("df", [_profile_request(0, "frequency_table")])
+    assert results == [_freq_table([("a", 2), ("d", 1)], 1)]
+
+
 EPSILON = 1e-7
 
 
@@ -2313,6 +3316,120 @@ def test_pandas_profile_summary_stats(dxf: DataExplorerFixture):
             _assert_datetime_stats_equal(ex_result, stats["datetime_stats"])
 
 
+def test_pandas_arrow_profile_summary_stats(dxf: DataExplorerFixture):
+    import pyarrow as pa
+
+    def timestamps(tz=None):
+        values = [datetime(2000, 1, 1), None, datetime(2000, 1, 3), datetime(2000, 1, 9)]
+        return pd.Series(values, dtype=pd.ArrowDtype(pa.timestamp("us", tz=tz)))
+
+    decimals = [Decimal("1.50"), None, Decimal("-2.25"), Decimal("4.00")]
+    df = pd.DataFrame(
+        {
+            "a": timestamps(),
+            "b": timestamps("US/Eastern"),
+            "c": pd.Series(decimals, dtype=pd.ArrowDtype(pa.decimal128(10, 2))),
+            "d": pd.Series(
+                [datetime(2000, 1, 1).date(), None, datetime(2000, 1, 3).date(), None],
+                dtype=pd.ArrowDtype(pa.date32()),
+            ),
+            "e": pd.Series([None] * 4, dtype=pd.ArrowDtype(pa.timestamp("ns"))),
+        }
+    )
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    assert [c["type_display"] for c in schema] == [
+        "datetime",
+        "datetime",
+        "number",
+        "date",
+        "datetime",
+    ]
+
+    format_options = FormatOptions(
+        large_num_digits=4,
+        small_num_digits=6,
+        max_integral_digits=7,
+        thousands_sep="_",
+    )
+    _format_float = _get_float_formatter(format_options)
+    floats = pd.Series([1.5, None, -2.25, 4.0])
+
+    cases = [
+        (
+            0,
+            {
+                "num_unique": 3,
+                "min_date": "2000-01-01 00:00:00",
+                "mean_date": "2000-01-04 08:00:00",
+                "median_date": "2000-01-03 00:00:00",
+                "max_date": "2000-01-09 00:00:00",
+                "timezone": "None",
+            },
+        ),
+        (
+            1,
+            {
+                "num_unique": 3,
+                "min_date": "1999-12-31 19:00:00-05:00",
+                "mean_date": "2000-01-04 03:00:00-05:00",
+                "median_date": "2000-01-02 19:00:00-05:00",
+                "max_date": "2000-01-08 19:00:00-05:00",
+                "timezone": "US/Eastern",
+            },
+        ),
+        (
+            2,
+            {
+                "min_value": _format_float(-2.25),
+                "max_value": _format_float(4.0),
+                "mean": _format_float(floats.mean()),
+                "stdev": _format_float(floats.std()),
+                "median": _format_float(floats.median()),
+            },
+        ),
+        (
+            3,
+            {
+                "num_unique": 2,
+                "min_date": "2000-01-01",
+                "mean_date": "2000-01-02",
+                "median_date": "2000-01-01",
+                "max_date": "2000-01-03",
+            },
+        ),
+        (
+            4,
+            {
+                "num_unique": 0,
+                "min_date": "NaT",
+                "mean_date": "NaT",
+                "median_date": "NaT",
+                "max_date": "NaT",
+                "timezone": "None",
+            },
+        ),
+    ]
+
+    for col_index, ex_result in cases:
+        results = dxf.get_column_profiles(
+            "df", [_get_summary_stats(col_index)], format_options=format_options
+        )
+        stats = results[0]["summary_stats"]
+        ui_type = stats["type_display"]
+
+        if ui_type == ColumnDisplayType.Number:
+            _assert_numeric_stats_equal(ex_result, stats["number_stats"])
+        elif ui_type == ColumnDisplayType.Date:
+            _assert_date_stats_equal(ex_result, stats["date_stats"])
+        else:
+            _assert_datetime_stats_equal(ex_result, stats["datetime_stats"])
+
+    # Filter values are compared in the column's time zone
+    dxf.check_filter_case(df, [_compare_filter(schema[1], ">", "2000-01-02")], df.iloc[[2, 3]])
+    dxf.check_filter_case(df, [_compare_filter(schema[2], ">=", "1.5")], df.iloc[[0, 3]])
+
+
 # ----------------------------------------------------------------------
 # polars backend functionality tests
 
@@ -2456,7 +3573,7 @@ def test_polars_get_state(dxf: DataExplorerFixture):
         ),
         ColumnProfileTypeSupportStatus(
             profile_type="summary_stats",
-            support_status=SupportStatus.Unsupported,
+            support_status=SupportStatus.Experimental,
         ),
     ]
 
@@ -2603,6 +3720,28 @@ def test_polars_filter_is_valid_flag(dxf: DataExplorerFixture):
     dxf.check_filter_case(df, filters, df)
 
 
+def test_polars_filter_runtime_errors(dxf: DataExplorerFixture):
+    # Filters are compiled into a single query. Errors that only
+    # surface when it runs are attributed to the failing filter
+    dfp = pl.DataFrame({"a": [1, 2, 3, 4], "b": ["foo", "bar", "baz", "qux"]})
+    dxf.register_table("dfp", dfp)
+    schema = dxf.get_schema("dfp")
+
+    filters = [
+        _compare_filter(schema[0], ">=", 2),
+        _search_filter(schema[1], "(", search_type="contains"),
+    ]
+    result = dxf.set_row_filters("dfp", filters)
+    assert result == FilterResult(selected_num_rows=3, had_errors=True)
+
+    row_filters = dxf.get_state("dfp")["row_filters"]
+    assert [filt["is_valid"] for filt in row_filters] == [True, False]
+    assert row_filters[1]["error_message"]
+
+    result = dxf.get_data_values("dfp", row_start_index=0, num_rows=10, column_indices=[1])
+    assert result["columns"] == [["bar", "baz", "qux"]]
+
+
 def test_polars_filter_empty(dxf: DataExplorerFixture):
     df = pl.DataFrame(
         {
@@ -2857,6 +3996,98 @@ def test_polars_set_sort_columns(dxf: DataExplorerFixture):
             dxf.check_sort_case(df, wrapped_keys, expected_filtered, filters=filters)
 
 
+def test_polars_group_by(dxf: DataExplorerFixture):
+    dfp = pl.DataFrame(
+        {
+            "a": ["x", "y", "x", None, "y", "x"],
+            "b": [1, 2, 3, 4, 5, 6],
+            "c": [1.0, None, 3, 4, 5, 6],
+        }
+    )
+    dxf.register_table("dfp", dfp)
+
+    aggregations = [_aggregation(1, "max"), _aggregation(2, "count")]
+    assert dxf.set_group_by("dfp", [0], aggregations) == {"num_groups": 3}
+
+    def _expected(table):
+        return (
+            table.group_by("a")
+            .agg(
+                pl.len().alias("count"),
+                pl.col("b").max().alias("b_max"),
+                pl.col("c").count().alias("c_count"),
+            )
+            .sort("a", nulls_last=True)
+        )
+
+    assert dxf.get_state("dfp")["table_shape"] == {"num_rows": 3, "num_columns": 4}
+    _check_grouped_values(dxf, "dfp", _expected(dfp))
+
+    schema = dxf.get_schema_for(dfp)
+    dxf.set_group_by("dfp", [])
+    dxf.set_row_filters("dfp", [_compare_filter(schema[1], "<", "5")])
+    dxf.set_group_by("dfp", [0], aggregations)
+    _check_grouped_values(dxf, "dfp", _expected(dfp.filter(pl.col("b") < 5)))
+
+
+def test_polars_find(dxf: DataExplorerFixture):
+    dfp = pl.DataFrame(
+        {
+            "a": [1, 2, 3, 2, None],
+            "b": ["foo", "bar", None, "Foo", "baz"],
+            "c": [0.5, 2.0, 1.5, 3.0, 2.0],
+        }
+    )
+    dxf.register_table("dfp", dfp)
+
+    def _found(row_index, column_index):
+        return {"found": True, "row_index": row_index, "column_index": column_index}
+
+    assert dxf.find("dfp", "2", find_type="equals") == _found(1, 0)
+    assert dxf.find("dfp", "2", find_type="equals", start_index=2) == _found(3, 0)
+    assert dxf.find("dfp", "2", find_type="equals", start_index=4) == _found(4, 2)
+    assert dxf.find("dfp", "2", find_type="equals", column_indices=[0], start_index=4) == {
+        "found": False,
+        "row_index": None,
+        "column_index": None,
+    }
+    assert dxf.find(
+        "dfp", "2", find_type="equals", column_indices=[0], start_index=4, wrap=True
+    ) == _found(1, 0)
+    assert dxf.find("dfp", "2", find_type="equals", column_indices=[2], start_index=2) == (
+        _found(4, 2)
+    )
+    assert dxf.find("dfp", "foo", direction="previous", start_index=4) == _found(3, 1)
+    assert dxf.find("dfp", "foo", case_sensitive=True, start_index=1, wrap=True) == (_found(0, 1))
+    assert dxf.find("dfp", "^ba", find_type="regex_match", start_index=2) == _found(4, 1)
+
+    # Positions are in the sorted view
+    dxf.set_sort_columns("dfp", [{"column_index": 2, "ascending": False}])
+    assert dxf.find("dfp", "1", find_type="equals", column_indices=[0]) == _found(4, 0)
+
+    # Contains terms are regular expressions
+    with pytest.raises(AssertionError, match=r"Invalid regular expression 'ba\['"):
+        dxf.find("dfp", "ba[")
+
+    # polars does not support all of Python's regular expression syntax
+    with pytest.raises(AssertionError, match="Invalid regular expression"):
+        dxf.find("dfp", "(?=ba)", column_indices=[1])
+
+
+def test_polars_sampling(dxf: DataExplorerFixture):
+    dfp = pl.DataFrame({"a": np.arange(100), "g": ["x"] * 80 + ["y"] * 15 + [None] * 5})
+    dxf.register_table("dfp", dfp)
+
+    dxf.set_sampling("dfp", "head", num_rows=10)
+    result = dxf.get_data_values("dfp", row_start_index=0, num_rows=20, column_indices=[0])
+    assert result["columns"] == [[str(i) for i in range(10)]]
+
+    dxf.set_sampling("dfp", "stratified", num_rows=20, column_index=1, seed=0)
+    result = dxf.get_data_values("dfp", row_start_index=0, num_rows=30, column_indices=[1])
+    values = result["columns"][0]
+    assert (values.count("x"), values.count("y"), values.count(_VALUE_NULL)) == (16, 3, 1)
+
+
 def test_polars_profile_null_counts(dxf: DataExplorerFixture):
     df = pl.DataFrame(
         {
@@ -2896,3 +4127,183 @@ def test_polars_profile_null_counts(dxf: DataExplorerFixture):
         ex_results = [ColumnProfileResult(null_count=count) for count in ex_results]
 
         assert results == ex_results
+
+
+def test_polars_profile_summary_stats(dxf: DataExplorerFixture, monkeypatch):
+    arr = np.random.standard_normal(100)
+    arr_with_nulls = arr.copy()
+    arr_with_nulls[::10] = np.nan
+
+    dfp = pl.DataFrame(
+        {
+            "f0": arr,
+            "f1": arr_with_nulls,
+            "f2": [False, False, False, True, None] * 20,
+            "f3": ["foo", "", "baz", "qux", "foo", None, "bar", "", "bar", "zzz"] * 10,
+            "f4": pd.date_range("2000-01-01", freq="D", periods=100).date,
+            "f5": pd.date_range("2000-01-01", freq="2h", periods=100),
+            "f6": pl.Series(
+                pd.date_range("2000-01-01", freq="2h", periods=100)
+            ).dt.replace_time_zone("US/Eastern"),
+            "f7": [np.nan, np.inf, -np.inf, 0, np.nan] * 20,
+            "f8": pl.Series([None] * 100, dtype=pl.Int64),
+            "f9": pl.Series(
+                [Decimal("1.50"), None, Decimal("-2.25"), Decimal("4.00")] * 25,
+                dtype=pl.Decimal(scale=2),
+            ),
+        }
+    )
+    dxf.register_table("dfp", dfp)
+
+    format_options = FormatOptions(
+        large_num_digits=4,
+        small_num_digits=6,
+        max_integral_digits=7,
+        thousands_sep="_",
+    )
+    _format_float = _get_float_formatter(format_options)
+
+    f0 = pd.Series(arr)
+    f1 = pd.Series(arr_with_nulls)
+    f9 = pd.Series([1.5, None, -2.25, 4.0] * 25)
+    cases = [
+        (
+            0,
+            {
+                "min_value": _format_float(f0.min()),
+                "max_value": _format_float(f0.max()),
+                "mean": _format_float(f0.mean()),
+                "stdev": _format_float(f0.std()),
+                "median": _format_float(f0.median()),
+            },
+        ),
+        (
+            1,
+            {
+                "min_value": _format_float(f1.min()),
+                "max_value": _format_float(f1.max()),
+                "mean": _format_float(f1.mean()),
+                "stdev": _format_float(f1.std()),
+                "median": _format_float(f1.median()),
+            },
+        ),
+        (2, {"true_count": 20, "false_count": 60}),
+        (3, {"num_empty": 20, "num_unique": 6}),
+        (
+            4,
+            {
+                "num_unique": 100,
+                "min_date": "2000-01-01",
+                "mean_date": "2000-02-19",
+                "median_date": "2000-02-19",
+                "max_date": "2000-04-09",
+            },
+        ),
+        (
+            5,
+            {
+                "num_unique": 100,
+                "min_date": "2000-01-01 00:00:00",
+                "mean_date": "2000-01-05 03:00:00",
+                "median_date": "2000-01-05 03:00:00",
+                "max_date": "2000-01-09 06:00:00",
+                "timezone": "None",
+            },
+        ),
+        (
+            6,
+            {
+                "num_unique": 100,
+                "min_date": "2000-01-01 00:00:00-05:00",
+                "mean_date": "2000-01-05 03:00:00-05:00",
+                "median_date": "2000-01-05 03:00:00-05:00",
+                "max_date": "2000-01-09 06:00:00-05:00",
+                "timezone": "US/Eastern",
+            },
+        ),
+        (7, {"min_value": "-INF", "max_value": "INF"}),
+        # All nulls
+        (8, {}),
+        (
+            9,
+            {
+                "min_value": _format_float(f9.min()),
+                "max_value": _format_float(f9.max()),
+                "mean": _format_float(f9.mean()),
+                "stdev": _format_float(f9.std()),
+                "median": _format_float(f9.median()),
+            },
+        ),
+    ]
+
+    def _check_stats(stats, ex_result):
+        ui_type = stats["type_display"]
+        if ui_type == ColumnDisplayType.Number:
+            _assert_numeric_stats_equal(ex_result, stats["number_stats"])
+        elif ui_type == ColumnDisplayType.String:
+            _assert_string_stats_equal(ex_result, stats["string_stats"])
+        elif ui_type == ColumnDisplayType.Boolean:
+            _assert_boolean_stats_equal(ex_result, stats["boolean_stats"])
+        elif ui_type == ColumnDisplayType.Date:
+            _assert_date_stats_equal(ex_result, stats["date_stats"])
+        elif ui_type == ColumnDisplayType.Datetime:
+            _assert_datetime_stats_equal(ex_result, stats["datetime_stats"])
+
+    for col_index, ex_result in cases:
+        results = dxf.get_column_profiles(
+            "dfp", [_get_summary_stats(col_index)], format_options=format_options
+        )
+        _check_stats(results[0]["summary_stats"], ex_result)
+
+    # All of the columns at once
+    results = dxf.get_column_profiles(
+        "dfp",
+        [_get_summary_stats(col_index) for col_index, _ in cases],
+        format_options=format_options,
+    )
+    for result, (_, ex_result) in zip(results, cases):
+        _check_stats(result["summary_stats"], ex_result)
+
+    # Statistics are computed on the filtered rows
+    schema = dxf.get_schema("dfp")
+    dxf.set_row_filters("dfp", [_compare_filter(schema[0], ">", "0")])
+    results = dxf.get_column_profiles(
+        "dfp", [_get_summary_stats(0), _get_summary_stats(3)], format_options=format_options
+    )
+    _check_stats(
+        results[0]["summary_stats"],
+        {
+            "min_value": _format_float(f0[f0 > 0].min()),
+            "max_value": _format_float(f0[f0 > 0].max()),
+            "mean": _format_float(f0[f0 > 0].mean()),
+            "stdev": _format_float(f0[f0 > 0].std()),
+            "median": _format_float(f0[f0 > 0].median()),
+        },
+    )
+    f3 = dfp["f3"].to_pandas()[f0 > 0]
+    _check_stats(
+        results[1]["summary_stats"],
+        {"num_empty": int((f3 == "").sum()), "num_unique": f3.nunique()},
+    )
+
+    # A column that polars fails to summarize does not fail the others
+    summary_stats_exprs = data_explorer.PolarsView._summary_stats_exprs
+
+    def failing_summary_stats_exprs(col, dtype, display_type):
+        if display_type == ColumnDisplayType.String:
+            return {"num_unique": col.cast(pl.Int64, strict=True).n_unique()}
+        return summary_stats_exprs(col, dtype, display_type)
+
+    monkeypatch.setattr(
+        data_explorer.PolarsView,
+        "_summary_stats_exprs",
+        staticmethod(failing_summary_stats_exprs),
+    )
+    results = dxf.get_column_profiles(
+        "dfp", [_get_summary_stats(0), _get_summary_stats(3)], format_options=format_options
+    )
+    assert results[0]["summary_stats"]["number_stats"]["min_value"] == _format_float(
+        f0[f0 > 0].min()
+    )
+    assert results[1]["summary_stats"]["type_display"] == ColumnDisplayType.String
+    assert results[1]["summary_stats"]["string_stats"] is None
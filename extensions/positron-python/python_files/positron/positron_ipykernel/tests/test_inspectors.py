@@ -8,7 +8,9 @@ import inspect
 import pprint
 import random
 import string
+import sys
 import types
+from collections.abc import Set
 from typing import Any, Callable, Iterable, Optional, Tuple
 
 import numpy as np
@@ -17,10 +19,14 @@ import polars as pl
 import pytest
 from fastcore.foundation import L
 
+from positron_ipykernel import inspectors as inspectors_module
 from positron_ipykernel.inspectors import (
     PRINT_WIDTH,
     TRUNCATE_AT,
+    MemorySizer,
+    StringInspector,
     get_inspector,
+    get_memory_size,
 )
 from positron_ipykernel.utils import get_qualname
 from positron_ipykernel.variables_comm import VariableKind
@@ -410,6 +416,30 @@ def test_inspect_set_truncated() -> None:
     )
 
 
+def test_inspect_list_truncated_bounded() -> None:
+    # Only the items that can be shown in the truncated display value are formatted
+    num_reprs = 0
+
+    class Item:
+        def __repr__(self) -> str:
+            nonlocal num_reprs
+            num_reprs += 1
+            return "x"
+
+    value = [Item()] * (TRUNCATE_AT * 100)
+    display_value = pprint.pformat(value[:TRUNCATE_AT], width=PRINT_WIDTH, compact=True)
+    num_reprs = 0
+    assert get_inspector(value).get_display_value() == (display_value[:TRUNCATE_AT], True)
+    assert num_reprs <= TRUNCATE_AT * 10
+
+
+def test_inspect_dict_truncated_sorted() -> None:
+    # pformat sorts dicts, so the shown items are the smallest keys, not the first ones
+    value = {i: i for i in reversed(range(TRUNCATE_AT * 2))}
+    display_value = pprint.pformat(value, width=PRINT_WIDTH, compact=True)
+    assert get_inspector(value).get_display_value() == (display_value[:TRUNCATE_AT], True)
+
+
 LIST_WITH_CYCLE = list([1, 2])
 LIST_WITH_CYCLE.append(LIST_WITH_CYCLE)  # type: ignore
 LIST_CASES = [
@@ -637,6 +667,7 @@ def test_inspect_numpy_array(value: np.ndarray) -> None:
         display_type=f"numpy.int64 {display_shape}",
         type_info="numpy.ndarray",
         has_children=True,
+        has_viewer=True,
         is_truncated=True,
         length=shape[0],
         mutable=True,
@@ -644,6 +675,23 @@ def test_inspect_numpy_array(value: np.ndarray) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("value", "has_viewer"),
+    [
+        (np.zeros((2, 2)), True),
+        (np.zeros((2, 2, 2)), False),
+        (np.zeros(3, dtype=[("x", "i8"), ("y", "f8")]), True),
+        (np.zeros(3, dtype=[("x", "i8", (2,))]), False),
+        ({"a": np.arange(3), "b": np.zeros(3)}, True),
+        ({"a": np.arange(3), "b": np.zeros(4)}, False),
+        ({"a": np.arange(3), "b": [1, 2, 3]}, False),
+        ({}, False),
+    ],
+)
+def test_inspect_numpy_has_viewer(value, has_viewer: bool) -> None:
+    assert get_inspector(value).has_viewer() == has_viewer
+
+
 @pytest.mark.parametrize(
     "value",
     [
@@ -868,3 +916,224 @@ def test_arrays_maps_get_size(value: Any, expected: int) -> None:
         return
     inspector = get_inspector(value)
     assert inspector.get_size() == expected
+
+
+def _set_first(value: Any) -> Any:
+    value = value.clone() if isinstance(value, (pl.DataFrame, pl.Series)) else value.copy()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        value.iloc[(0,) * value.ndim] = 100
+    elif isinstance(value, pl.DataFrame):
+        value[0, 0] = 100
+    else:
+        value[0] = 100
+    return value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.arange(6).reshape(2, 3),
+        np.arange(6)[::2],
+        pd.Series([1, 2, 3], index=["a", "b", "c"]),
+        pd.Series(pd.array([1, None, 3], dtype="Int64")),
+        pd.DataFrame({"a": [1, 2], "b": ["3", "4"], "c": pd.Categorical(["x", "y"])}),
+        pd.Series(["a", None, b"c"]),
+        pl.Series([1, None, 3]),
+        pl.DataFrame({"a": [1, 2], "b": ["3", "4"]}),
+    ],
+)
+def test_fingerprint(value: Any) -> None:
+    fingerprint = get_inspector(value).fingerprint()
+    assert fingerprint is not None
+
+    # Equal values have equal fingerprints
+    assert get_inspector(get_inspector(value).deepcopy()).fingerprint() == fingerprint
+
+    # Changing a value changes the fingerprint
+    assert get_inspector(_set_first(value)).fingerprint() != fingerprint
+
+
+def test_fingerprint_metadata() -> None:
+    def fingerprint(value):
+        return get_inspector(value).fingerprint()
+
+    array = np.arange(6)
+    assert fingerprint(array) != fingerprint(array.reshape(2, 3))
+    assert fingerprint(array) != fingerprint(array.astype("uint64"))
+
+    df = pd.DataFrame({"a": [1, 2]})
+    assert fingerprint(df) != fingerprint(df.rename(columns={"a": "b"}))
+    assert fingerprint(df) != fingerprint(df.set_axis([5, 6]))
+    assert fingerprint(df["a"]) != fingerprint(df["a"].rename("b"))
+
+    assert fingerprint(pd.Series(["a"])) != fingerprint(pd.Series([b"a"]))
+    assert fingerprint(pd.Series(["a", None])) != fingerprint(pd.Series(["a", np.nan]))
+
+    assert fingerprint(pl.Series("a", [1])) != fingerprint(pl.Series("b", [1]))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [1, 2],
+        np.array([[1], "a"], dtype=object),
+        pd.DataFrame({"a": [[1], [2]]}),
+        # Hashing these by their string form would confuse them with
+        # strings, and miss in-place changes to mutable objects
+        pd.Series([1], dtype=object),
+        pd.Series([HelperClass()]),
+    ],
+)
+def test_fingerprint_unsupported(value: Any) -> None:
+    assert get_inspector(value).fingerprint() is None
+
+
+def test_fingerprint_sampling(monkeypatch) -> None:
+    monkeypatch.setattr(inspectors_module, "FINGERPRINT_BLOCK_SIZE", 8)
+    monkeypatch.setattr(inspectors_module, "FINGERPRINT_SAMPLE_THRESHOLD", 32)
+
+    # 100 blocks of 8 bytes, of which every 25th and the last are sampled
+    value = np.arange(100, dtype="int64")
+    fingerprint = get_inspector(value).fingerprint()
+
+    for i, changed in [(0, True), (1, False), (50, True), (98, False), (99, True)]:
+        other = value.copy()
+        other[i] = -1
+        assert (get_inspector(other).fingerprint() != fingerprint) == changed
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pd.Series([1, 2, 3], name="a"),
+        pd.DataFrame({"a": [1, 2], "b": ["3", "4"], "c": pd.array([1, None], dtype="Int64")}),
+    ],
+)
+def test_pandas_copy_on_write_deepcopy(value: Any) -> None:
+    with pd.option_context("mode.copy_on_write", True):
+        value = value.copy()
+        inspector = get_inspector(value)
+        assert inspector.has_shallow_copy()
+
+        # The copy shares memory with the original
+        copied = inspector.deepcopy()
+        first = (lambda x: x) if isinstance(value, pd.Series) else (lambda x: x.iloc[:, 0])
+        assert np.shares_memory(first(copied).to_numpy(), first(value).to_numpy())
+        assert inspector.equals(copied)
+
+        # In-place modifications don't affect the copy
+        value.iloc[(1,) * value.ndim] = 100
+        assert not get_inspector(copied).equals(value)
+
+    assert not get_inspector(value).has_shallow_copy()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pl.Series([1, None, 3]),
+        pl.DataFrame({"a": [1, 2], "b": ["3", "4"], "c": [[1], [2]]}),
+    ],
+)
+def test_polars_deepcopy(value: Any) -> None:
+    value = value.clone()
+    inspector = get_inspector(value)
+    assert inspector.has_shallow_copy()
+
+    copied = inspector.deepcopy()
+    assert inspector.equals(copied)
+
+    if isinstance(value, pl.DataFrame):
+        value[1, "a"] = 100
+    else:
+        value[1] = 100
+    assert not get_inspector(copied).equals(value)
+
+
+@pytest.mark.parametrize(
+    "make_value",
+    [
+        lambda: pd.Series([1, 2, 3], name="a"),
+        lambda: pd.DataFrame({"a": [1, 2], "b": [3, 4]}),
+        lambda: pl.Series([1, 2, 3]),
+        lambda: pl.DataFrame({"a": [1, 2], "b": [3, 4]}),
+    ],
+)
+def test_shallow_copy_equals_budget(make_value: Callable[[], Any], monkeypatch) -> None:
+    with pd.option_context("mode.copy_on_write", True):
+        value, other = make_value(), make_value()
+        inspector = get_inspector(value)
+        assert inspector.has_shallow_copy()
+
+        # Equal values that don't share buffers are compared in full...
+        assert inspector.equals(other)
+
+        # ...unless that exceeds the comparison budget, in which case they're treated as changed
+        monkeypatch.setattr(inspectors_module, "MAX_SNAPSHOT_COMPARISON_BUDGET", 1)
+        assert not inspector.equals(other)
+        assert inspector.equals(inspector.deepcopy())
+
+
+def test_get_inspector_cache(monkeypatch) -> None:
+    class Custom:
+        pass
+
+    value = Custom()
+    assert type(get_inspector(value)) is inspectors_module.ObjectInspector
+    assert not hasattr(get_inspector(value), "__dict__")
+
+    # Registering a virtual subclass of an ABC changes the value's kind
+    Set.register(Custom)
+    assert type(get_inspector(value)) is inspectors_module.CollectionInspector
+
+    # Adding an inspector class takes precedence over the cached class
+    monkeypatch.setitem(inspectors_module.INSPECTOR_CLASSES, get_qualname(value), StringInspector)
+    assert type(get_inspector(value)) is StringInspector
+
+    monkeypatch.undo()
+    assert type(get_inspector(value)) is inspectors_module.CollectionInspector
+
+
+def test_get_memory_size() -> None:
+    # Shared objects and buffers are counted once
+    array = np.zeros(1000)
+    assert get_memory_size(array[::2]) == sys.getsizeof(array[::2]) + array.nbytes
+    assert get_memory_size([array, array[:10]]) == (
+        sys.getsizeof([None, None]) + sys.getsizeof(array) + sys.getsizeof(array[:10])
+    )
+
+    strings = ["a" * 100, "b" * 100]
+    assert get_memory_size(strings * 10) == sys.getsizeof(strings * 10) + sum(
+        sys.getsizeof(s) for s in strings
+    )
+    assert get_memory_size(np.array(strings * 10, dtype=object)) == (
+        sys.getsizeof(np.array(strings * 10, dtype=object)) + sum(sys.getsizeof(s) for s in strings)
+    )
+
+    # Cycles terminate
+    cycle: list = []
+    cycle.append(cycle)
+    assert get_memory_size(cycle) == sys.getsizeof(cycle)
+
+
+def test_get_memory_size_dataframes() -> None:
+    strings = [str(i) * 100 for i in range(1000)]
+    df = pd.DataFrame({"a": strings, "b": strings})
+    # Unlike memory_usage(deep=True), shared strings are counted once
+    assert get_memory_size(df) < df.memory_usage(deep=True).sum()
+    assert get_memory_size(df) > sum(sys.getsizeof(s) for s in strings)
+
+    s = pl.Series(range(1000))
+    assert get_memory_size(pl.DataFrame([s, s.alias("b")])) < (
+        pl.DataFrame([s, s.alias("b")]).estimated_size()
+    )
+
+
+def test_memory_sizer_steps() -> None:
+    value = [[i] for i in range(100)]
+    sizer = MemorySizer(value)
+    steps = 1
+    while not sizer.step(10):
+        steps += 1
+    assert steps > 10
+    assert sizer.size == get_memory_size(value)
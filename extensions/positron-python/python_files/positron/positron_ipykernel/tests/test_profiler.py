@@ -0,0 +1,335 @@
+#
+# Copyright (C) 2024 Posit Software, PBC. All rights reserved.
+# Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
+#
+
+import re
+import threading
+import tracemalloc
+from typing import Iterable, List
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from positron_ipykernel import profiler as profiler_module
+from positron_ipykernel.positron_ipkernel import PositronIPyKernel
+from positron_ipykernel.profiler import (
+    AllocationFrame,
+    AllocationSite,
+    AllocationTracker,
+    Profiler,
+    ProfilerService,
+    format_allocations,
+    format_flat_profile,
+    get_title,
+)
+
+from .conftest import PositronShell
+
+CODE = """\
+import time
+
+def busy(duration):
+    end = time.process_time() + duration
+    while time.process_time() < end:
+        pass
+
+def f():
+    busy(0.1)
+
+def g():
+    busy(0.05)
+    f()
+"""
+
+
+@pytest.fixture
+def profiler_service(kernel: PositronIPyKernel) -> Iterable[ProfilerService]:
+    service = kernel.profiler_service
+
+    yield service
+
+    service.cancel_cell()
+    service.profile_cells = False
+    service.disable_allocation_tracking()
+
+
+@pytest.fixture
+def displayed(shell: PositronShell, monkeypatch) -> List[str]:
+    """
+    The plain text displayed in the output of executions.
+    """
+    texts = []
+
+    def publish(data, *args, **kwargs):
+        texts.append(data["text/plain"])
+
+    monkeypatch.setattr(shell.display_pub, "publish", publish)
+    return texts
+
+
+def _profile(interval: float = 0.001) -> Profiler:
+    namespace = {}
+    exec(CODE, namespace)
+    profiler = Profiler(interval)
+    profiler.runctx(compile("g()", "<test>", "exec"), namespace, namespace)
+    return profiler
+
+
+def _run_in_thread(func):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+@pytest.mark.parametrize("in_thread", [False, True])
+def test_profiler(in_thread: bool) -> None:
+    # Profilers in a non-main thread sample from a background thread
+    profiler = _run_in_thread(_profile) if in_thread else _profile()
+
+    assert profiler.num_samples > 0
+    assert profiler.elapsed >= 0.15
+
+    columns = profiler.get_flat_profile()
+
+    # Only the profiled code is included
+    assert set(columns["function"]) == {"<module>", "g", "f", "busy"}
+    assert columns["filename"][columns["function"].index("<module>")] == "<test>"
+
+    assert columns["function"][0] == "busy"
+    assert columns["total_percent"][0] == 100
+    assert sum(columns["self_samples"]) == profiler.num_samples
+    assert columns["self_time"][0] == pytest.approx(columns["self_samples"][0] * 0.001)
+
+    lines = format_flat_profile(profiler, max_rows=2).splitlines()
+    assert lines[0] == f"{profiler.num_samples} samples in {profiler.elapsed:.3f}s"
+    assert len(lines) == 4
+    assert lines[2].endswith(f"busy (<string>:{columns['line_number'][0]})")
+
+
+def test_profiler_restart() -> None:
+    profiler = Profiler()
+    profiler.start()
+    with pytest.raises(RuntimeError):
+        profiler.start()
+    profiler.stop()
+
+    # Stopping again is a no-op
+    profiler.stop()
+    assert not profiler.is_running
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        ("\n  x = 1\ny = 2", "x = 1"),
+        ("x" * 100, "x" * 77 + "..."),
+        ("", ""),
+    ],
+)
+def test_get_title(code: str, expected: str) -> None:
+    assert get_title(code) == expected
+
+
+def test_profile_magic(
+    shell: PositronShell,
+    profiler_service: ProfilerService,
+    mock_dataexplorer_service: Mock,
+    displayed: List[str],
+) -> None:
+    shell.run_cell(CODE).raise_error()
+    shell.run_cell("%profile -i 0.001 g()").raise_error()
+    assert displayed == []
+
+    # The flat profile is opened in the data explorer
+    [call] = mock_dataexplorer_service.register_table.call_args_list
+    table, title = call.args
+    assert isinstance(table, pd.DataFrame)
+    assert title == "Profile: g()"
+    assert table["function"].iloc[0] == "busy"
+
+
+def test_profile_cell_magic(
+    shell: PositronShell,
+    profiler_service: ProfilerService,
+    mock_dataexplorer_service: Mock,
+    displayed: List[str],
+) -> None:
+    shell.run_cell(CODE).raise_error()
+    shell.run_cell("%%profile -i 0.001\n# Profile f\nf()\nx = 1").raise_error()
+
+    [call] = mock_dataexplorer_service.register_table.call_args_list
+    table, title = call.args
+    assert title == "Profile: # Profile f"
+    assert set(table["function"]) == {"<module>", "f", "busy"}
+
+    # Quietly
+    shell.run_cell("%%profile -q -i 0.001\nf()").raise_error()
+    assert mock_dataexplorer_service.register_table.call_count == 1
+    assert displayed == []
+
+    # The cell runs in the user's namespace
+    assert shell.user_ns["x"] == 1
+
+
+def test_profile_magic_print(
+    shell: PositronShell,
+    profiler_service: ProfilerService,
+    mock_dataexplorer_service: Mock,
+    displayed: List[str],
+    monkeypatch,
+) -> None:
+    # Without a dataframe library, the flat profile is shown as text instead
+    monkeypatch.setattr(profiler_module, "pd_", None)
+    monkeypatch.setattr(profiler_module, "pl_", None)
+    shell.run_cell(CODE).raise_error()
+    shell.run_cell("%profile -i 0.001 g()").raise_error()
+
+    mock_dataexplorer_service.register_table.assert_not_called()
+    [text] = displayed
+    lines = text.splitlines()
+    assert lines[1].split() == ["self", "%", "total", "%", "function"]
+    assert "  busy (" in lines[2]
+
+
+def test_profile_cells(
+    shell: PositronShell, profiler_service: ProfilerService, displayed: List[str]
+) -> None:
+    shell.run_cell(CODE).raise_error()
+    shell.run_cell("%profile -i 0.001 on").raise_error()
+    assert profiler_service.profile_cells
+    assert displayed == []
+
+    # A summary of each profile is displayed after the cell's output
+    shell.run_cell("g()").raise_error()
+    [text] = displayed
+    lines = text.splitlines()
+    assert re.fullmatch(r"\d+ samples in \d+\.\d{3}s", lines[0])
+    assert 2 < len(lines) <= 7
+    assert "  busy (" in lines[2]
+
+    # Cells that aren't sampled aren't shown
+    shell.run_cell("x = 1").raise_error()
+    shell.run_cell("%profile off").raise_error()
+    shell.run_cell("g()").raise_error()
+    assert len(displayed) == 1
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("%profile", "UsageError: nothing to profile\n"),
+        ("%profile -i 0 g()", "UsageError: invalid sampling interval: 0\n"),
+        ("%profile -i x g()", "UsageError: invalid sampling interval: x\n"),
+    ],
+)
+def test_profile_magic_error(
+    shell: PositronShell,
+    profiler_service: ProfilerService,
+    displayed: List[str],
+    line: str,
+    expected: str,
+    capsys,
+) -> None:
+    shell.run_cell(line)
+    assert capsys.readouterr().err == expected
+    assert displayed == []
+
+
+def test_allocation_tracker() -> None:
+    tracker = AllocationTracker(max_sites=1)
+    tracker.enable()
+    try:
+        namespace = {}
+        tracker.start()
+        exec(
+            compile("x = [bytearray(100_000) for _ in range(3)]\ny = 1", "<test>", "exec"),
+            namespace,
+        )
+        size_diff, [site] = tracker.stop({"x": namespace["x"], "y": namespace["y"]})
+    finally:
+        tracker.disable()
+
+    assert not tracemalloc.is_tracing()
+    assert size_diff >= 300_000
+    assert site.size_diff >= 300_000
+    assert site.count_diff >= 3
+    assert [(frame.filename, frame.line_number) for frame in site.frames] == [("<test>", 1)]
+    assert site.variables == ["x"]
+
+
+def test_allocation_tracker_frames() -> None:
+    # Tracing that was already started is left running, with its number of frames
+    tracemalloc.start(3)
+    try:
+        tracker = AllocationTracker(nframes=1)
+        tracker.enable()
+        namespace = {}
+        exec(CODE.replace("busy(0.1)", "return bytearray(100_000)"), namespace)
+        tracker.start()
+        namespace["x"] = namespace["f"]()
+        _, [site, *_] = tracker.stop({"x": namespace["x"]})
+        tracker.disable()
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    assert len(site.frames) == 3
+    assert (site.frames[0].filename, site.frames[0].line_number) == ("<string>", 9)
+    assert site.variables == ["x"]
+
+
+@pytest.mark.parametrize(("nframes", "max_sites"), [(0, 1), (1, 0)])
+def test_allocation_tracker_invalid(nframes: int, max_sites: int) -> None:
+    with pytest.raises(ValueError):
+        AllocationTracker(nframes, max_sites)
+
+
+def test_format_allocations() -> None:
+    site = AllocationSite(
+        frames=[AllocationFrame(filename="<test>", line_number=2)],
+        size_diff=3 * 1024 * 1024,
+        count_diff=3,
+        variables=["x", "y"],
+    )
+    assert format_allocations(-512, [site]).splitlines() == [
+        "Memory: -512 B net",
+        "    +3.0 MiB       +3 blocks  <test>:2  (x, y)",
+    ]
+
+
+def test_trace_allocations_magic(
+    shell: PositronShell, profiler_service: ProfilerService, displayed: List[str]
+) -> None:
+    shell.run_cell("%trace_allocations -n 3 on").raise_error()
+    assert tracemalloc.is_tracing()
+    assert displayed == []
+
+    shell.run_cell("cache = []").raise_error()
+    shell.run_cell("cache.append(bytearray(1_000_000))").raise_error()
+
+    # A summary of the allocations is displayed after each cell's output
+    assert len(displayed) == 2
+    lines = displayed[-1].splitlines()
+    # Other memory may have been freed during the execution
+    assert re.fullmatch(r"Memory: \+\d+\.\d [KM]iB net", lines[0])
+    assert 1 < len(lines) <= 4
+    # The variable holding the allocated memory is found via the list's items
+    assert re.fullmatch(r" *\+\d+\.\d [KM]iB +\+\d+ blocks  .*:1  \(cache\)", lines[1])
+
+    shell.run_cell("%trace_allocations off").raise_error()
+    assert not tracemalloc.is_tracing()
+    shell.run_cell("x = 1").raise_error()
+    assert len(displayed) == 2
+
+
+def test_trace_allocations_magic_error(
+    shell: PositronShell, profiler_service: ProfilerService, capsys
+) -> None:
+    shell.run_cell("%trace_allocations -f 0 on")
+    assert capsys.readouterr().err == "UsageError: Number of frames must be positive, got: 0\n"
+    assert profiler_service.allocation_tracker is None
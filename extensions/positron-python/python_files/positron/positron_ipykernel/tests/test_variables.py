@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, Iterable, List, cast
 from unittest.mock import ANY, Mock, patch
 
 import numpy as np
@@ -15,12 +15,16 @@ import polars as pl
 import pytest
 
 from positron_ipykernel import variables as variables_module
-from positron_ipykernel.access_keys import encode_access_key
-from positron_ipykernel.inspectors import get_inspector
+from positron_ipykernel.access_keys import decode_access_key, encode_access_key
+from positron_ipykernel.inspectors import get_inspector, get_memory_size
 from positron_ipykernel.positron_comm import JsonRpcErrorCode
 from positron_ipykernel.positron_ipkernel import PositronIPyKernel
 from positron_ipykernel.utils import JsonData, JsonRecord, not_none
-from positron_ipykernel.variables import VariablesService, _summarize_variable
+from positron_ipykernel.variables import (
+    TrackedNamespace,
+    VariablesService,
+    _summarize_variable,
+)
 from positron_ipykernel.variables_comm import Variable
 
 from .conftest import DummyComm, PositronShell
@@ -171,7 +175,9 @@ def _import_library(shell: PositronShell, import_code: str):
         shell.run_cell(import_code)
 
 
-def test_change_detection_over_limit(shell: PositronShell, variables_comm: DummyComm):
+def test_change_detection_over_limit(shell: PositronShell, variables_comm: DummyComm, monkeypatch):
+    monkeypatch.setattr(variables_module, "MAX_SNAPSHOT_FINGERPRINT_BUDGET", 0)
+
     _import_library(shell, "import numpy as np")
 
     big_array = f"x = np.arange({BIG_ARRAY_LENGTH})"
@@ -183,8 +189,393 @@ def test_change_detection_over_limit(shell: PositronShell, variables_comm: Dummy
     _assert_assigned(shell, big_array, variables_comm)
 
 
-def _do_list(variables_comm: DummyComm):
-    msg = json_rpc_request("list", comm_id="dummy_comm_id")
+def test_change_detection_fingerprint(
+    shell: PositronShell, variables_service: VariablesService, variables_comm: DummyComm
+):
+    # Too large to copy, but not to fingerprint
+    shell.run_cell(f"import numpy as np; x = np.arange({BIG_ARRAY_LENGTH})")
+    variables_comm.messages.clear()
+
+    # Only digests are kept in the snapshot
+    variables_service.snapshot_user_ns()
+    snapshot = not_none(variables_service._snapshot)
+    assert isinstance(snapshot["mutable_fingerprinted"]["x"], bytes)
+    assert "x" not in snapshot["mutable_copied"]
+    assert "x" not in snapshot["mutable_excluded"]
+
+    # Reassigning an equal value is not an update
+    with patch("positron_ipykernel.variables.timestamp", return_value=0):
+        shell.run_cell(f"x = np.arange({BIG_ARRAY_LENGTH})")
+    assert variables_comm.messages == []
+
+    # An in-place change is detected
+    with patch("positron_ipykernel.variables.timestamp", return_value=0):
+        shell.run_cell("x[-1] = 0")
+        summary = not_none(_summarize_variable("x", shell.user_ns["x"])).dict()
+    assert variables_comm.messages == [
+        json_rpc_notification(
+            "update",
+            {"assigned": [summary], "removed": [], "unevaluated": [], "version": 0},
+        )
+    ]
+
+
+def test_change_detection_copy_on_write(
+    shell: PositronShell, variables_service: VariablesService, variables_comm: DummyComm
+):
+    shell.run_cell(
+        f"""import numpy as np
+import pandas as pd
+pd.set_option("mode.copy_on_write", True)
+x = pd.DataFrame({{"a": np.arange({BIG_ARRAY_LENGTH})}})"""
+    )
+    variables_comm.messages.clear()
+
+    try:
+        # The snapshot is a shallow copy
+        variables_service.snapshot_user_ns()
+        snapshot = not_none(variables_service._snapshot)
+        assert np.shares_memory(snapshot["mutable_copied"]["x"]["a"], shell.user_ns["x"]["a"])
+
+        # Unchanged values are not updates
+        shell.run_cell("None")
+        assert variables_comm.messages == []
+
+        # An in-place change is detected
+        with patch("positron_ipykernel.variables.timestamp", return_value=0):
+            shell.run_cell("x.iloc[-1, 0] = 0")
+            summary = not_none(_summarize_variable("x", shell.user_ns["x"])).dict()
+        assert variables_comm.messages == [
+            json_rpc_notification(
+                "update",
+                {"assigned": [summary], "removed": [], "unevaluated": [], "version": 0},
+            )
+        ]
+    finally:
+        pd.set_option("mode.copy_on_write", False)
+
+
+def test_tracked_namespace() -> None:
+    ns = TrackedNamespace(a=1, b=2)
+    assert ns.pop_changes() == set()
+
+    ns["c"] = 3
+    del ns["a"]
+    ns.update({"d": 4}, e=5)
+    ns |= {"f": 6}
+    ns.setdefault("g", 7)
+    ns.pop("b")
+    assert ns.pop_changes() == {"a", "b", "c", "d", "e", "f", "g"}
+    assert ns.pop_changes() == set()
+
+    ns.clear()
+    assert ns.pop_changes() == {"c", "d", "e", "f", "g"}
+
+
+@pytest.fixture
+def tracked_shell(shell: PositronShell) -> Iterable[PositronShell]:
+    user_module, user_ns = shell.user_module, shell.user_ns
+    shell._init_tracked_user_ns()
+    assert isinstance(shell.user_ns, TrackedNamespace)
+
+    yield shell
+
+    shell.user_module, shell.user_ns = user_module, user_ns
+    shell.ns_table.update(user_global=shell.user_global_ns, user_local=shell.user_ns)
+    shell.init_sys_modules()
+
+
+def _run_cell_and_get_update(shell: PositronShell, variables_comm: DummyComm, code: str):
+    shell.run_cell(code).raise_error()
+    messages = variables_comm.messages[:]
+    variables_comm.messages.clear()
+    if not messages:
+        return None
+    [message] = messages
+    params = message["data"]["params"]
+    return (
+        sorted(v["display_name"] for v in params["assigned"]),
+        sorted(v["display_name"] for v in params["unevaluated"]),
+        sorted(decode_access_key(k) for k in params["removed"]),
+    )
+
+
+def test_change_detection_tracked(
+    tracked_shell: PositronShell, variables_comm: DummyComm, monkeypatch
+) -> None:
+    shell = tracked_shell
+    shell.user_ns.update({f"v{i}": i for i in range(100)})
+    shell.run_cell("import numpy as np; x = 1; y = np.zeros(3)")
+    variables_comm.messages.clear()
+
+    # Only changed names and mutable values are inspected
+    inspected = []
+
+    def _get_inspector(value):
+        inspected.append(value)
+        return get_inspector(value)
+
+    monkeypatch.setattr(variables_module, "get_inspector", _get_inspector)
+
+    assert _run_cell_and_get_update(shell, variables_comm, "x = 2") == (["x"], [], [])
+    assert len(inspected) < 10
+
+    assert _run_cell_and_get_update(shell, variables_comm, "y[0] = 1") == (["y"], [], [])
+    assert _run_cell_and_get_update(shell, variables_comm, "x = 2") is None
+    assert _run_cell_and_get_update(shell, variables_comm, "z = x") == (["z"], [], [])
+    assert _run_cell_and_get_update(shell, variables_comm, "del x, v0") == ([], [], ["v0", "x"])
+    assert _run_cell_and_get_update(shell, variables_comm, "x = np.zeros(1)") == (["x"], [], [])
+    assert _run_cell_and_get_update(shell, variables_comm, "globals()['w'] = 0") == (["w"], [], [])
+
+
+@pytest.fixture
+def no_watched_variables(kernel: PositronIPyKernel, monkeypatch) -> None:
+    # Ignore data explorers and connections opened by other tests
+    monkeypatch.setattr(kernel.data_explorer_service, "path_to_comm_ids", {})
+    monkeypatch.setattr(kernel.connections_service, "path_to_comm_ids", {})
+
+
+@pytest.mark.usefixtures("no_watched_variables")
+def test_change_detection_without_comm(
+    shell: PositronShell, variables_service: VariablesService, monkeypatch
+) -> None:
+    monkeypatch.setattr(variables_service, "_comm", None)
+
+    # Nothing is snapshotted when no client is observing variables
+    shell.run_cell("x = 1")
+    assert variables_service._snapshot is None
+
+
+@pytest.mark.usefixtures("no_watched_variables")
+def test_set_visibility(
+    shell: PositronShell, variables_service: VariablesService, variables_comm: DummyComm
+) -> None:
+    msg = json_rpc_request("set_visibility", {"visible": False}, comm_id="dummy_comm_id")
+    variables_comm.handle_msg(msg)
+    assert variables_comm.messages == [json_rpc_response(None)]
+    variables_comm.messages.clear()
+
+    # No updates are sent while the variables pane is hidden
+    shell.run_cell("x = 1")
+    assert variables_service._snapshot is None
+    assert variables_comm.messages == []
+
+    # A refresh is sent when it's visible again
+    msg = json_rpc_request("set_visibility", {"visible": True}, comm_id="dummy_comm_id")
+    with patch("positron_ipykernel.variables.timestamp", return_value=0):
+        variables_comm.handle_msg(msg)
+        summary = not_none(_summarize_variable("x", shell.user_ns["x"])).dict()
+    assert variables_comm.messages == [
+        json_rpc_response(None),
+        json_rpc_notification("refresh", {"length": 1, "variables": [summary], "version": 0}),
+    ]
+    variables_comm.messages.clear()
+
+    # Updates are sent again
+    shell.run_cell("y = 1")
+    assert len(variables_comm.messages) == 1
+
+
+@pytest.mark.usefixtures("no_watched_variables")
+def test_set_visibility_watched_variables(
+    shell: PositronShell,
+    variables_service: VariablesService,
+    variables_comm: DummyComm,
+    de_service,
+    monkeypatch,
+) -> None:
+    shell.run_cell("import numpy as np; x = np.zeros(3); y = np.zeros(3)")
+    de_service.register_table(shell.user_ns["x"], "x", variable_path=_encode_path(["x"]))
+
+    msg = json_rpc_request("set_visibility", {"visible": False}, comm_id="dummy_comm_id")
+    variables_comm.handle_msg(msg)
+    variables_comm.messages.clear()
+
+    handle_variable_updated = Mock()
+    monkeypatch.setattr(de_service, "handle_variable_updated", handle_variable_updated)
+
+    # Only variables open in the data explorer are snapshotted while
+    # the variables pane is hidden
+    shell.run_cell("x[0] = 1; y[0] = 1")
+    assert not_none(variables_service._snapshot)["names"] == {"x"}
+    handle_variable_updated.assert_called_once_with("x", shell.user_ns["x"])
+    assert variables_comm.messages == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_watched_variables")
+async def test_deferred_summaries(
+    shell: PositronShell,
+    variables_service: VariablesService,
+    variables_comm: DummyComm,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(variables_module, "MAX_SUMMARY_TIME", 0)
+    # Memory sizes are tested separately
+    monkeypatch.setattr(variables_service, "_schedule_memory_sizes", lambda: None)
+
+    with patch("positron_ipykernel.variables.timestamp", return_value=0):
+        shell.run_cell("x = 1; y = [1, 2]").raise_error()
+
+        # Placeholders are sent when the time budget is used up
+        [message] = variables_comm.messages
+        assigned = message["data"]["params"]["assigned"]
+        assert [(v["display_name"], v["display_value"]) for v in assigned] == [
+            ("x", variables_module.DEFERRED_DISPLAY_VALUE),
+            ("y", variables_module.DEFERRED_DISPLAY_VALUE),
+        ]
+        assert assigned[1]["kind"] == "collection"
+        variables_comm.messages.clear()
+
+        # Followed by the full summaries
+        await asyncio.gather(*variables_service._pending_tasks)
+        summaries = [
+            not_none(_summarize_variable(name, shell.user_ns[name])).dict() for name in ["x", "y"]
+        ]
+        assert variables_comm.messages == [
+            json_rpc_notification(
+                "update",
+                {"assigned": summaries[:1], "unevaluated": [], "removed": [], "version": 0},
+            ),
+            json_rpc_notification(
+                "update",
+                {"assigned": summaries[1:], "unevaluated": [], "removed": [], "version": 0},
+            ),
+        ]
+        variables_comm.messages.clear()
+
+        # Variables that are slow to summarize stay deferred
+        monkeypatch.setattr(variables_module, "MAX_SUMMARY_TIME", 1)
+        monkeypatch.setattr(variables_module, "MAX_VARIABLE_SUMMARY_TIME", -1)
+        shell.run_cell("x = 2; y.append(3)").raise_error()
+        shell.run_cell("x = 3; y.append(4)").raise_error()
+        values = [
+            v["display_value"]
+            for m in variables_comm.messages
+            for v in m["data"]["params"]["assigned"] + m["data"]["params"]["unevaluated"]
+        ]
+        assert values == ["2", "[1, 2, 3]", "...", "..."]
+
+        # Removed variables are not summarized
+        shell.run_cell("del x, y").raise_error()
+        await asyncio.gather(*variables_service._pending_tasks)
+        assert variables_comm.messages[-1] == json_rpc_notification(
+            "update",
+            {"assigned": [], "unevaluated": [], "removed": _encode_path(["x", "y"]), "version": 0},
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_watched_variables")
+async def test_deferred_slow_kinds(
+    shell: PositronShell,
+    variables_service: VariablesService,
+    variables_comm: DummyComm,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(variables_module, "MAX_EAGER_SUMMARY_LENGTH", 10)
+    monkeypatch.setattr(variables_service, "_schedule_memory_sizes", lambda: None)
+
+    def _display_values():
+        return [
+            (v["display_name"], v["display_value"])
+            for m in variables_comm.messages
+            for v in m["data"]["params"]["assigned"] + m["data"]["params"]["unevaluated"]
+            if v["display_name"] != "Slow"
+        ]
+
+    shell.run_cell(
+        """\
+class Slow:
+    def __repr__(self):
+        return "slow"
+
+x = Slow()
+y = list(range(11))
+z = list(range(10))
+"""
+    ).raise_error()
+
+    # Kinds that may be slow to summarize are deferred the first time they're seen
+    assert _display_values() == [
+        ("x", variables_module.DEFERRED_DISPLAY_VALUE),
+        ("y", variables_module.DEFERRED_DISPLAY_VALUE),
+        ("z", str(list(range(10)))),
+    ]
+    variables_comm.messages.clear()
+
+    await asyncio.gather(*variables_service._pending_tasks)
+    assert _display_values() == [("x", "slow"), ("y", str(list(range(11))))]
+    variables_comm.messages.clear()
+
+    # ...but not once they were fast to summarize
+    shell.run_cell("y.append(11)").raise_error()
+    assert dict(_display_values())["y"] == str(list(range(12)))
+    variables_comm.messages.clear()
+
+    # New values are deferred again
+    shell.run_cell("x = Slow()").raise_error()
+    assert dict(_display_values())["x"] == variables_module.DEFERRED_DISPLAY_VALUE
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_watched_variables")
+async def test_memory_sizes(
+    shell: PositronShell,
+    variables_service: VariablesService,
+    variables_comm: DummyComm,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(variables_module, "MAX_SUMMARY_TIME", 0)
+    monkeypatch.setattr(variables_module, "MEMORY_SIZE_STEP", 10)
+
+    def _sizes():
+        return {
+            v["display_name"]: v["size"]
+            for m in variables_comm.messages
+            for v in m["data"]["params"]["assigned"]
+        }
+
+    shell.run_cell(
+        "import numpy as np\nx = np.zeros(1000)\ny = [str(i) for i in range(100)]"
+    ).raise_error()
+    await asyncio.gather(*variables_service._pending_tasks)
+
+    # Sizes are sent again once the deep sizes are computed, e.g. including
+    # the items of a list
+    x, y = shell.user_ns["x"], shell.user_ns["y"]
+    assert _sizes() == {"x": get_memory_size(x), "y": get_memory_size(y)}
+    assert _sizes()["y"] > get_inspector(y).get_size()
+    variables_comm.messages.clear()
+
+    # Sizes are cached for unchanged variables
+    monkeypatch.setattr(variables_module, "MemorySizer", Mock(side_effect=AssertionError))
+    msg = json_rpc_request("list", _page_params(sort_order="size"), comm_id="dummy_comm_id")
+    variables_comm.handle_msg(msg)
+    [message] = variables_comm.messages
+    names = [v["display_name"] for v in message["data"]["result"]["variables"]]
+    assert names.index("x") < names.index("y")
+    assert {v["display_name"]: v["size"] for v in message["data"]["result"]["variables"]}["y"] == (
+        get_memory_size(y)
+    )
+
+
+def _page_params(
+    start_index: int = 0,
+    max_results: int = variables_module.MAX_ITEMS,
+    search_term: str = "",
+    sort_order: str = "default",
+) -> Dict[str, Any]:
+    return {
+        "start_index": start_index,
+        "max_results": max_results,
+        "search_term": search_term,
+        "sort_order": sort_order,
+    }
+
+
+def _do_list(variables_comm: DummyComm, **kwargs):
+    msg = json_rpc_request("list", _page_params(**kwargs), comm_id="dummy_comm_id")
     with patch("positron_ipykernel.variables.timestamp", return_value=0):
         variables_comm.handle_msg(msg)
 
@@ -213,7 +604,7 @@ def test_list_1000(shell: PositronShell, variables_comm: DummyComm) -> None:
         shell.user_ns["var{}".format(j)] = j
 
     # Request the list of variables
-    msg = json_rpc_request("list", comm_id="dummy_comm_id")
+    msg = json_rpc_request("list", _page_params(), comm_id="dummy_comm_id")
     variables_comm.handle_msg(msg)
 
     # Assert that a message with 1000 variables is sent
@@ -358,10 +749,13 @@ def test_delete_error(variables_comm: DummyComm) -> None:
 
 
 # TODO(seem): encoded_path should be typed as List[str] but that makes pyright unhappy; might be a pyright bug
-def _do_inspect(encoded_path: List[JsonData], variables_comm: DummyComm) -> List[Variable]:
+def _do_inspect(
+    encoded_path: List[JsonData], variables_comm: DummyComm, **kwargs
+) -> List[Variable]:
+    params = {"max_results": variables_module.MAX_CHILDREN, **kwargs}
     msg = json_rpc_request(
         "inspect",
-        {"path": encoded_path},
+        {"path": encoded_path, **_page_params(**params)},
         comm_id="dummy_comm_id",
     )
 
@@ -616,9 +1010,83 @@ def test_inspect_large_object(shell: PositronShell, variables_comm: DummyComm) -
     _do_inspect(_encode_path(["x"]), variables_comm)
 
 
+def test_list_page(shell: PositronShell, variables_comm: DummyComm) -> None:
+    shell.user_ns.update({f"v{i}": i for i in range(25)})
+
+    result = _do_list(variables_comm, start_index=5, max_results=3)
+    assert result["length"] == 25
+    assert [v.display_name for v in result["variables"]] == ["v5", "v6", "v7"]
+
+    # Filtering and sorting apply before paging, and names sort numerically
+    result = _do_list(variables_comm, max_results=3, search_term="V1", sort_order="name")
+    assert result["length"] == 11
+    assert [v.display_name for v in result["variables"]] == ["v1", "v10", "v11"]
+
+    result = _do_list(variables_comm, start_index=10, search_term="1", sort_order="name")
+    assert result["length"] == 12
+    assert [v.display_name for v in result["variables"]] == ["v19", "v21"]
+
+
+@pytest.mark.parametrize(
+    ("value", "params", "expected_names", "expected_length"),
+    [
+        (
+            {f"key{i}": i for i in range(1_000_000)},
+            {"start_index": 999_998},
+            ["key999998", "key999999"],
+            1_000_000,
+        ),
+        (list(range(1000)), {"start_index": 10, "max_results": 2}, ["10", "11"], 1000),
+        (
+            pd.DataFrame({f"col{i}": [i] for i in range(200)}),
+            {"search_term": "COL19", "sort_order": "name"},
+            ["col19"] + [f"col{i}" for i in range(190, 200)],
+            11,
+        ),
+    ],
+)
+def test_inspect_page(
+    value: Any,
+    params: Dict[str, Any],
+    expected_names: List[str],
+    expected_length: int,
+    shell: PositronShell,
+    variables_comm: DummyComm,
+) -> None:
+    shell.user_ns["x"] = value
+
+    msg = json_rpc_request(
+        "inspect", {"path": _encode_path(["x"]), **_page_params(**params)}, comm_id="dummy_comm_id"
+    )
+    variables_comm.handle_msg(msg)
+
+    [message] = variables_comm.messages
+    result = message["data"]["result"]
+    assert [child["display_name"] for child in result["children"]] == expected_names
+    assert result["length"] == expected_length
+
+
+@pytest.mark.parametrize("method", ["list", "inspect"])
+def test_page_error(method: str, shell: PositronShell, variables_comm: DummyComm) -> None:
+    shell.user_ns["x"] = [1, 2]
+
+    params = {"path": _encode_path(["x"])} if method == "inspect" else {}
+    msg = json_rpc_request(
+        method, {**params, **_page_params(start_index=-1)}, comm_id="dummy_comm_id"
+    )
+    variables_comm.handle_msg(msg, raise_errors=False)
+
+    assert variables_comm.messages == [
+        json_rpc_error(
+            JsonRpcErrorCode.INVALID_PARAMS,
+            "start_index and max_results must be non-negative",
+        )
+    ]
+
+
 def test_inspect_error(variables_comm: DummyComm) -> None:
     path = _encode_path(["x"])
-    msg = json_rpc_request("inspect", {"path": path}, comm_id="dummy_comm_id")
+    msg = json_rpc_request("inspect", {"path": path, **_page_params()}, comm_id="dummy_comm_id")
 
     variables_comm.handle_msg(msg, raise_errors=False)
 
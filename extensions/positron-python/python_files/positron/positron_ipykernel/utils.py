@@ -122,6 +122,9 @@ def pretty_format(
     print_width: Optional[int] = None,
     truncate_at: Optional[int] = None,
 ) -> Tuple[str, bool]:
+    if truncate_at is not None:
+        value = _take_items(value, truncate_at)
+
     if print_width is not None:
         s = pprint.pformat(value, width=print_width, compact=True)
     else:
@@ -134,6 +137,19 @@ def pretty_format(
     return s, False
 
 
+def _take_items(value: Any, max_items: int) -> Any:
+    """
+    Returns (at most) the first `max_items` items of a large list or tuple, which are all that fit
+    in a string truncated at `max_items` characters, so that formatting it takes bounded time.
+
+    Dicts and sets are left as is, since `pprint.pformat` sorts them, so their first items are not
+    necessarily the ones shown.
+    """
+    if type(value) in (list, tuple) and len(value) > max_items:
+        return value[:max_items]
+    return value
+
+
 def truncate_string(value: str, max: int) -> Tuple[str, bool]:
     if len(value) > max:
         return (value[:max], True)
@@ -310,6 +326,10 @@ def positron_ipykernel_usage():
 
     * View tabular data in the data explorer via the %view command.
 
+    * Profile a statement or cell via the %profile command, or every cell via %profile on.
+
+    * Track the memory allocated by each cell via the %trace_allocations command.
+
     * Magic commands: type %magic for information on the magic subsystem.
 
     * System command aliases, via the %alias command or the configuration file(s).
@@ -13,16 +13,26 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import itertools
 import logging
+import re
 import time
 import types
 from collections.abc import Iterable, Mapping
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
 from comm.base_comm import BaseComm
 
 from .access_keys import decode_access_key, encode_access_key
-from .inspectors import get_inspector
+from .inspectors import (
+    MAX_SNAPSHOT_COMPARISON_BUDGET,
+    CollectionInspector,
+    MapInspector,
+    MemorySizer,
+    ObjectInspector,
+    PositronInspector,
+    get_inspector,
+)
 from .positron_comm import CommMessage, JsonRpcErrorCode, PositronComm
 from .utils import (
     JsonData,
@@ -38,15 +48,19 @@ from .variables_comm import (
     DeleteRequest,
     FormattedVariable,
     InspectedVariable,
+    InspectParams,
     InspectRequest,
+    ListParams,
     ListRequest,
     RefreshParams,
+    SetVisibilityRequest,
     UpdateParams,
     Variable,
     VariableKind,
     VariableList,
     VariablesBackendMessageContent,
     VariablesFrontendEvent,
+    VariableSortOrder,
     ViewRequest,
 )
 
@@ -62,10 +76,33 @@ MAX_CHILDREN: int = 100
 # full refresh is sent instead.
 MAX_ITEMS: int = 10000
 
-# Budget for number of "units" of work to allow for namespace change
-# detection. The costs are defined in inspectors.py
-# Units are rough estimates of the number of bytes copied.
-MAX_SNAPSHOT_COMPARISON_BUDGET: int = 10_000_000
+# Budget for namespace change detection via fingerprints (see
+# `PositronInspector.fingerprint`), in the same units as
+# `MAX_SNAPSHOT_COMPARISON_BUDGET`. Fingerprinting only hashes data
+# and keeps a digest, so it can afford to cover much larger objects
+# than copying.
+MAX_SNAPSHOT_FINGERPRINT_BUDGET: int = 200_000_000
+
+# Time budget in seconds for summarizing variables before a message is
+# sent to the client. Variables that don't fit in the budget are sent
+# with a placeholder display value, and summarized in a later update.
+MAX_SUMMARY_TIME: float = 0.05
+
+# Variables that take longer than this (in seconds) to summarize are
+# sent with a placeholder display value in later messages too.
+MAX_VARIABLE_SUMMARY_TIME: float = 0.01
+
+# Collections with more items than this are sent with a placeholder
+# display value the first time they're seen, since they may be slow to
+# summarize.
+MAX_EAGER_SUMMARY_LENGTH: int = 10_000
+
+# Placeholder display value for variables whose summary is deferred.
+DEFERRED_DISPLAY_VALUE = "..."
+
+# Number of objects to visit between checks of the time budget when
+# computing the memory sizes of variables in the background.
+MEMORY_SIZE_STEP: int = 1000
 
 
 def timestamp() -> int:
@@ -75,6 +112,63 @@ def timestamp() -> int:
     return int(time.time() * 1000)
 
 
+class TrackedNamespace(dict):
+    """
+    A user namespace that records the names assigned or deleted through it, so that change
+    detection only needs to look at those names (and at mutable values).
+
+    Names bound by functions via a `global` statement bypass `__setitem__` and are not recorded.
+    """
+
+    __slots__ = ("changed",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.changed: Set[Any] = set()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.changed.add(key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.changed.add(key)
+
+    def __ior__(self, other: Any) -> TrackedNamespace:
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        other = dict(*args, **kwargs)
+        super().update(other)
+        self.changed.update(other)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self.changed.add(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        self.changed.add(key)
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key, value = super().popitem()
+        self.changed.add(key)
+        return key, value
+
+    def clear(self) -> None:
+        self.changed.update(self)
+        super().clear()
+
+    def pop_changes(self) -> Set[Any]:
+        """
+        Returns the names changed since the last call.
+        """
+        changed = self.changed
+        self.changed = set()
+        return changed
+
+
 def _resolve_value_from_path(context: Any, path: Iterable[str]) -> Any:
     """
     Use inspectors to possibly resolve nested value from context
@@ -109,12 +203,40 @@ class VariablesService:
 
         self._snapshot: Optional[Dict[str, Any]] = None
 
+        # Names of variables whose summaries were deferred, in the order
+        # they should be summarized, of variables that were slow to
+        # summarize, and ids of values that were fast to summarize by name
+        self._deferred_names: Dict[str, None] = {}
+        self._slow_names: Set[str] = set()
+        self._fast_values: Dict[str, int] = {}
+        self._deferred_task: Optional[asyncio.Task] = None
+
+        # Deep memory sizes of variables as (id of the value, size) by
+        # name, and names of variables whose sizes need to be computed
+        self._memory_sizes: Dict[str, Tuple[int, int]] = {}
+        self._sizing_names: Dict[str, None] = {}
+        self._sizing_task: Optional[asyncio.Task] = None
+
+        # Whether the client's variables pane is visible, and whether
+        # the client missed updates while it was hidden
+        self._visible = True
+        self._stale = False
+
     def on_comm_open(self, comm: BaseComm, msg: JsonRecord) -> None:
         """
         Setup positron.variables comm to receive messages.
         """
         self._comm = PositronComm(comm)
         self._comm.on_msg(self.handle_msg, VariablesBackendMessageContent)
+        self._comm.on_close(self._handle_close)
+
+        self._visible = True
+        self._stale = False
+        self._deferred_names.clear()
+        self._slow_names.clear()
+        self._fast_values.clear()
+        self._memory_sizes.clear()
+        self._sizing_names.clear()
 
         # Send list on comm initialization
         self.send_refresh_event()
@@ -130,7 +252,7 @@ class VariablesService:
         request = msg.content.data
 
         if isinstance(request, ListRequest):
-            self._send_list()
+            self._send_list(request.params)
 
         elif isinstance(request, ClearRequest):
             self._delete_all_vars(raw_msg)
@@ -139,7 +261,7 @@ class VariablesService:
             self._delete_vars(request.params.names, raw_msg)
 
         elif isinstance(request, InspectRequest):
-            self._inspect_var(request.params.path)
+            self._inspect_var(request.params)
 
         elif isinstance(request, ClipboardFormatRequest):
             self._send_formatted_var(request.params.path, request.params.format)
@@ -147,6 +269,9 @@ class VariablesService:
         elif isinstance(request, ViewRequest):
             self._perform_view_action(request.params.path)
 
+        elif isinstance(request, SetVisibilityRequest):
+            self._set_visibility(request.params.visible)
+
         else:
             logger.warning(f"Unhandled request: {request}")
 
@@ -179,6 +304,10 @@ class VariablesService:
             ...
         }
         """
+        # Memory sizes of changed variables are out of date
+        for name in itertools.chain(assigned, unevaluated, removed):
+            self._memory_sizes.pop(name, None)
+
         # Look for any assigned or removed variables that are active
         # in the data explorer service
         exp_service = self.kernel.data_explorer_service
@@ -190,6 +319,10 @@ class VariablesService:
             if con_service.variable_has_active_connection(name):
                 con_service.handle_variable_deleted(name)
 
+            self._deferred_names.pop(name, None)
+            self._slow_names.discard(name)
+            self._fast_values.pop(name, None)
+
         updated = {**assigned, **unevaluated}
         for name, value in updated.items():
             if exp_service.variable_has_active_explorers(name):
@@ -198,17 +331,20 @@ class VariablesService:
             if con_service.variable_has_active_connection(name):
                 con_service.handle_variable_updated(name, value)
 
+        if self._comm is None or not self._visible:
+            return
+
         # Ensure the number of changes does not exceed our maximum items
         if len(assigned) > MAX_ITEMS or len(removed) > MAX_ITEMS:
             return self.send_refresh_event()
 
         # Filter out hidden assigned variables
         variables = self._get_filtered_vars(assigned)
-        filtered_assigned = _summarize_children(variables, MAX_ITEMS)
+        filtered_assigned = self._summarize_variables(variables)
 
         # Filter out hidden unevaluated variables
         variables = self._get_filtered_vars(unevaluated)
-        filtered_unevaluated = _summarize_children(variables, MAX_ITEMS)
+        filtered_unevaluated = self._summarize_variables(variables)
 
         # Filter out hidden removed variables and encode access keys
         hidden = self._get_user_ns_hidden()
@@ -244,7 +380,7 @@ class VariablesService:
         }
         """
         variables = self._get_filtered_vars()
-        filtered_variables = _summarize_children(variables, MAX_ITEMS)
+        filtered_variables = self._summarize_variables(variables)
 
         msg = RefreshParams(
             variables=filtered_variables,
@@ -275,18 +411,62 @@ class VariablesService:
         except Exception as err:
             logger.warning(err, exc_info=True)
 
-    def snapshot_user_ns(self) -> None:
+    def _handle_close(self, msg: JsonRecord) -> None:
+        self._comm = None
+
+    def _set_visibility(self, visible: bool) -> None:
+        self._visible = visible
+        self._send_result()
+
+        # Catch up on the updates missed while hidden
+        if visible and self._stale:
+            self._stale = False
+            self._memory_sizes.clear()
+            self.send_refresh_event()
+
+    def _get_watched_names(self) -> Optional[Set[str]]:
+        """
+        Returns the names of the variables whose changes a client is
+        observing: None for all of them if the variables pane is open
+        and visible, otherwise those open in the data explorer or
+        connections pane.
+        """
+        if self._comm is not None and self._visible:
+            return None
+
+        paths = itertools.chain(
+            self.kernel.data_explorer_service.path_to_comm_ids,
+            self.kernel.connections_service.path_to_comm_ids,
+        )
+        return {decode_access_key(path[0]) for path in paths}
+
+    def snapshot_user_ns(self, watched_only: bool = True) -> None:
         """
         Creates a conservative "snapshot" of the user namespace to
         enable variable change detection without having to do a full
         refresh of the variables view any time the user executes
-        code. Because many objects (any mutable Python collection, or
-        some data structures like pandas, NumPy, or PyTorch objects)
-        require a deep copy to support change detection, we only
-        copy-and-compare such objects up to a certain limit to keep
-        the execution overhead to a minimum when namespaces get large
-        or contain many large mutable objects.
+        code. Mutable data structures like NumPy, pandas, or polars
+        objects are fingerprinted by hashing their data, keeping only
+        the digests, unless a shallow copy suffices (polars, or pandas
+        with copy-on-write). Other mutable objects (any mutable Python
+        collection, or PyTorch objects) require a deep copy to support
+        change detection. In both cases, we only snapshot objects up
+        to a certain limit to keep the execution overhead to a minimum
+        when namespaces get large or contain many large mutable
+        objects.
+
+        If `watched_only` is true, only variables that a client is
+        observing are included, or no snapshot is taken at all if
+        there are none.
         """
+        names = self._get_watched_names() if watched_only else None
+        if names is not None and self._comm is not None:
+            # The hidden variables pane will need a refresh
+            self._stale = True
+        if names is not None and not names:
+            self._snapshot = None
+            return
+
         ns = self._get_user_ns()
         hidden = self._get_user_ns_hidden()
 
@@ -294,11 +474,33 @@ class VariablesService:
         # reference
         immutable_vars = {}
 
+        # Names to inspect
+        keys: Iterable[Any] = ns.keys() if names is None else names
+
+        if isinstance(ns, TrackedNamespace):
+            changed = ns.pop_changes()
+            if self._snapshot is not None and self._snapshot["names"] is None and names is None:
+                # Immutable variables are carried over from the last
+                # snapshot unless their names were changed since
+                immutable_vars = self._snapshot["immutable"]
+                for key in changed:
+                    immutable_vars.pop(key, None)
+
+                keys = changed.union(
+                    self._snapshot["mutable_copied"],
+                    self._snapshot["mutable_fingerprinted"],
+                    self._snapshot["mutable_excluded"],
+                )
+
         # Mutable variables which fall within the limit of
         # "reasonable" expense for a copy and deep comparison after
         # code execution.
         mutable_vars_copied = {}
 
+        # Fingerprints of mutable variables that can be compared by
+        # hashing their data after code execution.
+        mutable_vars_fingerprinted = {}
+
         # Names of mutable variables that are excluded from the change
         # detection logic either because the cost is too large or
         # cannot be estimated easily (for example, any collection
@@ -307,18 +509,32 @@ class VariablesService:
         mutable_vars_excluded = {}
 
         comparison_cost = 0
+        fingerprint_cost = 0
 
         start = time.time()
 
-        for key, value in ns.items():
-            if key in hidden:
+        for key in keys:
+            if key in hidden or key not in ns:
                 continue
 
+            value = ns[key]
             inspector = get_inspector(value)
 
             if inspector.is_mutable():
                 cost = inspector.get_comparison_cost()
-                if comparison_cost + cost > MAX_SNAPSHOT_COMPARISON_BUDGET:
+
+                # Shallow copies are cheaper than fingerprints
+                fingerprint = None
+                if (
+                    not inspector.has_shallow_copy()
+                    and fingerprint_cost + cost <= MAX_SNAPSHOT_FINGERPRINT_BUDGET
+                ):
+                    fingerprint = inspector.fingerprint()
+
+                if fingerprint is not None:
+                    fingerprint_cost += cost
+                    mutable_vars_fingerprinted[key] = fingerprint
+                elif comparison_cost + cost > MAX_SNAPSHOT_COMPARISON_BUDGET:
                     mutable_vars_excluded[key] = value
                 else:
                     comparison_cost += cost
@@ -332,8 +548,10 @@ class VariablesService:
                 immutable_vars[key] = value
 
         self._snapshot = {
+            "names": names,
             "immutable": immutable_vars,
             "mutable_copied": mutable_vars_copied,
+            "mutable_fingerprinted": mutable_vars_fingerprinted,
             "mutable_excluded": mutable_vars_excluded,
         }
         elapsed = time.time() - start
@@ -342,6 +560,9 @@ class VariablesService:
         copied = repr(list(self._snapshot["mutable_copied"].keys()))
         logger.debug(f"Variables copied: {copied}")
 
+        fingerprinted = repr(list(self._snapshot["mutable_fingerprinted"].keys()))
+        logger.debug(f"Variables fingerprinted: {fingerprinted}")
+
     def _compare_user_ns(
         self,
     ) -> Tuple[Dict[str, Any], Dict[str, Any], Set[str]]:
@@ -366,6 +587,20 @@ class VariablesService:
 
         snapshot = self._snapshot
 
+        # Immutable variables to compare, and names to check for
+        # additions
+        immutable_vars = snapshot["immutable"]
+
+        # If only watched names were snapshotted, only those are
+        # checked
+        names = snapshot["names"]
+        keys: Iterable[Any] = after.keys() if names is None else names
+
+        if isinstance(after, TrackedNamespace):
+            # Only names changed since the snapshot can differ
+            keys = after.changed if names is None else after.changed & names
+            immutable_vars = {key: immutable_vars[key] for key in keys if key in immutable_vars}
+
         def _compare_immutable(v1, v2):
             # For immutable objects we can compare object references
             return v1 is not v2
@@ -376,6 +611,9 @@ class VariablesService:
 
             return type(inspector1) is not type(inspector2) or not inspector1.equals(v2)
 
+        def _compare_fingerprint(fingerprint, v2):
+            return get_inspector(v2).fingerprint() != fingerprint
+
         def _compare_always_different(v1, v2):
             return True
 
@@ -403,16 +641,17 @@ class VariablesService:
 
         start = time.time()
 
-        _check_ns_subset(snapshot["immutable"], True, _compare_immutable)
+        _check_ns_subset(immutable_vars, True, _compare_immutable)
         _check_ns_subset(snapshot["mutable_copied"], True, _compare_mutable)
+        _check_ns_subset(snapshot["mutable_fingerprinted"], True, _compare_fingerprint)
         _check_ns_subset(snapshot["mutable_excluded"], False, _compare_always_different)
 
-        for key, value in after.items():
-            if key in hidden:
+        for key in keys:
+            if key in hidden or key not in after:
                 continue
 
             if key not in all_snapshot_keys:
-                assigned[key] = value
+                assigned[key] = after[key]
 
         elapsed = time.time() - start
         logger.debug(f"Detecting namespace changes took {elapsed:.4f} seconds")
@@ -465,15 +704,206 @@ class VariablesService:
 
         return _resolve_value_from_path(self._get_user_ns(), path)
 
-    def _list_all_vars(self) -> List[Variable]:
-        variables = self._get_filtered_vars()
-        return _summarize_children(variables, MAX_ITEMS)
+    def _summarize_variables(self, variables: Mapping[str, Any]) -> List[Variable]:
+        """
+        Summarizes top-level variables within the time budget.
+
+        Variables that don't fit in `MAX_SUMMARY_TIME`, that were
+        previously slow to summarize, or that are likely to be slow to
+        summarize and weren't summarized before, get a placeholder
+        summary, and are summarized in the background and sent in later
+        update events.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop (e.g. outside of the kernel) there is
+            # no way to send deferred summaries, so summarize everything
+            return _summarize_children(variables, MAX_ITEMS)
+
+        summaries = []
+        start = time.perf_counter()
+        for name, value in variables.items():
+            if len(summaries) >= MAX_ITEMS:
+                break
+
+            if (
+                name in self._slow_names
+                or (self._fast_values.get(name) != id(value) and _is_slow_to_summarize(value))
+                or time.perf_counter() - start >= MAX_SUMMARY_TIME
+            ):
+                size = self._get_memory_size(name, value)
+                summary = _summarize_variable(name, value, deferred=True, size=size)
+                if summary is not None:
+                    self._deferred_names[name] = None
+            else:
+                summary = self._summarize_timed(name, value)
+
+            if summary is not None:
+                summaries.append(summary)
+
+                if self._get_memory_size(name, value) is None:
+                    self._sizing_names[name] = None
+
+        if self._deferred_names:
+            self._schedule_deferred_summaries()
+
+        if self._sizing_names:
+            self._schedule_memory_sizes()
+
+        return summaries
+
+    def _summarize_timed(self, name: str, value: Any) -> Optional[Variable]:
+        start = time.perf_counter()
+        summary = _summarize_variable(name, value, size=self._get_memory_size(name, value))
+        if time.perf_counter() - start > MAX_VARIABLE_SUMMARY_TIME:
+            self._slow_names.add(name)
+            self._fast_values.pop(name, None)
+        else:
+            self._slow_names.discard(name)
+            self._fast_values[name] = id(value)
+        self._deferred_names.pop(name, None)
+        return summary
+
+    def _schedule_deferred_summaries(self) -> None:
+        if self._deferred_task is None or self._deferred_task.done():
+            self._deferred_task = create_task(self._send_deferred_summaries(), self._pending_tasks)
+
+    async def _send_deferred_summaries(self) -> None:
+        """
+        Summarizes variables that were sent with a placeholder summary,
+        sending an update event each time the time budget is used up, and
+        yielding to the event loop in between so that the kernel stays
+        responsive.
+        """
+        while self._deferred_names:
+            if self._comm is None or not self._visible:
+                # The client is sent a full refresh when it's visible again
+                self._deferred_names.clear()
+                return
+
+            user_ns = self._get_user_ns()
+            summaries = []
+            start = time.perf_counter()
+            while self._deferred_names:
+                name = next(iter(self._deferred_names))
+                self._deferred_names.pop(name)
+
+                # The variable may have been removed since it was deferred
+                if name not in user_ns:
+                    self._slow_names.discard(name)
+                    self._fast_values.pop(name, None)
+                    continue
+
+                summary = self._summarize_timed(name, user_ns[name])
+                if summary is not None:
+                    summaries.append(summary)
+
+                if time.perf_counter() - start >= MAX_SUMMARY_TIME:
+                    break
+
+            if summaries:
+                msg = UpdateParams(assigned=summaries, unevaluated=[], removed=[], version=0)
+                self._send_event(VariablesFrontendEvent.Update.value, msg.dict())
+
+            await asyncio.sleep(0)
+
+    def _get_memory_size(self, name: str, value: Any) -> Optional[int]:
+        """
+        Returns the deep memory size of a variable, if it was computed for its current value.
+        """
+        cached = self._memory_sizes.get(name)
+        if cached is not None and cached[0] == id(value):
+            return cached[1]
+        return None
+
+    def _get_variable_size(self, name: str, value: Any) -> int:
+        size = self._get_memory_size(name, value)
+        return _get_size(value) if size is None else size
+
+    def _schedule_memory_sizes(self) -> None:
+        if self._sizing_task is None or self._sizing_task.done():
+            self._sizing_task = create_task(self._compute_memory_sizes(), self._pending_tasks)
+
+    async def _compute_memory_sizes(self) -> None:
+        """
+        Computes the deep memory sizes of variables (see `MemorySizer`) in
+        steps, yielding to the event loop each time the time budget is
+        used up. Variables whose size differs from the estimate that they
+        were summarized with are summarized again.
+        """
+        start = time.perf_counter()
+        while self._sizing_names:
+            if self._comm is None or not self._visible:
+                # Sizes are computed again with the refresh when it's visible
+                self._sizing_names.clear()
+                return
+
+            name = next(iter(self._sizing_names))
+            self._sizing_names.pop(name)
+
+            user_ns = self._get_user_ns()
+            if name not in user_ns:
+                continue
+            value = user_ns[name]
+
+            sizer = MemorySizer(value)
+            while not sizer.step(MEMORY_SIZE_STEP):
+                if time.perf_counter() - start >= MAX_SUMMARY_TIME:
+                    await asyncio.sleep(0)
+                    start = time.perf_counter()
+
+                    # Give up if the variable changed in the meantime, in
+                    # which case it's queued again by the update
+                    if name in self._sizing_names or self._get_user_ns().get(name) is not value:
+                        break
+            else:
+                self._memory_sizes[name] = (id(value), sizer.size)
+                if sizer.size != _get_size(value):
+                    self._deferred_names[name] = None
+                    self._schedule_deferred_summaries()
+
+            if time.perf_counter() - start >= MAX_SUMMARY_TIME:
+                await asyncio.sleep(0)
+                start = time.perf_counter()
+
+    def _send_list(self, params: ListParams) -> None:
+        """
+        Sends a page of the variables in the current user session, optionally
+        filtered and sorted by name, as a message through the variables comm
+        to the client.
+
+        Parameters
+        ----------
+        params : ListParams
+            The page of variables to list.
+        """
+        if params.start_index < 0 or params.max_results < 0:
+            return self._send_error(
+                JsonRpcErrorCode.INVALID_PARAMS,
+                "start_index and max_results must be non-negative",
+            )
+
+        # Modules are never summarized (see `_summarize_variable`), so
+        # exclude them up front to get an accurate count
+        variables = {
+            name: value
+            for name, value in self._get_filtered_vars().items()
+            if not isinstance(value, types.ModuleType)
+        }
+        page, length = _get_children_page(
+            variables,
+            params.start_index,
+            min(params.max_results, MAX_ITEMS),
+            params.search_term,
+            params.sort_order,
+            get_size=lambda name: self._get_variable_size(name, variables[name]),
+        )
+        filtered_variables = self._summarize_variables({key: variables[key] for key, _ in page})
 
-    def _send_list(self) -> None:
-        filtered_variables = self._list_all_vars()
         msg = VariableList(
             variables=filtered_variables,
-            length=len(filtered_variables),
+            length=length,
             version=0,
         )
         self._send_result(msg.dict())
@@ -524,7 +954,7 @@ class VariablesService:
         if names is None:
             return
 
-        self.snapshot_user_ns()
+        self.snapshot_user_ns(watched_only=False)
 
         for name in names:
             try:
@@ -549,19 +979,25 @@ class VariablesService:
 
         self._send_result([encode_access_key(name) for name in sorted(removed)])
 
-    def _inspect_var(self, path: List[str]) -> None:
+    def _inspect_var(self, params: InspectParams) -> None:
         """
         Describes the variable at the requested path in the current user session.
 
         Parameters
         ----------
-        path : List[str]
-            A list of names describing the path to the variable.
+        params : InspectParams
+            The path to the variable, and the page of its children to describe.
         """
+        if params.start_index < 0 or params.max_results < 0:
+            return self._send_error(
+                JsonRpcErrorCode.INVALID_PARAMS,
+                "start_index and max_results must be non-negative",
+            )
 
+        path = params.path
         is_known, value = self._find_var(path)
         if is_known:
-            self._send_details(path, value)
+            self._send_details(params, value)
         else:
             self._send_error(
                 JsonRpcErrorCode.INVALID_PARAMS,
@@ -665,9 +1101,9 @@ class VariablesService:
                 f"Cannot find variable at '{path}' to format",
             )
 
-    def _send_details(self, path: List[str], value: Any = None):
+    def _send_details(self, params: InspectParams, value: Any = None):
         """
-        Sends a detailed list of children of the value (or just the value
+        Sends a detailed page of children of the value (or just the value
         itself, if is a leaf node on the path) as a message through the
         variables comm to the client.
 
@@ -693,8 +1129,8 @@ class VariablesService:
 
         Parameters
         ----------
-        path : List[str]
-            A list of names describing the path to the variable.
+        params : InspectParams
+            The path to the variable, and the page of its children to describe.
         value : Any
             The variable's value to summarize.
         """
@@ -702,20 +1138,31 @@ class VariablesService:
         children = []
         inspector = get_inspector(value)
         if inspector.has_children():
-            children = _summarize_children(value)
+            children, length = _summarize_children_page(
+                value,
+                params.start_index,
+                min(params.max_results, MAX_ITEMS),
+                params.search_term,
+                params.sort_order,
+            )
         else:
             # Otherwise, treat as a simple value at given path
             summary = _summarize_variable("", value)
             if summary is not None:
                 children.append(summary)
+            length = len(children)
             # TODO: Handle scalar objects with a specific message type
 
-        msg = InspectedVariable(children=children, length=len(children))
+        msg = InspectedVariable(children=children, length=length)
         self._send_result(msg.dict())
 
 
 def _summarize_variable(
-    key: Any, value: Any, display_name: Optional[str] = None
+    key: Any,
+    value: Any,
+    display_name: Optional[str] = None,
+    deferred: bool = False,
+    size: Optional[int] = None,
 ) -> Optional[Variable]:
     """
     Summarizes the given variable into a Variable object.
@@ -730,6 +1177,12 @@ def _summarize_variable(
     display_name : str
         An optional string to use for the variable's display name. Is
         a stringified version of `key` if not passed.
+    deferred : bool
+        Whether to skip computing the potentially expensive display value,
+        length, and size, e.g. if they will be sent later.
+    size : int, optional
+        The variable's memory size, if known. Otherwise, it's estimated by
+        the inspector's `get_size`.
 
     Returns
     -------
@@ -748,12 +1201,19 @@ def _summarize_variable(
 
         kind_str = ins.get_kind()
         kind = VariableKind(kind_str)
-        display_value, is_truncated = ins.get_display_value()
+        if deferred:
+            display_value, is_truncated = DEFERRED_DISPLAY_VALUE, True
+            length = 0
+            if size is None:
+                size = 0
+        else:
+            display_value, is_truncated = ins.get_display_value()
+            length = ins.get_length()
+            if size is None:
+                size = ins.get_size()
         display_type = ins.get_display_type()
         type_info = ins.get_type_info()
         access_key = encode_access_key(key)
-        length = ins.get_length()
-        size = ins.get_size()
         has_children = ins.has_children()
         has_viewer = ins.has_viewer()
         updated_time = timestamp()
@@ -790,6 +1250,21 @@ def _summarize_variable(
         )
 
 
+def _is_slow_to_summarize(value: Any) -> bool:
+    """
+    Whether a value is likely to be slow to summarize: large builtin
+    collections, and objects without a dedicated inspector whose type
+    defines its own `__repr__`, which may do arbitrary work.
+    """
+    try:
+        inspector = get_inspector(value)
+        if type(inspector) in (CollectionInspector, MapInspector):
+            return inspector.get_length() > MAX_EAGER_SUMMARY_LENGTH
+        return type(inspector) is ObjectInspector and type(value).__repr__ is not object.__repr__
+    except Exception:
+        return True
+
+
 def _summarize_children(parent: Any, limit: int = MAX_CHILDREN) -> List[Variable]:
     inspector = get_inspector(parent)
     children = inspector.get_children()
@@ -809,6 +1284,106 @@ def _summarize_children(parent: Any, limit: int = MAX_CHILDREN) -> List[Variable
     return summaries
 
 
+def _summarize_children_page(
+    parent: Any,
+    start_index: int,
+    max_results: int,
+    search_term: str = "",
+    sort_order: VariableSortOrder = VariableSortOrder.Default,
+) -> Tuple[List[Variable], int]:
+    """
+    Summarizes a page of the children of a value, see `_get_children_page`.
+
+    Returns
+    -------
+    A tuple of the summaries of the children in the page, and the total
+    number of children matching the search term.
+    """
+    inspector = get_inspector(parent)
+    page, length = _get_children_page(parent, start_index, max_results, search_term, sort_order)
+    summaries = []
+    for child, display_name in page:
+        try:
+            value = inspector.get_child(child)
+        except Exception:
+            value = "Cannot get value."
+
+        summary = _summarize_variable(child, value, display_name=display_name)
+        if summary is not None:
+            summaries.append(summary)
+    return summaries, length
+
+
+def _get_children_page(
+    parent: Any,
+    start_index: int,
+    max_results: int,
+    search_term: str = "",
+    sort_order: VariableSortOrder = VariableSortOrder.Default,
+    get_size: Optional[Callable[[Any], int]] = None,
+) -> Tuple[List[Tuple[Any, str]], int]:
+    """
+    Selects a page of the children of a value, optionally filtered by
+    display name, and sorted by display name or by size (largest first,
+    using `get_size` with the child's key if given).
+
+    Only the children in the page are looked up, and without a search
+    term or sort order, only their display names are computed, so that
+    pages of very large values are cheap.
+
+    Returns
+    -------
+    A tuple of the (key, display name) pairs of the children in the page,
+    and the total number of children matching the search term.
+    """
+    inspector = get_inspector(parent)
+    children = inspector.get_children()
+    end_index = start_index + max_results
+
+    if not search_term and sort_order == VariableSortOrder.Default:
+        page = itertools.islice(children, start_index, end_index)
+        return [
+            (child, inspector.get_display_name(child)) for child in page
+        ], inspector.get_length()
+
+    named = [(child, inspector.get_display_name(child)) for child in children]
+
+    if search_term:
+        term = search_term.casefold()
+        named = [(child, name) for child, name in named if term in name.casefold()]
+
+    if sort_order == VariableSortOrder.Name:
+        named.sort(key=lambda item: _natural_sort_key(item[1]))
+    elif sort_order == VariableSortOrder.Size:
+        size_of = get_size or (lambda child: _get_child_size(inspector, child))
+        named.sort(key=lambda item: (-size_of(item[0]), _natural_sort_key(item[1])))
+
+    return named[start_index:end_index], len(named)
+
+
+def _get_size(value: Any) -> int:
+    try:
+        return get_inspector(value).get_size()
+    except Exception:
+        return 0
+
+
+def _get_child_size(inspector: PositronInspector, child: Any) -> int:
+    try:
+        return _get_size(inspector.get_child(child))
+    except Exception:
+        return 0
+
+
+def _natural_sort_key(name: str) -> List[Any]:
+    # Case insensitive, with runs of digits compared as numbers, like the
+    # client's sort by name. Splitting on a capturing group alternates
+    # text and digits, so keys are always comparable.
+    return [
+        int(part) if i % 2 else part.casefold() for i, part in enumerate(re.split(r"(\d+)", name))
+    ]
+
+
 def _format_value(value: Any, clipboard_format: ClipboardFormatFormat) -> str:
     """
     Formats the given value using the requested clipboard format.
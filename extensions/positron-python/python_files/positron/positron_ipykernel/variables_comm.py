@@ -62,6 +62,19 @@ class VariableKind(str, enum.Enum):
     Connection = "connection"
 
 
+@enum.unique
+class VariableSortOrder(str, enum.Enum):
+    """
+    Possible values for VariableSortOrder
+    """
+
+    Default = "default"
+
+    Name = "name"
+
+    Size = "size"
+
+
 class VariableList(BaseModel):
     """
     A view containing a list of variables in the session.
@@ -72,7 +85,7 @@ class VariableList(BaseModel):
     )
 
     length: StrictInt = Field(
-        description="The total number of variables in the session. This may be greater than the number of variables in the 'variables' array if the array is truncated.",
+        description="The total number of variables in the session matching the search term. This may be greater than the number of variables in the 'variables' array if the array is truncated.",
     )
 
     version: Optional[StrictInt] = Field(
@@ -91,7 +104,7 @@ class InspectedVariable(BaseModel):
     )
 
     length: StrictInt = Field(
-        description="The total number of children. This may be greater than the number of children in the 'children' array if the array is truncated.",
+        description="The total number of children matching the search term. This may be greater than the number of children in the 'children' array if the array is truncated.",
     )
 
 
@@ -165,7 +178,7 @@ class VariablesBackendRequest(str, enum.Enum):
     An enumeration of all the possible requests that can be sent to the backend variables comm.
     """
 
-    # List all variables
+    # List variables
     List = "list"
 
     # Clear all variables
@@ -183,12 +196,41 @@ class VariablesBackendRequest(str, enum.Enum):
     # Request a viewer for a variable
     View = "view"
 
+    # Set the visibility of the variables pane
+    SetVisibility = "set_visibility"
+
+
+class ListParams(BaseModel):
+    """
+    Returns a page of the variables in the current session.
+    """
+
+    start_index: StrictInt = Field(
+        description="Index (starting from zero) of the first variable to return",
+    )
+
+    max_results: StrictInt = Field(
+        description="Maximum number of variables to return from the start index",
+    )
+
+    search_term: StrictStr = Field(
+        description="Only return variables whose display names contain this substring (case insensitive). An empty string matches all variables.",
+    )
+
+    sort_order: VariableSortOrder = Field(
+        description="The order in which to return variables",
+    )
+
 
 class ListRequest(BaseModel):
     """
-    Returns a list of all the variables in the current session.
+    Returns a page of the variables in the current session.
     """
 
+    params: ListParams = Field(
+        description="Parameters to the List method",
+    )
+
     method: Literal[VariablesBackendRequest.List] = Field(
         description="The JSON-RPC method name (list)",
     )
@@ -259,17 +301,35 @@ class DeleteRequest(BaseModel):
 
 class InspectParams(BaseModel):
     """
-    Returns the children of a variable, as an array of variables.
+    Returns a page of the children of a variable, as an array of
+    variables.
     """
 
     path: List[StrictStr] = Field(
         description="The path to the variable to inspect, as an array of access keys.",
     )
 
+    start_index: StrictInt = Field(
+        description="Index (starting from zero) of the first child to return",
+    )
+
+    max_results: StrictInt = Field(
+        description="Maximum number of children to return from the start index",
+    )
+
+    search_term: StrictStr = Field(
+        description="Only return children whose display names contain this substring (case insensitive). An empty string matches all children.",
+    )
+
+    sort_order: VariableSortOrder = Field(
+        description="The order in which to return children",
+    )
+
 
 class InspectRequest(BaseModel):
     """
-    Returns the children of a variable, as an array of variables.
+    Returns a page of the children of a variable, as an array of
+    variables.
     """
 
     params: InspectParams = Field(
@@ -352,6 +412,39 @@ class ViewRequest(BaseModel):
     )
 
 
+class SetVisibilityParams(BaseModel):
+    """
+    Informs the runtime whether the variables pane is visible. While it is
+    hidden, the runtime may skip detecting changes to variables, and sends
+    a refresh event when the pane becomes visible again.
+    """
+
+    visible: StrictBool = Field(
+        description="Whether the variables pane is visible",
+    )
+
+
+class SetVisibilityRequest(BaseModel):
+    """
+    Informs the runtime whether the variables pane is visible. While it is
+    hidden, the runtime may skip detecting changes to variables, and sends
+    a refresh event when the pane becomes visible again.
+    """
+
+    params: SetVisibilityParams = Field(
+        description="Parameters to the SetVisibility method",
+    )
+
+    method: Literal[VariablesBackendRequest.SetVisibility] = Field(
+        description="The JSON-RPC method name (set_visibility)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class VariablesBackendMessageContent(BaseModel):
     comm_id: str
     data: Union[
@@ -361,6 +454,7 @@ class VariablesBackendMessageContent(BaseModel):
         InspectRequest,
         ClipboardFormatRequest,
         ViewRequest,
+        SetVisibilityRequest,
     ] = Field(..., discriminator="method")
 
 
@@ -425,6 +519,8 @@ FormattedVariable.update_forward_refs()
 
 Variable.update_forward_refs()
 
+ListParams.update_forward_refs()
+
 ListRequest.update_forward_refs()
 
 ClearParams.update_forward_refs()
@@ -447,6 +543,10 @@ ViewParams.update_forward_refs()
 
 ViewRequest.update_forward_refs()
 
+SetVisibilityParams.update_forward_refs()
+
+SetVisibilityRequest.update_forward_refs()
+
 UpdateParams.update_forward_refs()
 
 RefreshParams.update_forward_refs()
@@ -228,7 +228,17 @@ export class PositronVariablesViewPane extends PositronViewPane implements IReac
 				this._onRestoreScrollPositionEmitter.fire();
 			}
 			this._onVisibilityChangedEmitter.fire(visible);
+
+			// Let the runtimes skip detecting changes to variables while they are hidden.
+			this._positronVariablesService.positronVariablesInstances.forEach(
+				positronVariablesInstance => positronVariablesInstance.setVisible(visible)
+			);
 		}));
+
+		// Inform new variables instances whether they are visible.
+		this._register(this._positronVariablesService.onDidStartPositronVariablesInstance(
+			positronVariablesInstance => positronVariablesInstance.setVisible(this.isBodyVisible())
+		));
 	}
 
 	//#endregion Constructor & Dispose
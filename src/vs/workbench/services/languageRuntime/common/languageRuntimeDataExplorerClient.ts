@@ -6,7 +6,7 @@
 import { Emitter } from 'vs/base/common/event';
 import { Disposable } from 'vs/base/common/lifecycle';
 import { IRuntimeClientInstance } from 'vs/workbench/services/languageRuntime/common/languageRuntimeClientInstance';
-import { BackendState, ColumnProfileRequest, ColumnProfileResult, ColumnSchema, ColumnSortKey, DataSelection, ExportedData, ExportFormat, FilterResult, FormatOptions, PositronDataExplorerComm, RowFilter, SchemaUpdateEvent, SupportedFeatures, SupportStatus, TableData, TableSchema } from 'vs/workbench/services/languageRuntime/common/positronDataExplorerComm';
+import { BackendState, BatchItem, BatchItemResponse, ColumnAggregation, ColumnProfileRequest, ColumnProfileResult, ColumnSchema, ColumnSortKey, DataSelection, ExportedData, ExportedFile, ExportFormat, ExportProgressEvent, FilterResult, FindDirection, FindResult, FindType, FormatOptions, GroupByResult, PositronDataExplorerComm, RowFilter, SamplingParams, SamplingResult, SchemaUpdateEvent, SupportedFeatures, SupportStatus, TableData, TableSchema } from 'vs/workbench/services/languageRuntime/common/positronDataExplorerComm';
 
 /**
  * TableSchemaSearchResult interface. This is here temporarily until searching the tabe schema
@@ -80,6 +80,11 @@ export class DataExplorerClientInstance extends Disposable {
 	 */
 	private readonly _onDidDataUpdateEmitter = this._register(new Emitter<void>());
 
+	/**
+	 * The onDidExportProgress event emitter.
+	 */
+	private readonly _onDidExportProgressEmitter = this._register(new Emitter<ExportProgressEvent>());
+
 	/**
 	 * The onDidStatusUpdate event emitter.
 	 */
@@ -146,6 +151,11 @@ export class DataExplorerClientInstance extends Disposable {
 		this._register(this._positronDataExplorerComm.onDidDataUpdate(() => {
 			this._onDidDataUpdateEmitter.fire();
 		}));
+
+		// Register the onDidExportProgress event handler.
+		this._register(this._positronDataExplorerComm.onDidExportProgress((e: ExportProgressEvent) => {
+			this._onDidExportProgressEmitter.fire(e);
+		}));
 	}
 
 	override dispose(): void {
@@ -346,6 +356,31 @@ export class DataExplorerClientInstance extends Disposable {
 		);
 	}
 
+	/**
+	 * Export data selection to a file
+	 *
+	 * Export data selection to a file in different formats. Progress is
+	 * reported through onDidExportProgress while the file is written.
+	 *
+	 * @param selection The data selection
+	 * @param format Exported file format
+	 * @param path Path of the file to write
+	 *
+	 * @returns Result of exporting to a file
+	 */
+	async exportDataSelectionToFile(selection: DataSelection, format: ExportFormat, path: string): Promise<ExportedFile> {
+		return this.runBackendTask(
+			() => this._positronDataExplorerComm.exportDataSelectionToFile(selection, format, path),
+			() => {
+				return {
+					path,
+					num_rows: 0,
+					num_bytes: 0
+				};
+			}
+		);
+	}
+
 	/**
 	 * Sets row filters.
 	 * @param rowFilters The row filters.
@@ -372,6 +407,71 @@ export class DataExplorerClientInstance extends Disposable {
 		);
 	}
 
+	/**
+	 * Set or clear a grouped view.
+	 * @param groupBy Indices of the columns to group by. Clears any existing grouping if empty.
+	 * @param aggregations Aggregations to compute for each group.
+	 * @returns The number of groups.
+	 */
+	async setGroupBy(groupBy: Array<number>, aggregations: Array<ColumnAggregation>): Promise<GroupByResult> {
+		return this.runBackendTask(
+			() => this._positronDataExplorerComm.setGroupBy(groupBy, aggregations),
+			() => ({ num_groups: 0 })
+		);
+	}
+
+	/**
+	 * Set or clear a sampling view mode.
+	 * @param sampling The sampling mode to apply.
+	 * @returns The number of rows now being served.
+	 */
+	async setSampling(sampling: SamplingParams): Promise<SamplingResult> {
+		return this.runBackendTask(
+			() => this._positronDataExplorerComm.setSampling(sampling),
+			() => ({ num_rows: 0 })
+		);
+	}
+
+	/**
+	 * Finds the next or previous occurrence of a value in the current view.
+	 * @param term The value or pattern to search for.
+	 * @param findType How values are matched against the term.
+	 * @param caseSensitive Whether text matching is case sensitive.
+	 * @param columnIndices The columns to search, or all columns if empty.
+	 * @param startIndex The view row index to start searching from.
+	 * @param direction The direction to search in.
+	 * @param wrap Whether to continue searching from the other end of the view.
+	 * @returns The location of the match, if any.
+	 */
+	async find(
+		term: string,
+		findType: FindType,
+		caseSensitive: boolean,
+		columnIndices: Array<number>,
+		startIndex: number,
+		direction: FindDirection,
+		wrap: boolean
+	): Promise<FindResult> {
+		return this.runBackendTask(
+			() => this._positronDataExplorerComm.find(
+				term, findType, caseSensitive, columnIndices, startIndex, direction, wrap
+			),
+			() => ({ found: false })
+		);
+	}
+
+	/**
+	 * Runs several requests in a single round trip.
+	 * @param requests The requests to run, in order.
+	 * @returns The response to each request, in order.
+	 */
+	async batch(requests: Array<BatchItem>): Promise<Array<BatchItemResponse>> {
+		return this.runBackendTask(
+			() => this._positronDataExplorerComm.batch(requests),
+			() => []
+		);
+	}
+
 	getSupportedFeatures(): SupportedFeatures {
 		if (this.cachedBackendState === undefined) {
 			// Until the backend state is available, we disable features.
@@ -447,6 +547,11 @@ export class DataExplorerClientInstance extends Disposable {
 	 */
 	onDidDataUpdate = this._onDidDataUpdateEmitter.event;
 
+	/**
+	 * Event that fires when a file export has made progress.
+	 */
+	onDidExportProgress = this._onDidExportProgressEmitter.event;
+
 	/**
 	 * Event that fires when the status has been updated.
 	 */
@@ -7,7 +7,17 @@ import { Emitter } from 'vs/base/common/event';
 import { Disposable } from 'vs/base/common/lifecycle';
 import { ISettableObservable } from 'vs/base/common/observableInternal/base';
 import { IRuntimeClientInstance, RuntimeClientState } from 'vs/workbench/services/languageRuntime/common/languageRuntimeClientInstance';
-import { ClipboardFormatFormat, PositronVariablesComm, RefreshEvent, UpdateEvent, Variable } from 'vs/workbench/services/languageRuntime/common/positronVariablesComm';
+import { ClipboardFormatFormat, PositronVariablesComm, RefreshEvent, UpdateEvent, Variable, VariableSortOrder } from 'vs/workbench/services/languageRuntime/common/positronVariablesComm';
+
+/**
+ * The default maximum number of variables to request in a list.
+ */
+const DEFAULT_MAX_VARIABLES = 10000;
+
+/**
+ * The default maximum number of children to request when inspecting a variable.
+ */
+const DEFAULT_MAX_CHILDREN = 100;
 
 /**
  * Represents a variable in a language runtime; wraps the raw data format with additional metadata
@@ -47,12 +57,21 @@ export class PositronVariable {
 	/**
 	 * Gets the children of this variable, if any.
 	 *
+	 * @param startIndex The index of the first child to get.
+	 * @param maxResults The maximum number of children to get.
+	 * @param searchTerm Only get children whose names contain this term.
+	 * @param sortOrder The order of the children.
 	 * @returns A promise that resolves to the list of children.
 	 */
-	async getChildren(): Promise<PositronVariablesList> {
+	async getChildren(
+		startIndex = 0,
+		maxResults = DEFAULT_MAX_CHILDREN,
+		searchTerm = '',
+		sortOrder = VariableSortOrder.Default
+	): Promise<PositronVariablesList> {
 		if (this.data.has_children) {
 			const path = this.parentKeys.concat(this.data.access_key);
-			const result = await this._comm.inspect(path);
+			const result = await this._comm.inspect(path, startIndex, maxResults, searchTerm, sortOrder);
 			return new PositronVariablesList(result.children, path, this._comm);
 		} else {
 			throw new Error(`Attempt to retrieve children of ` +
@@ -161,9 +180,19 @@ export class VariablesClientInstance extends Disposable {
 
 	/**
 	 * Requests that the variables client send a new list of variables.
+	 *
+	 * @param startIndex The index of the first variable to list
+	 * @param maxResults The maximum number of variables to list
+	 * @param searchTerm Only list variables whose names contain this term
+	 * @param sortOrder The order of the variables
 	 */
-	public async requestRefresh(): Promise<PositronVariablesList> {
-		const list = await this._comm.list();
+	public async requestRefresh(
+		startIndex = 0,
+		maxResults = DEFAULT_MAX_VARIABLES,
+		searchTerm = '',
+		sortOrder = VariableSortOrder.Default
+	): Promise<PositronVariablesList> {
+		const list = await this._comm.list(startIndex, maxResults, searchTerm, sortOrder);
 		return new PositronVariablesList(list.variables, [], this._comm);
 	}
 
@@ -178,10 +207,20 @@ export class VariablesClientInstance extends Disposable {
 	 * Requests that the variables client inspect the specified variable.
 	 *
 	 * @param path The path to the variable to inspect, as an array of access key values
+	 * @param startIndex The index of the first child to get
+	 * @param maxResults The maximum number of children to get
+	 * @param searchTerm Only get children whose names contain this term
+	 * @param sortOrder The order of the children
 	 * @returns The variable's children
 	 */
-	public async requestInspect(path: string[]): Promise<PositronVariablesList> {
-		const list = await this._comm.inspect(path);
+	public async requestInspect(
+		path: string[],
+		startIndex = 0,
+		maxResults = DEFAULT_MAX_CHILDREN,
+		searchTerm = '',
+		sortOrder = VariableSortOrder.Default
+	): Promise<PositronVariablesList> {
+		const list = await this._comm.inspect(path, startIndex, maxResults, searchTerm, sortOrder);
 		return new PositronVariablesList(list.children, path, this._comm);
 	}
 
@@ -222,6 +261,15 @@ export class VariablesClientInstance extends Disposable {
 		await this._comm.view(path);
 	}
 
+	/**
+	 * Informs the variables client whether the variables pane is visible.
+	 *
+	 * @param visible Whether the variables pane is visible
+	 */
+	public async requestSetVisibility(visible: boolean) {
+		await this._comm.setVisibility(visible);
+	}
+
 	// Private methods -------------------------------------------------
 
 	/**
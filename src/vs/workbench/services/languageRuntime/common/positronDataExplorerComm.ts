@@ -27,6 +27,27 @@ export interface SearchSchemaResult {
 
 }
 
+/**
+ * The location of a found value
+ */
+export interface FindResult {
+	/**
+	 * Whether a match was found
+	 */
+	found: boolean;
+
+	/**
+	 * View row index of the match
+	 */
+	row_index?: number;
+
+	/**
+	 * Column index of the match
+	 */
+	column_index?: number;
+
+}
+
 /**
  * Exported result
  */
@@ -43,6 +64,27 @@ export interface ExportedData {
 
 }
 
+/**
+ * Result of exporting to a file
+ */
+export interface ExportedFile {
+	/**
+	 * Absolute path of the written file
+	 */
+	path: string;
+
+	/**
+	 * Number of rows written
+	 */
+	num_rows: number;
+
+	/**
+	 * Size of the written file in bytes
+	 */
+	num_bytes: number;
+
+}
+
 /**
  * The result of applying filters to a table
  */
@@ -59,6 +101,29 @@ export interface FilterResult {
 
 }
 
+/**
+ * The result of grouping the table
+ */
+export interface GroupByResult {
+	/**
+	 * Number of groups (rows) in the grouped table
+	 */
+	num_groups: number;
+
+}
+
+/**
+ * The result of setting the sampling mode
+ */
+export interface SamplingResult {
+	/**
+	 * Number of rows that the grid, filters, sorts and profiles are computed
+	 * on
+	 */
+	num_rows: number;
+
+}
+
 /**
  * The current backend state for the data explorer
  */
@@ -93,6 +158,16 @@ export interface BackendState {
 	 */
 	supported_features: SupportedFeatures;
 
+	/**
+	 * The grouping currently applied, if any
+	 */
+	group_by?: GroupBySpec;
+
+	/**
+	 * Set when the table is being served from a sample rather than in full
+	 */
+	sampling?: SamplingState;
+
 }
 
 /**
@@ -676,6 +751,91 @@ export interface ColumnSortKey {
 
 }
 
+/**
+ * An aggregation to compute over a column for each group
+ */
+export interface ColumnAggregation {
+	/**
+	 * Column index to aggregate
+	 */
+	column_index: number;
+
+	/**
+	 * Aggregation function
+	 */
+	function: AggregationFunction;
+
+}
+
+/**
+ * Group keys and aggregations of a grouped view
+ */
+export interface GroupBySpec {
+	/**
+	 * Indices of the columns grouped by
+	 */
+	group_by: Array<number>;
+
+	/**
+	 * Aggregations computed for each group
+	 */
+	aggregations: Array<ColumnAggregation>;
+
+}
+
+/**
+ * Parameters for sampling a table
+ */
+export interface SamplingParams {
+	/**
+	 * How to sample the table
+	 */
+	method: SamplingMethod;
+
+	/**
+	 * Target number of rows in the sample. Defaults to a backend-defined
+	 * size
+	 */
+	num_rows?: number;
+
+	/**
+	 * For stratified sampling, the column whose values define the strata
+	 */
+	column_index?: number;
+
+	/**
+	 * Seed for random sampling, for reproducible samples
+	 */
+	seed?: number;
+
+}
+
+/**
+ * The sampling currently applied to a table
+ */
+export interface SamplingState {
+	/**
+	 * How the table was sampled
+	 */
+	method: SamplingMethod;
+
+	/**
+	 * Number of rows in the sample
+	 */
+	num_rows: number;
+
+	/**
+	 * Number of rows in the full table
+	 */
+	unsampled_num_rows: number;
+
+	/**
+	 * For stratified samples, the column whose values define the strata
+	 */
+	column_index?: number;
+
+}
+
 /**
  * For each field, returns flags indicating supported features
  */
@@ -705,6 +865,21 @@ export interface SupportedFeatures {
 	 */
 	export_data_selection: ExportDataSelectionFeatures;
 
+	/**
+	 * Support for 'set_group_by' RPC and its features
+	 */
+	set_group_by?: SetGroupByFeatures;
+
+	/**
+	 * Support for 'set_sampling' RPC and its features
+	 */
+	set_sampling?: SetSamplingFeatures;
+
+	/**
+	 * Support for 'find' RPC and its features
+	 */
+	find?: FindFeatures;
+
 }
 
 /**
@@ -718,6 +893,17 @@ export interface SearchSchemaFeatures {
 
 }
 
+/**
+ * Feature flags for 'find' RPC
+ */
+export interface FindFeatures {
+	/**
+	 * The support status for this RPC method
+	 */
+	support_status: SupportStatus;
+
+}
+
 /**
  * Feature flags for 'set_row_filters' RPC
  */
@@ -756,7 +942,8 @@ export interface GetColumnProfilesFeatures {
 }
 
 /**
- * Feature flags for 'export_data_selction' RPC
+ * Feature flags for 'export_data_selection' and
+ * 'export_data_selection_to_file' RPCs
  */
 export interface ExportDataSelectionFeatures {
 	/**
@@ -764,6 +951,11 @@ export interface ExportDataSelectionFeatures {
 	 */
 	support_status: SupportStatus;
 
+	/**
+	 * Export formats supported by the backend
+	 */
+	supported_formats?: Array<ExportFormat>;
+
 }
 
 /**
@@ -777,6 +969,38 @@ export interface SetSortColumnsFeatures {
 
 }
 
+/**
+ * Feature flags for 'set_group_by' RPC
+ */
+export interface SetGroupByFeatures {
+	/**
+	 * The support status for this RPC method
+	 */
+	support_status: SupportStatus;
+
+	/**
+	 * Aggregation functions supported by the backend
+	 */
+	supported_functions?: Array<AggregationFunction>;
+
+}
+
+/**
+ * Feature flags for 'set_sampling' RPC
+ */
+export interface SetSamplingFeatures {
+	/**
+	 * The support status for this RPC method
+	 */
+	support_status: SupportStatus;
+
+	/**
+	 * Sampling methods supported by the backend
+	 */
+	supported_methods?: Array<SamplingMethod>;
+
+}
+
 /**
  * A selection on the data grid, for copying to the clipboard or other
  * actions
@@ -863,6 +1087,69 @@ export interface DataSelectionIndices {
 
 }
 
+/**
+ * A request run as part of a batch
+ */
+export interface BatchItem {
+	/**
+	 * The JSON-RPC method name
+	 */
+	method: string;
+
+	/**
+	 * The parameters for the method
+	 */
+	params: BatchItemParams;
+
+}
+
+/**
+ * The parameters for the method
+ */
+export interface BatchItemParams {
+	[k: string]: unknown;
+}
+
+/**
+ * The response to a request run as part of a batch, with either a result
+ * or an error
+ */
+export interface BatchItemResponse {
+	/**
+	 * The result of the request
+	 */
+	result?: BatchItemResult;
+
+	/**
+	 * The error if the request failed
+	 */
+	error?: BatchItemError;
+
+}
+
+/**
+ * The result of the request
+ */
+export interface BatchItemResult {
+	[k: string]: unknown;
+}
+
+/**
+ * An error from a request run as part of a batch
+ */
+export interface BatchItemError {
+	/**
+	 * The JSON-RPC error code
+	 */
+	code: number;
+
+	/**
+	 * The error message
+	 */
+	message: string;
+
+}
+
 /// ColumnValue
 export type ColumnValue = number | string;
 
@@ -932,6 +1219,25 @@ export enum SearchFilterType {
 	RegexMatch = 'regex_match'
 }
 
+/**
+ * Possible values for FindType
+ */
+export enum FindType {
+	Equals = 'equals',
+	Contains = 'contains',
+	StartsWith = 'starts_with',
+	EndsWith = 'ends_with',
+	RegexMatch = 'regex_match'
+}
+
+/**
+ * Possible values for FindDirection
+ */
+export enum FindDirection {
+	Next = 'next',
+	Previous = 'previous'
+}
+
 /**
  * Possible values for ColumnProfileType
  */
@@ -942,6 +1248,30 @@ export enum ColumnProfileType {
 	Histogram = 'histogram'
 }
 
+/**
+ * Possible values for AggregationFunction
+ */
+export enum AggregationFunction {
+	Count = 'count',
+	Sum = 'sum',
+	Mean = 'mean',
+	Median = 'median',
+	Min = 'min',
+	Max = 'max',
+	Stdev = 'stdev',
+	NumUnique = 'num_unique'
+}
+
+/**
+ * Possible values for SamplingMethod
+ */
+export enum SamplingMethod {
+	Full = 'full',
+	Head = 'head',
+	Uniform = 'uniform',
+	Stratified = 'stratified'
+}
+
 /**
  * Possible values for Kind in DataSelection
  */
@@ -960,7 +1290,9 @@ export enum DataSelectionKind {
 export enum ExportFormat {
 	Csv = 'csv',
 	Tsv = 'tsv',
-	Html = 'html'
+	Html = 'html',
+	Parquet = 'parquet',
+	ArrowIpc = 'arrow_ipc'
 }
 
 /**
@@ -984,20 +1316,47 @@ export interface SchemaUpdateEvent {
 export interface DataUpdateEvent {
 }
 
+/**
+ * Event: Progress of a file export
+ */
+export interface ExportProgressEvent {
+	/**
+	 * Path of the file being written
+	 */
+	path: string;
+
+	/**
+	 * Number of rows written so far
+	 */
+	rows_written: number;
+
+	/**
+	 * Total number of rows being exported
+	 */
+	total_rows: number;
+
+}
+
 export enum DataExplorerFrontendEvent {
 	SchemaUpdate = 'schema_update',
-	DataUpdate = 'data_update'
+	DataUpdate = 'data_update',
+	ExportProgress = 'export_progress'
 }
 
 export enum DataExplorerBackendRequest {
 	GetSchema = 'get_schema',
 	SearchSchema = 'search_schema',
 	GetDataValues = 'get_data_values',
+	Find = 'find',
 	ExportDataSelection = 'export_data_selection',
+	ExportDataSelectionToFile = 'export_data_selection_to_file',
 	SetRowFilters = 'set_row_filters',
 	SetSortColumns = 'set_sort_columns',
+	SetGroupBy = 'set_group_by',
+	SetSampling = 'set_sampling',
 	GetColumnProfiles = 'get_column_profiles',
-	GetState = 'get_state'
+	GetState = 'get_state',
+	Batch = 'batch'
 }
 
 export class PositronDataExplorerComm extends PositronBaseComm {
@@ -1008,6 +1367,7 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		super(instance, options);
 		this.onDidSchemaUpdate = super.createEventEmitter('schema_update', []);
 		this.onDidDataUpdate = super.createEventEmitter('data_update', []);
+		this.onDidExportProgress = super.createEventEmitter('export_progress', ['path', 'rows_written', 'total_rows']);
 	}
 
 	/**
@@ -1060,6 +1420,29 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		return super.performRpc('get_data_values', ['row_start_index', 'num_rows', 'column_indices', 'format_options'], [rowStartIndex, numRows, columnIndices, formatOptions]);
 	}
 
+	/**
+	 * Find the next or previous occurrence of a value
+	 *
+	 * Search one or more columns for a value, starting from a row of the
+	 * current (filtered and sorted) view and moving in the given direction,
+	 * stopping at the first match
+	 *
+	 * @param term The value or pattern to search for
+	 * @param findType How values are matched against the term
+	 * @param caseSensitive Whether text matching is case sensitive
+	 * @param columnIndices Columns to search, in order of precedence for
+	 * matches in the same row. Searches all columns if empty
+	 * @param startIndex View row index to start searching from, inclusive
+	 * @param direction Direction to search in
+	 * @param wrap Whether to continue searching from the other end of the
+	 * view
+	 *
+	 * @returns The location of a found value
+	 */
+	find(term: string, findType: FindType, caseSensitive: boolean, columnIndices: Array<number>, startIndex: number, direction: FindDirection, wrap: boolean): Promise<FindResult> {
+		return super.performRpc('find', ['term', 'find_type', 'case_sensitive', 'column_indices', 'start_index', 'direction', 'wrap'], [term, findType, caseSensitive, columnIndices, startIndex, direction, wrap]);
+	}
+
 	/**
 	 * Export data selection as a string in different formats
 	 *
@@ -1075,6 +1458,22 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		return super.performRpc('export_data_selection', ['selection', 'format'], [selection, format]);
 	}
 
+	/**
+	 * Export data selection to a file
+	 *
+	 * Export data selection to a file in different formats, writing the
+	 * selection in row chunks and emitting export_progress events as it goes
+	 *
+	 * @param selection The data selection
+	 * @param format Exported file format
+	 * @param path Path of the file to write
+	 *
+	 * @returns Result of exporting to a file
+	 */
+	exportDataSelectionToFile(selection: DataSelection, format: ExportFormat, path: string): Promise<ExportedFile> {
+		return super.performRpc('export_data_selection_to_file', ['selection', 'format', 'path'], [selection, format, path]);
+	}
+
 	/**
 	 * Set row filters based on column values
 	 *
@@ -1102,6 +1501,41 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		return super.performRpc('set_sort_columns', ['sort_keys'], [sortKeys]);
 	}
 
+	/**
+	 * Set or clear a grouped view
+	 *
+	 * Group the filtered rows by one or more columns and compute
+	 * aggregations for each group. While set, the schema, data values,
+	 * profiles, sorting and exports are served from the grouped table. Pass
+	 * no group keys to return to the ungrouped view
+	 *
+	 * @param groupBy Indices of the columns to group by. Clears any existing
+	 * grouping if empty
+	 * @param aggregations Aggregations to compute for each group, in
+	 * addition to the number of rows in each group
+	 *
+	 * @returns The result of grouping the table
+	 */
+	setGroupBy(groupBy: Array<number>, aggregations: Array<ColumnAggregation>): Promise<GroupByResult> {
+		return super.performRpc('set_group_by', ['group_by', 'aggregations'], [groupBy, aggregations]);
+	}
+
+	/**
+	 * Set or clear a sampling view mode
+	 *
+	 * Serve the grid, filters, sorts and profiles from a fixed-size sample
+	 * of the table so that huge tables can be explored immediately. Filters
+	 * and sort keys are kept and re-evaluated on the sample. Pass the 'full'
+	 * method to return to computing on the full table
+	 *
+	 * @param sampling The sampling mode to apply
+	 *
+	 * @returns The result of setting the sampling mode
+	 */
+	setSampling(sampling: SamplingParams): Promise<SamplingResult> {
+		return super.performRpc('set_sampling', ['sampling'], [sampling]);
+	}
+
 	/**
 	 * Request a batch of column profiles
 	 *
@@ -1130,6 +1564,21 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		return super.performRpc('get_state', [], []);
 	}
 
+	/**
+	 * Run several requests at once
+	 *
+	 * Run several data explorer requests in order and return all of their
+	 * results in a single response, sharing work like recomputing the view
+	 * between them
+	 *
+	 * @param requests The requests to run, in order
+	 *
+	 * @returns The response to each request, in order
+	 */
+	batch(requests: Array<BatchItem>): Promise<Array<BatchItemResponse>> {
+		return super.performRpc('batch', ['requests'], [requests]);
+	}
+
 
 	/**
 	 * Request to sync after a schema change
@@ -1144,5 +1593,12 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 	 * and triggering a refresh/redraw.
 	 */
 	onDidDataUpdate: Event<DataUpdateEvent>;
+	/**
+	 * Progress of a file export
+	 *
+	 * Notify the frontend of the progress of an
+	 * export_data_selection_to_file request.
+	 */
+	onDidExportProgress: Event<ExportProgressEvent>;
 }
 
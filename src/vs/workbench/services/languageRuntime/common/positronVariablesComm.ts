@@ -21,9 +21,9 @@ export interface VariableList {
 	variables: Array<Variable>;
 
 	/**
-	 * The total number of variables in the session. This may be greater than
-	 * the number of variables in the 'variables' array if the array is
-	 * truncated.
+	 * The total number of variables in the session matching the search term.
+	 * This may be greater than the number of variables in the 'variables'
+	 * array if the array is truncated.
 	 */
 	length: number;
 
@@ -44,8 +44,9 @@ export interface InspectedVariable {
 	children: Array<Variable>;
 
 	/**
-	 * The total number of children. This may be greater than the number of
-	 * children in the 'children' array if the array is truncated.
+	 * The total number of children matching the search term. This may be
+	 * greater than the number of children in the 'children' array if the
+	 * array is truncated.
 	 */
 	length: number;
 
@@ -161,6 +162,15 @@ export enum VariableKind {
 	Connection = 'connection'
 }
 
+/**
+ * Possible values for VariableSortOrder
+ */
+export enum VariableSortOrder {
+	Default = 'default',
+	Name = 'name',
+	Size = 'size'
+}
+
 /**
  * Event: Update variables
  */
@@ -221,7 +231,8 @@ export enum VariablesBackendRequest {
 	Delete = 'delete',
 	Inspect = 'inspect',
 	ClipboardFormat = 'clipboard_format',
-	View = 'view'
+	View = 'view',
+	SetVisibility = 'set_visibility'
 }
 
 export class PositronVariablesComm extends PositronBaseComm {
@@ -235,15 +246,23 @@ export class PositronVariablesComm extends PositronBaseComm {
 	}
 
 	/**
-	 * List all variables
+	 * List variables
 	 *
-	 * Returns a list of all the variables in the current session.
+	 * Returns a page of the variables in the current session.
 	 *
+	 * @param startIndex Index (starting from zero) of the first variable to
+	 * return
+	 * @param maxResults Maximum number of variables to return from the start
+	 * index
+	 * @param searchTerm Only return variables whose display names contain
+	 * this substring (case insensitive). An empty string matches all
+	 * variables.
+	 * @param sortOrder The order in which to return variables
 	 *
 	 * @returns A view containing a list of variables in the session.
 	 */
-	list(): Promise<VariableList> {
-		return super.performRpc('list', [], []);
+	list(startIndex: number, maxResults: number, searchTerm: string, sortOrder: VariableSortOrder): Promise<VariableList> {
+		return super.performRpc('list', ['start_index', 'max_results', 'search_term', 'sort_order'], [startIndex, maxResults, searchTerm, sortOrder]);
 	}
 
 	/**
@@ -275,15 +294,24 @@ export class PositronVariablesComm extends PositronBaseComm {
 	/**
 	 * Inspect a variable
 	 *
-	 * Returns the children of a variable, as an array of variables.
+	 * Returns a page of the children of a variable, as an array of
+	 * variables.
 	 *
 	 * @param path The path to the variable to inspect, as an array of access
 	 * keys.
+	 * @param startIndex Index (starting from zero) of the first child to
+	 * return
+	 * @param maxResults Maximum number of children to return from the start
+	 * index
+	 * @param searchTerm Only return children whose display names contain
+	 * this substring (case insensitive). An empty string matches all
+	 * children.
+	 * @param sortOrder The order in which to return children
 	 *
 	 * @returns An inspected variable.
 	 */
-	inspect(path: Array<string>): Promise<InspectedVariable> {
-		return super.performRpc('inspect', ['path'], [path]);
+	inspect(path: Array<string>, startIndex: number, maxResults: number, searchTerm: string, sortOrder: VariableSortOrder): Promise<InspectedVariable> {
+		return super.performRpc('inspect', ['path', 'start_index', 'max_results', 'search_term', 'sort_order'], [path, startIndex, maxResults, searchTerm, sortOrder]);
 	}
 
 	/**
@@ -317,6 +345,20 @@ export class PositronVariablesComm extends PositronBaseComm {
 		return super.performRpc('view', ['path'], [path]);
 	}
 
+	/**
+	 * Set the visibility of the variables pane
+	 *
+	 * Informs the runtime whether the variables pane is visible. While it is
+	 * hidden, the runtime may skip detecting changes to variables, and sends
+	 * a refresh event when the pane becomes visible again.
+	 *
+	 * @param visible Whether the variables pane is visible
+	 *
+	 */
+	setVisibility(visible: boolean): Promise<void> {
+		return super.performRpc('set_visibility', ['visible'], [visible]);
+	}
+
 
 	/**
 	 * Update variables
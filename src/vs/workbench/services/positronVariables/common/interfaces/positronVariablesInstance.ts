@@ -157,4 +157,11 @@ export interface IPositronVariablesInstance {
 	 * Focuses element in the variable tree.
 	 */
 	focusElement(): void;
+
+	/**
+	 * Sets whether the variables are visible, so that the runtime can skip detecting changes to
+	 * variables while they are hidden.
+	 * @param visible A value which indicates whether the variables are visible.
+	 */
+	setVisible(visible: boolean): void;
 }
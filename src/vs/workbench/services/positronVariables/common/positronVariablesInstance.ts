@@ -97,6 +97,11 @@ export class PositronVariablesInstance extends Disposable implements IPositronVa
 	 */
 	private _variablesClient?: VariablesClientInstance;
 
+	/**
+	 * Gets or sets a value which indicates whether the variables are visible.
+	 */
+	private _visible = true;
+
 	/**
 	 * The onDidChangeEntries event emitter.
 	 */
@@ -304,6 +309,19 @@ export class PositronVariablesInstance extends Disposable implements IPositronVa
 		}
 	}
 
+	/**
+	 * Sets whether the variables are visible.
+	 * @param visible A value which indicates whether the variables are visible.
+	 */
+	setVisible(visible: boolean) {
+		if (visible === this._visible) {
+			return;
+		}
+
+		this._visible = visible;
+		this.sendVisibility();
+	}
+
 	/**
 	 * Expands a variable group.
 	 * @param id The identifier of the variable group to expand.
@@ -467,6 +485,20 @@ export class PositronVariablesInstance extends Disposable implements IPositronVa
 		this._runtimeDisposableStore = new DisposableStore();
 	}
 
+	/**
+	 * Sends the visibility of the variables to the runtime client.
+	 */
+	private async sendVisibility() {
+		if (this._variablesClient) {
+			try {
+				await this._variablesClient.requestSetVisibility(this._visible);
+			} catch (e) {
+				// Older runtimes don't support this request, which is fine.
+				this._logService.debug(`Error setting variables visibility: ${e}`);
+			}
+		}
+	}
+
 	/**
 	 * Creates the runtime client.
 	 */
@@ -508,6 +540,11 @@ export class PositronVariablesInstance extends Disposable implements IPositronVa
 
 			// Add the runtime client to the runtime disposable store.
 			this._runtimeDisposableStore.add(this._variablesClient);
+
+			// The runtime assumes that the variables are visible.
+			if (!this._visible) {
+				this.sendVisibility();
+			}
 		} catch (error) {
 			this._logService.error(error);
 		}